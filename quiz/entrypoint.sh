@@ -34,5 +34,11 @@ exec_sql './testdata/quiz_user_insdata.sql'
 exec_sql './testdata/quiz_group_insdata.sql'
 exec_sql './testdata/quiz_question_insdata.sql'
 
+# SQLで登録したユーザはsignalsを通らず成績集計(UserScore)が無いため、ランキング・順位に載るよう作り直す
+python manage.py rebuild_user_scores
+
 # サーバ起動
-python
\ No newline at end of file
+# 複数ワーカーの計測値を合算するため共通のディレクトリに書き出す
+export METRICS_DIR=${METRICS_DIR:-/tmp/quiz_metrics}
+rm -rf ${METRICS_DIR}
+exec python manage.py serve --port 8000
@@ -64,6 +64,8 @@ JWT_AUTH = {
 }
 
 MIDDLEWARE = [
+    'quiz.middleware.MetricsMiddleware',
+    'quiz.middleware.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -111,6 +113,50 @@ DATABASES = {
     }
 }
 
+# DB_ENGINE=sqlite の場合はSQLiteを使う(ローカルでのデータ生成・ベンチマーク用)
+if os.environ.get('DB_ENGINE') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', os.path.join(BASE_DIR, 'db.sqlite3')),
+        }
+    }
+
+# 永続接続を保持する秒数(0の場合はリクエストごとに接続し直す)
+DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+
+# DB_POOL_SIZEを指定すると、プロセス内のスレッドで共有する上限付きの接続プールを使う
+# (スレッド数より少ない接続数に抑える場合)。プールへの返却はリクエスト終了時に行うためCONN_MAX_AGEは0にする
+if int(os.environ.get('DB_POOL_SIZE', 0)):
+    DATABASES['default'].update({
+        'ENGINE': {
+            'django.db.backends.mysql': 'quiz.backends.mysql_pool',
+            'django.db.backends.sqlite3': 'quiz.backends.sqlite3_pool',
+        }[DATABASES['default']['ENGINE']],
+        'CONN_MAX_AGE': 0,
+        'POOL_SIZE': int(os.environ['DB_POOL_SIZE']),
+        'POOL_TIMEOUT': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        'POOL_CHECK_IDLE': float(os.environ.get('DB_HEALTH_CHECK_IDLE', 5)),
+    })
+
+# 読み取り専用のレプリカ。DB_REPLICASにカンマ区切りでホスト名(SQLiteの場合はファイル名)を指定する
+# テスト時はプライマリのミラーとして扱う
+REPLICA_DATABASES = list()
+for i, replica in enumerate(filter(None, os.environ.get('DB_REPLICAS', '').split(','))):
+    alias = 'replica{}'.format(i + 1)
+    key = 'NAME' if 'sqlite3' in DATABASES['default']['ENGINE'] else 'HOST'
+    DATABASES[alias] = dict(DATABASES['default'], **{key: replica, 'TEST': {'MIRROR': 'default'}})
+    REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ['quiz.routers.ReplicaRouter']
+
+# 書き込み後にプライマリから読む秒数(read-your-writes)と、レプリカの遅延を確認し直す間隔
+REPLICA_PIN_SECONDS = 30
+REPLICA_LAG_CHECK_INTERVAL = 1
+
+# 永続接続をこの秒数以上使っていない場合、リクエストの処理前にpingで確認する
+DB_HEALTH_CHECK_IDLE = float(os.environ.get('DB_HEALTH_CHECK_IDLE', 5))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
@@ -151,3 +197,34 @@ USE_TZ = True
 STATIC_URL = '/static/'
 
 STATIC_ROOT = os.path.join(BASE_DIR, 'static')
+
+# 問題IDプール(quiz.caches.QuestionPool)の保持秒数。他プロセスでの問題登録はこの秒数以内に反映される
+QUESTION_POOL_TIMEOUT = 60
+
+# 回答登録時に参照する正解(quiz.caches.AnswerKeyCache)と、存在確認済みのユーザ・グループの保持件数
+ANSWER_KEY_CACHE_SIZE = 10000
+KNOWN_KEY_CACHE_SIZE = 10000
+# 上記のキャッシュが他プロセスでの問題の更新・ユーザとグループの削除を確認する間隔(秒)
+KEY_CACHE_CHECK_INTERVAL = 2
+
+# ランキングのETagに回答による変化を反映する間隔(秒)。回答登録でランキングの更新回数を加算しないため
+RANKING_ETAG_SECONDS = 5
+
+# レーティング(quiz.ratings)の1回答あたりの変化の大きさ(Elo)
+RATING_K = 32
+# 問題のレーティングに反映する回答の猶予(秒)。update_question_ratingsはこの秒数より前の回答までを反映する
+QUESTION_RATING_LAG = 60
+
+# /api/metrics の集計値を書き出すディレクトリ。複数ワーカーで動かす場合は共通のディレクトリを指定する
+METRICS_DIR = os.environ.get('METRICS_DIR')
+METRICS_FLUSH_INTERVAL = 5
+
+# 一括登録(/api/import/<kind>)に必要なトークン(Authorization: Token <ADMIN_TOKEN>)。未設定の場合は利用できない
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+# この日数より前の回答は manage.py archive_answers でアーカイブ(quiz.models.ArchivedAnswer)に移す
+ANSWER_ARCHIVE_DAYS = int(os.environ.get('ANSWER_ARCHIVE_DAYS', 365))
+
+# manage.py serve のワーカープロセス数とワーカーごとのスレッド数
+SERVE_WORKERS = int(os.environ.get('SERVE_WORKERS', 2))
+SERVE_THREADS = int(os.environ.get('SERVE_THREADS', 4))
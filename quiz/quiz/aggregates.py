@@ -0,0 +1,196 @@
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, ExpressionWrapper, F, FloatField, IntegerField, Max, Sum, Value
+from django.db.models.functions import Cast, Greatest
+from django.utils import timezone
+
+from .bitmaps import QuestionBitmap
+from .buckets import add_score_bucket, hour_start
+from .caches import answer_keys
+from .models import AnsweredQuestions, Answer, ArchivedAnswer, ChallengeRollup, User, UserScore
+from .ratings import initial_user_rating, user_rating_increment
+from .versions import RANKING, bump
+
+# IN句の要素数の上限(SQLiteは999)を超えない件数。bulk_createの件数はバックエンドの上限に合わせてDjangoが分ける
+REBUILD_BATCH_SIZE = 500
+# 許容する正答率の誤差(浮動小数点の演算順による差を不整合としない)
+RATE_TOLERANCE = 1e-9
+
+
+def record_answers(answers):
+    """登録された回答をユーザごとの成績集計・時間帯ごとのバケット・正解済みの問題・レーティングに反映する
+
+    問題のレーティングは回答ごとに更新せず、quiz.ratings.update_question_ratingsでまとめて反映する。
+    """
+    keys = answer_keys.get_many({answer.question_id for answer in answers if not answer.is_deleted})
+    counts = defaultdict(lambda: [0, 0, 0])
+    results = defaultdict(list)
+    corrects = defaultdict(set)
+    buckets = defaultdict(lambda: [0, 0])
+    for answer in answers:
+        if answer.is_deleted:
+            continue
+        bucket = buckets[(answer.user_id, hour_start(answer.create_date))]
+        bucket[0] += 1
+        bucket[1] += 1 if answer.is_correct else 0
+        counts[answer.user_id][0] += 1
+        counts[answer.user_id][1] += 1 if answer.is_correct else 0
+        counts[answer.user_id][2] = max(counts[answer.user_id][2], answer.challenge_count)
+        if answer.is_correct:
+            corrects[answer.user_id].add(answer.question_id)
+        if answer.question_id in keys:
+            results[answer.user_id].append((keys[answer.question_id].rating, answer.is_correct))
+
+    for user_id, (total, correct, challenge) in counts.items():
+        _add_user_score(user_id, total, correct, results[user_id])
+        _update_user_stats(user_id, total, correct, challenge)
+    for (user_id, start), (total, correct) in buckets.items():
+        add_score_bucket(user_id, total, correct, start)
+    for user_id, question_ids in corrects.items():
+        _add_answered_questions(user_id, question_ids)
+
+
+def _add_user_score(user_id, total, correct, results):
+    updated = UserScore.objects.filter(user_id=user_id).update(**_increments(total, correct, results))
+    if updated:
+        return
+
+    try:
+        with transaction.atomic():
+            user_name = User.objects.values_list('user_name', flat=True).get(user_id=user_id)
+            UserScore.objects.create(user_id=user_id, user_name=user_name, total_count=total,
+                                     correct_answer_count=correct, correct_answer_rate=correct / total,
+                                     rating=initial_user_rating(results))
+    except IntegrityError:
+        # 同時に別リクエストが集計行を作成した場合は加算し直す
+        UserScore.objects.filter(user_id=user_id).update(**_increments(total, correct, results))
+
+
+def _increments(total, correct, results):
+    return dict(_count_increments(total, correct), rating=user_rating_increment(results), update_date=timezone.now())
+
+
+def _count_increments(total, correct):
+    # MySQLはSET句を左から順に評価するため、正答率を件数より先に更新して更新前の件数を参照させる
+    return dict(
+        correct_answer_rate=ExpressionWrapper(
+            (F('correct_answer_count') + correct) * 1.0 / (F('total_count') + total), output_field=FloatField()),
+        total_count=F('total_count') + total,
+        correct_answer_count=F('correct_answer_count') + correct,
+    )
+
+
+def _update_user_stats(user_id, total, correct, challenge):
+    # 正答率はUser自身の件数から求め、チャレンジ回数は最大値を残す(他のテーブルもUserも読まずに更新する)
+    User.objects.filter(user_id=user_id).update(
+        **_count_increments(total, correct), challenge_count=Greatest(F('challenge_count'), Value(challenge)))
+
+
+def _add_answered_questions(user_id, question_ids):
+    bitmap = QuestionBitmap()
+    for question_id in question_ids:
+        bitmap.add(question_id)
+
+    # 読み込まずにORで立てるため、同時に登録された回答のビットも失われない
+    for word, bits in bitmap.words.items():
+        if AnsweredQuestions.objects.filter(user_id=user_id, word=word).update(bits=F('bits').bitor(bits)):
+            continue
+        try:
+            with transaction.atomic():
+                AnsweredQuestions.objects.create(user_id=user_id, word=word, bits=bits)
+        except IntegrityError:
+            AnsweredQuestions.objects.filter(user_id=user_id, word=word).update(bits=F('bits').bitor(bits))
+
+
+def answered_questions(user_id):
+    """ユーザの正解済みの問題のビットマップを返す(回答が無い場合は空)"""
+    return QuestionBitmap(AnsweredQuestions.objects.filter(user_id=user_id).values_list('word', 'bits'))
+
+
+def rebuild_user_scores():
+    """回答テーブルとアーカイブの集計からユーザごとの成績集計を作り直す(回答の無いユーザも0件として作成する)"""
+    counts = _user_counts()
+
+    with transaction.atomic():
+        UserScore.objects.all().delete()
+        batch = list()
+        for user in User.objects.values('user_id', 'user_name', 'is_deleted').iterator():
+            total, correct, _ = counts.get(user['user_id'], (0, 0, 0))
+            batch.append(UserScore(user_id=user['user_id'], user_name=user['user_name'],
+                                   is_deleted=user['is_deleted'], total_count=total,
+                                   correct_answer_count=correct,
+                                   correct_answer_rate=correct / total if total else 0))
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                UserScore.objects.bulk_create(batch)
+                batch = list()
+        UserScore.objects.bulk_create(batch)
+        bump(RANKING)
+
+    return UserScore.objects.count()
+
+
+def rebuild_answered_questions():
+    """回答テーブルとアーカイブからユーザごとの正解済みの問題を作り直す"""
+    bitmaps = defaultdict(QuestionBitmap)
+    for model in (ArchivedAnswer, Answer):
+        rows = model.objects.filter(is_deleted=False, is_correct=True).values_list('user_id', 'question_id').order_by()
+        for user_id, question_id in rows.iterator():
+            bitmaps[user_id].add(question_id)
+
+    with transaction.atomic():
+        AnsweredQuestions.objects.all().delete()
+        rows = [AnsweredQuestions(user_id=user_id, word=word, bits=bits)
+                for user_id, bitmap in bitmaps.items() for word, bits in bitmap.words.items()]
+        AnsweredQuestions.objects.bulk_create(rows)
+
+    return len(bitmaps)
+
+
+def reconcile_user_stats(dry_run=False):
+    """回答テーブルとアーカイブの集計からUserの正答率・チャレンジ回数・件数を求め直し、ずれているユーザを更新して件数を返す
+
+    同じ値に直すユーザはまとめて1回のUPDATEで更新する。
+    """
+    stats = {user_id: (correct / total, challenge, total, correct)
+             for user_id, (total, correct, challenge) in _user_counts().items()}
+
+    drifted = defaultdict(list)
+    users = User.objects.values_list('user_id', 'correct_answer_rate', 'challenge_count', 'total_count',
+                                     'correct_answer_count')
+    for user_id, rate, challenge, total, correct in users.iterator():
+        expected = stats.get(user_id, (None, 0, 0, 0))
+        if (challenge, total, correct) != expected[1:] or not _same_rate(rate, expected[0]):
+            drifted[expected].append(user_id)
+
+    if not dry_run:
+        with transaction.atomic():
+            for (rate, challenge, total, correct), user_ids in drifted.items():
+                for i in range(0, len(user_ids), REBUILD_BATCH_SIZE):
+                    User.objects.filter(user_id__in=user_ids[i:i + REBUILD_BATCH_SIZE]).update(
+                        correct_answer_rate=rate, challenge_count=challenge, total_count=total,
+                        correct_answer_count=correct)
+
+    return sum(len(user_ids) for user_ids in drifted.values())
+
+
+def _user_counts():
+    """ユーザごとの(回答数, 正解数, 最大のチャレンジ回数)を、回答テーブルとアーカイブの集計を合わせて求める"""
+    counts = dict()
+    rows = Answer.objects.filter(is_deleted=False).values('user_id').annotate(
+        total=Count('answer_id'), correct=Sum(Cast('is_correct', IntegerField())),
+        challenge=Max('challenge_count')).order_by()
+    rollups = ChallengeRollup.objects.values('user_id').annotate(
+        total=Sum('total_count'), correct=Sum('correct_answer_count'), challenge=Max('challenge_count')).order_by()
+    for queryset in (rollups, rows):
+        for row in queryset.iterator():
+            total, correct, challenge = counts.get(row['user_id'], (0, 0, 0))
+            counts[row['user_id']] = (total + row['total'], correct + row['correct'],
+                                      max(challenge, row['challenge']))
+    return counts
+
+
+def _same_rate(rate, expected):
+    if rate is None or expected is None:
+        return rate is expected
+    return abs(rate - expected) <= RATE_TOLERANCE
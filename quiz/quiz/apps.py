@@ -3,3 +3,10 @@ from django.apps import AppConfig
 
 class QuizConfig(AppConfig):
     name = 'quiz'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .connections import METRICS, collect_metrics
+        from .metrics import registry
+
+        registry.register_values(METRICS, collect_metrics)
@@ -0,0 +1,103 @@
+import time
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Case, DateTimeField, F, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import Answer, ArchivedAnswer, ChallengeRollup, Group, Question
+
+ARCHIVE_BATCH_SIZE = 500
+ARCHIVE_FIELDS = ('answer_id', 'user_id', 'group_id', 'question_id', 'answer', 'is_correct', 'challenge_count',
+                  'is_deleted', 'create_date', 'update_date')
+
+
+def archive_answers(horizon, batch_size=ARCHIVE_BATCH_SIZE, pause=0):
+    """論理削除された回答と、horizon(timedelta)より前の回答をアーカイブに移し、移した件数を返す
+
+    batch_size件ずつ別のトランザクションで移すため、行ロックは短時間で済む。
+    pause秒ずつ間を空け、他の書き込みとレプリカへの反映を妨げないようにする。
+    """
+    cutoff = timezone.now() - horizon
+    moved = 0
+    # どちらも(is_deleted, create_date, answer_id)のインデックスを先頭から読む
+    for condition in (dict(is_deleted=True), dict(is_deleted=False, create_date__lt=cutoff)):
+        while True:
+            ids = list(Answer.objects.filter(**condition).order_by('create_date', 'answer_id').values_list(
+                'answer_id', flat=True)[:batch_size])
+            if not ids:
+                break
+            moved += _archive_batch(ids, condition)
+            if len(ids) < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+    return moved
+
+
+def _archive_batch(ids, condition):
+    with transaction.atomic():
+        # 結合先(グループ・問題)の行までロックしないよう、回答のみを読んでから名前と難易度を引く
+        rows = list(Answer.objects.select_for_update().filter(answer_id__in=ids, **condition).values(
+            *ARCHIVE_FIELDS))
+        if not rows:
+            return 0
+        group_names = dict(Group.objects.filter(group_id__in={row['group_id'] for row in rows}).values_list(
+            'group_id', 'group_name'))
+        degrees = dict(Question.objects.filter(question_id__in={row['question_id'] for row in rows}).values_list(
+            'question_id', 'degree'))
+
+        archived = list()
+        rollups = defaultdict(lambda: dict(total_count=0, correct_answer_count=0, last_answer_date=None))
+        for row in rows:
+            answer = ArchivedAnswer(group_name=group_names[row['group_id']], degree=degrees[row['question_id']],
+                                    **row)
+            archived.append(answer)
+            if answer.is_deleted:
+                continue
+            rollup = rollups[(answer.user_id, answer.challenge_count)]
+            rollup['total_count'] += 1
+            rollup['correct_answer_count'] += 1 if answer.is_correct else 0
+            if rollup['last_answer_date'] is None or rollup['last_answer_date'] < answer.create_date:
+                rollup.update(last_answer_date=answer.create_date, group_name=answer.group_name,
+                              degree=answer.degree)
+
+        ArchivedAnswer.objects.bulk_create(archived)
+        for (user_id, challenge_count), rollup in rollups.items():
+            _add_rollup(user_id, challenge_count, **rollup)
+        Answer.objects.filter(answer_id__in=[row['answer_id'] for row in rows]).delete()
+    return len(rows)
+
+
+def _add_rollup(user_id, challenge_count, total_count, correct_answer_count, last_answer_date, group_name, degree):
+    rollups = ChallengeRollup.objects.filter(user_id=user_id, challenge_count=challenge_count)
+    # MySQLはSET句を左から順に評価するため、last_answer_dateは最後に更新して更新前の値と比べさせる
+    increments = dict(
+        total_count=F('total_count') + total_count,
+        correct_answer_count=F('correct_answer_count') + correct_answer_count,
+        group_name=Case(When(last_answer_date__lt=last_answer_date, then=Value(group_name)), default=F('group_name')),
+        degree=Case(When(last_answer_date__lt=last_answer_date, then=Value(degree)), default=F('degree')),
+        last_answer_date=Greatest(F('last_answer_date'), Value(last_answer_date, output_field=DateTimeField())),
+    )
+    if rollups.update(**increments):
+        return
+
+    try:
+        with transaction.atomic():
+            ChallengeRollup.objects.create(
+                user_id=user_id, challenge_count=challenge_count, total_count=total_count,
+                correct_answer_count=correct_answer_count, group_name=group_name, degree=degree,
+                last_answer_date=last_answer_date)
+    except IntegrityError:
+        # 同時に別の処理が集計行を作成した場合は加算し直す
+        rollups.update(**increments)
+
+
+def challenge_rollups(user_id, start=None, stop=None):
+    """アーカイブ済みの回答のチャレンジ回数ごとの集計を{チャレンジ回数: 集計}で返す(start以上stop未満に絞り込める)"""
+    rollups = ChallengeRollup.objects.filter(user_id=user_id)
+    if start is not None:
+        rollups = rollups.filter(challenge_count__gte=start, challenge_count__lt=stop)
+    rows = rollups.values('challenge_count', 'total_count', 'correct_answer_count', 'group_name', 'degree')
+    return {row['challenge_count']: row for row in rows}
@@ -0,0 +1,15 @@
+from django.db.backends.mysql.base import Database, DatabaseWrapper as MySQLDatabaseWrapper
+
+from ..pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, MySQLDatabaseWrapper):
+    """接続プールを使うMySQLバックエンド"""
+
+    def ping_raw(self, raw):
+        try:
+            # PyMySQLのpingは既定で自動的に再接続するため、再接続は行わずに結果だけ確認する
+            raw.ping(False)
+        except Database.Error:
+            return False
+        return True
@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import deque
+
+from django.db import DatabaseError
+
+
+class PoolTimeout(DatabaseError):
+    pass
+
+
+class ConnectionPool:
+    """プロセス内のスレッドで共有する、上限付きのDB接続プール
+
+    返却されてからcheck_idle秒以上経過した接続は、貸し出す前にpingで確認し、使えない場合は接続し直す。
+    """
+
+    def __init__(self, connect, ping, max_size, timeout=10, check_idle=5):
+        self.connect = connect
+        self.ping = ping
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_idle = check_idle
+        self._idle = deque()
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self.created = 0
+        self.reconnects = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+
+    def acquire(self):
+        raw, returned_at = self._checkout()
+        try:
+            if raw is not None and time.monotonic() - returned_at >= self.check_idle and not self.ping(raw):
+                self._close_quietly(raw)
+                raw = None
+                with self._condition:
+                    self.reconnects += 1
+            if raw is None:
+                raw = self.connect()
+                with self._condition:
+                    self.created += 1
+        except BaseException:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+        return raw
+
+    def _checkout(self):
+        with self._condition:
+            start = None
+            while not self._idle and self._in_use >= self.max_size:
+                if start is None:
+                    start = time.monotonic()
+                    self.waits += 1
+                remaining = self.timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    self.timeouts += 1
+                    self.wait_seconds += time.monotonic() - start
+                    raise PoolTimeout('no connection available in {} seconds.'.format(self.timeout))
+                self._condition.wait(remaining)
+            if start is not None:
+                self.wait_seconds += time.monotonic() - start
+            self._in_use += 1
+            if self._idle:
+                # 最後に返却された接続から使い、使われない接続はpingの対象として残す
+                return self._idle.pop()
+            return None, None
+
+    def release(self, raw, discard=False):
+        """接続を返却する。トランザクション中やエラー後の接続はdiscard=Trueで閉じる"""
+        if discard:
+            self._close_quietly(raw)
+        with self._condition:
+            self._in_use -= 1
+            if not discard:
+                self._idle.append((raw, time.monotonic()))
+            self._condition.notify()
+
+    def close_idle(self):
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+        for raw, _ in idle:
+            self._close_quietly(raw)
+
+    def stats(self):
+        with self._condition:
+            return dict(max_size=self.max_size, in_use=self._in_use, idle=len(self._idle), created=self.created,
+                        reconnects=self.reconnects, waits=self.waits, wait_seconds=self.wait_seconds,
+                        timeouts=self.timeouts)
+
+    def _close_quietly(self, raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+
+# DB別名ごとのプール(プロセス内で共有する)
+pools = dict()
+_pools_lock = threading.Lock()
+
+
+class PooledDatabaseWrapperMixin:
+    """get_new_connectionでプールから借り、closeでプールに返すDatabaseWrapper
+
+    リクエスト終了時に返却させるためCONN_MAX_AGEは0にすること。
+    プールの設定はDATABASESのPOOL_SIZE、POOL_TIMEOUT、POOL_CHECK_IDLEで指定する。
+    """
+
+    def get_new_connection(self, conn_params):
+        return self._get_pool(conn_params).acquire()
+
+    def _close(self):
+        if self.connection is None:
+            return
+        # トランザクション中・エラー後の接続は状態が不明なため再利用しない
+        discard = self.in_atomic_block or self.errors_occurred or not self.autocommit
+        pools[self.alias].release(self.connection, discard)
+
+    def ping_raw(self, raw):
+        raise NotImplementedError
+
+    def _get_pool(self, conn_params):
+        pool = pools.get(self.alias)
+        if pool is not None:
+            return pool
+        with _pools_lock:
+            if self.alias not in pools:
+                connect = super().get_new_connection
+                pools[self.alias] = ConnectionPool(
+                    lambda: connect(conn_params), self.ping_raw, self.settings_dict.get('POOL_SIZE', 4),
+                    self.settings_dict.get('POOL_TIMEOUT', 10), self.settings_dict.get('POOL_CHECK_IDLE', 5))
+            return pools[self.alias]
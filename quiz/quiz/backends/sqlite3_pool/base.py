@@ -0,0 +1,14 @@
+from django.db.backends.sqlite3.base import Database, DatabaseWrapper as SQLiteDatabaseWrapper
+
+from ..pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, SQLiteDatabaseWrapper):
+    """接続プールを使うSQLiteバックエンド(ローカルでの動作確認・ベンチマーク用)"""
+
+    def ping_raw(self, raw):
+        try:
+            raw.execute('SELECT 1')
+        except Database.Error:
+            return False
+        return True
@@ -0,0 +1,20 @@
+# BigIntegerField(符号付き64ビット)に収まるよう、1語あたり63ビットを使う
+WORD_BITS = 63
+
+
+class QuestionBitmap:
+    """question_idをビット位置とするビットマップ({語の番号: ビット列})
+
+    所属の確認は回答履歴の件数によらず一定時間で行える。
+    """
+
+    def __init__(self, words=None):
+        self.words = dict(words or ())
+
+    def __contains__(self, question_id):
+        word, bit = divmod(question_id, WORD_BITS)
+        return bool(self.words.get(word, 0) >> bit & 1)
+
+    def add(self, question_id):
+        word, bit = divmod(question_id, WORD_BITS)
+        self.words[word] = self.words.get(word, 0) | 1 << bit
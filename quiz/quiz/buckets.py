@@ -0,0 +1,104 @@
+import datetime
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Answer, ArchivedAnswer, ScoreBucket
+
+# ランキングの期間(今日、今週(月曜から)、今月)
+WINDOWS = ('day', 'week', 'month')
+# IN句の要素数の上限(SQLiteは999)を超えない件数。bulk_createの件数はバックエンドの上限に合わせてDjangoが分ける
+ROLLUP_BATCH_SIZE = 500
+
+
+def day_start(value):
+    """valueを含む日(TIME_ZONE)の0時"""
+    return timezone.make_aware(datetime.datetime.combine(timezone.localtime(value).date(), datetime.time()))
+
+
+def hour_start(value):
+    """valueを含む時間帯の開始日時"""
+    return timezone.localtime(value).replace(minute=0, second=0, microsecond=0)
+
+
+def window_start(window, now=None):
+    """期間windowの開始日時。1日単位のバケットは期間の境界をまたがない"""
+    today = timezone.localtime(day_start(now or timezone.now()))
+    if window == 'week':
+        today -= datetime.timedelta(days=today.weekday())
+    elif window == 'month':
+        today = today.replace(day=1)
+    return day_start(today)
+
+
+def add_score_bucket(user_id, total, correct, start, span=ScoreBucket.HOUR):
+    """startから始まるユーザのバケットに回答数・正解数を加算する(読み込まずにUPDATEし、無い場合のみ作成する)"""
+    buckets = ScoreBucket.objects.filter(user_id=user_id, span=span, start=start)
+    increments = dict(answer_count=F('answer_count') + total, correct_count=F('correct_count') + correct)
+    if buckets.update(**increments):
+        return
+
+    try:
+        with transaction.atomic():
+            ScoreBucket.objects.create(user_id=user_id, span=span, start=start, answer_count=total,
+                                       correct_count=correct)
+    except IntegrityError:
+        # 同時に別リクエストがバケットを作成した場合は加算し直す
+        buckets.update(**increments)
+
+
+def rollup_score_buckets(now=None):
+    """前日までの1時間単位のバケットを1日単位にまとめ、どの期間にも含まれないバケットを削除する
+
+    まとめた件数と削除した件数を返す。ROLLUP_BATCH_SIZE件ずつ別のトランザクションで処理する。
+    """
+    now = now or timezone.now()
+    hours = ScoreBucket.objects.filter(span=ScoreBucket.HOUR, start__lt=window_start('day', now))
+    rolled = 0
+    while True:
+        with transaction.atomic():
+            rows = list(hours.select_for_update().order_by('start', 'user_id').values(
+                'id', 'user_id', 'start', 'answer_count', 'correct_count')[:ROLLUP_BATCH_SIZE])
+            if not rows:
+                break
+            days = defaultdict(lambda: [0, 0])
+            for row in rows:
+                day = days[(row['user_id'], day_start(row['start']))]
+                day[0] += row['answer_count']
+                day[1] += row['correct_count']
+            for (user_id, start), (total, correct) in days.items():
+                add_score_bucket(user_id, total, correct, start, span=ScoreBucket.DAY)
+            ScoreBucket.objects.filter(id__in=[row['id'] for row in rows]).delete()
+        rolled += len(rows)
+
+    expired = min(window_start(window, now) for window in WINDOWS)
+    deleted, _ = ScoreBucket.objects.filter(start__lt=expired).delete()
+    return rolled, deleted
+
+
+def rebuild_score_buckets(now=None):
+    """回答テーブルとアーカイブから、どれかの期間に含まれる回答のバケットを作り直す"""
+    now = now or timezone.now()
+    since = min(window_start(window, now) for window in WINDOWS)
+    today = window_start('day', now)
+    counts = defaultdict(lambda: [0, 0])
+    for model in (ArchivedAnswer, Answer):
+        rows = model.objects.filter(is_deleted=False, create_date__gte=since).values_list(
+            'user_id', 'is_correct', 'create_date').order_by()
+        for user_id, is_correct, create_date in rows.iterator():
+            if create_date < today:
+                key = (user_id, ScoreBucket.DAY, day_start(create_date))
+            else:
+                key = (user_id, ScoreBucket.HOUR, hour_start(create_date))
+            counts[key][0] += 1
+            counts[key][1] += 1 if is_correct else 0
+
+    with transaction.atomic():
+        ScoreBucket.objects.all().delete()
+        ScoreBucket.objects.bulk_create(
+            [ScoreBucket(user_id=user_id, span=span, start=start, answer_count=total, correct_count=correct)
+             for (user_id, span, start), (total, correct) in counts.items()])
+
+    return len(counts)
@@ -0,0 +1,235 @@
+import random
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+
+from .models import DataVersion, Group, Question, User
+from .versions import ANSWER_KEYS, KNOWN_GROUPS, KNOWN_USERS, get_version, questions_key
+
+WARM_UP_BATCH_SIZE = 500
+QUESTION_FIELDS = ('question_id', 'group_id', 'user_id', 'question_type', 'question',
+                   'shape_path', 'correct', 'choice_1', 'choice_2', 'choice_3', 'choice_4')
+
+AnswerKey = namedtuple('AnswerKey', ('correct', 'group_id', 'is_deleted', 'rating'))
+
+
+class LRUCache:
+    """件数上限付きのLRUキャッシュ"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class VersionCheck:
+    """他プロセスでの更新を、DataVersionのkeyをinterval秒に1回読んで検知する
+
+    プロセスごとのキャッシュは、自プロセスのsignalsでしか破棄されないため、
+    prefork型のサーバ(manage.py serve)では他のワーカーでの更新をこれで検知する。
+    """
+
+    def __init__(self, key, interval):
+        self.key = key
+        self.interval = interval
+        self._version = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def changed(self):
+        """確認の時期であればバージョンを読み、前回の確認から変わっていればTrueを返す(初回もTrue)"""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.interval:
+            return False
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.interval:
+                return False
+            # キャッシュへの読み込みより前にバージョンを読むため、読み込み中の更新も次の確認で検知できる
+            version = get_version(self.key)
+            changed = version != self._version
+            self._version = version
+            self._checked_at = now
+            return changed
+
+
+def pick(rows, k, answered=None, exclude=False):
+    """rowsからk件ランダムに選ぶ。answeredに含まれる問題は後回しにする(excludeの場合は選ばない)"""
+    if answered is None:
+        return random.sample(rows, min(k, len(rows)))
+
+    unseen = [row for row in rows if row['question_id'] not in answered]
+    questions = random.sample(unseen, min(k, len(unseen)))
+    if len(questions) < k and not exclude:
+        seen = [row for row in rows if row['question_id'] in answered]
+        questions += random.sample(seen, min(k - len(questions), len(seen)))
+    return questions
+
+
+class QuestionPool:
+    """(group_id, degree)ごとの出題可能な問題をプロセス内に保持する
+
+    問題の更新回数(quiz.versions)を指定して取得し、保持している回数と異なる場合は読み直す。
+    更新回数を加算しない経路での変更はtimeout秒後に反映される。
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self._pools = dict()
+
+    def get(self, group_id, degree, version=None):
+        key = (str(group_id), int(degree))
+        entry = self._pools.get(key)
+        if entry is None or entry[0] < time.monotonic() or (version is not None and entry[1] != version):
+            rows = list(Question.objects.filter(group_id=group_id, degree=degree, is_deleted=False).order_by(
+                'question_id').values(*QUESTION_FIELDS))
+            entry = (time.monotonic() + self.timeout, version, rows)
+            self._pools[key] = entry
+        return entry[2]
+
+    def sample(self, group_id, degree, k, version=None, answered=None, exclude=False):
+        """問題をk件(問題数がk未満の場合は全件)ランダムに選ぶ
+
+        answered(正解済みの問題のビットマップ)を指定した場合は含まれない問題を優先し、
+        不足分を正解済みの問題から選ぶ。excludeの場合は正解済みの問題を選ばない。
+        """
+        return pick(self.get(group_id, degree, version), k, answered, exclude)
+
+    def invalidate(self, group_id=None, degree=None):
+        if group_id is None:
+            self._pools.clear()
+            return
+        self._pools.pop((str(group_id), int(degree)), None)
+
+
+class AnswerKeyCache:
+    """問題IDごとの正解(correct, group_id, is_deleted)と、ユーザのレーティングの更新に使う問題のレーティングを保持する
+
+    問題の更新・削除時はsignalsからinvalidateし、他プロセスでの更新と問題のレーティングの反映
+    (quiz.ratings.update_question_ratings)はANSWER_KEYSのバージョンで検知する。
+    """
+
+    def __init__(self, max_size, check_interval):
+        self.max_size = max_size
+        self._cache = LRUCache(max_size)
+        self._check = VersionCheck(ANSWER_KEYS, check_interval)
+
+    def get(self, question_id):
+        return self.get_many([question_id]).get(question_id)
+
+    def get_many(self, question_ids):
+        """キャッシュに無い問題は1クエリでまとめて読み込み、{question_id: AnswerKey}を返す"""
+        if self._check.changed():
+            self._cache.clear()
+        keys = dict()
+        missing = list()
+        for question_id in question_ids:
+            key = self._cache.get(question_id)
+            if key is None:
+                missing.append(question_id)
+            else:
+                keys[question_id] = key
+
+        if missing:
+            rows = Question.objects.filter(question_id__in=missing).values_list(
+                'question_id', 'correct', 'group_id', 'is_deleted', 'rating')
+            for question_id, correct, group_id, is_deleted, rating in rows:
+                keys[question_id] = AnswerKey(correct, group_id, is_deleted, rating)
+                self._cache.set(question_id, keys[question_id])
+        return keys
+
+    def invalidate(self, question_id=None):
+        if question_id is None:
+            self._cache.clear()
+        else:
+            self._cache.delete(question_id)
+
+
+class KnownKeyCache:
+    """存在を確認済みの主キーを保持する(存在しないキーはキャッシュしない)
+
+    削除時はsignalsからinvalidateし、他プロセスでの削除はversion_keyのバージョンで検知する。
+    """
+
+    def __init__(self, model, max_size, version_key, check_interval):
+        self.model = model
+        self.max_size = max_size
+        self._cache = LRUCache(max_size)
+        self._check = VersionCheck(version_key, check_interval)
+
+    def exists(self, pk):
+        return not self.missing([pk])
+
+    def missing(self, pks):
+        """存在しない主キーの集合を返す。キャッシュに無いものは1クエリでまとめて確認する"""
+        if self._check.changed():
+            self._cache.clear()
+        unknown = {pk for pk in pks if not self._cache.get(pk)}
+        if not unknown:
+            return set()
+
+        found = set(self.model.objects.filter(pk__in=unknown).values_list('pk', flat=True))
+        for pk in found:
+            self._cache.set(pk, True)
+        return unknown - found
+
+    def invalidate(self, pk=None):
+        if pk is None:
+            self._cache.clear()
+        else:
+            self._cache.delete(pk)
+
+
+def warm_up():
+    """ワーカーの起動時に各キャッシュを読み込む(最初のリクエストでまとめて読み込まないため)"""
+    versions = dict(DataVersion.objects.filter(key__startswith='questions:').values_list('key', 'version'))
+    pairs = Question.objects.filter(is_deleted=False).values_list('group_id', 'degree').distinct().order_by()
+    for group_id, degree in pairs:
+        question_pool.get(group_id, degree, versions.get(questions_key(group_id, degree), 0))
+
+    # IN句の要素数の上限(SQLiteは999)を超えないよう分けて読み込む
+    question_ids = list(Question.objects.filter(is_deleted=False).order_by('-create_date').values_list(
+        'question_id', flat=True)[:answer_keys.max_size])
+    for i in range(0, len(question_ids), WARM_UP_BATCH_SIZE):
+        answer_keys.get_many(question_ids[i:i + WARM_UP_BATCH_SIZE])
+
+    group_ids = list(Group.objects.filter(is_deleted=False).values_list('group_id', flat=True)[
+                     :known_groups.max_size])
+    for i in range(0, len(group_ids), WARM_UP_BATCH_SIZE):
+        known_groups.missing(group_ids[i:i + WARM_UP_BATCH_SIZE])
+
+
+question_pool = QuestionPool(getattr(settings, 'QUESTION_POOL_TIMEOUT', 60))
+answer_keys = AnswerKeyCache(getattr(settings, 'ANSWER_KEY_CACHE_SIZE', 10000),
+                             getattr(settings, 'KEY_CACHE_CHECK_INTERVAL', 2))
+known_users = KnownKeyCache(User, getattr(settings, 'KNOWN_KEY_CACHE_SIZE', 10000), KNOWN_USERS,
+                            getattr(settings, 'KEY_CACHE_CHECK_INTERVAL', 2))
+known_groups = KnownKeyCache(Group, getattr(settings, 'KNOWN_KEY_CACHE_SIZE', 10000), KNOWN_GROUPS,
+                             getattr(settings, 'KEY_CACHE_CHECK_INTERVAL', 2))
@@ -0,0 +1,92 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+from .backends.pool import pools
+
+
+class ConnectionStats:
+    """永続接続の使用前チェックの結果(プール未使用時)"""
+
+    def __init__(self):
+        self.checks = 0
+        self.reconnects = 0
+        self._lock = threading.Lock()
+
+    def add(self, reconnected):
+        with self._lock:
+            self.checks += 1
+            self.reconnects += 1 if reconnected else 0
+
+
+stats = ConnectionStats()
+
+
+def check_connections():
+    """リクエスト開始時に、一定時間使われていない永続接続が使えるかを確認し、使えない場合は閉じる
+
+    閉じた接続は最初のクエリで接続し直される。プールを使う場合はプールが貸し出し時に確認する。
+    """
+    idle = getattr(settings, 'DB_HEALTH_CHECK_IDLE', 5)
+    now = time.monotonic()
+    for connection in connections.all():
+        if connection.connection is None or connection.alias in pools:
+            continue
+        if now - getattr(connection, 'last_released_at', now) < idle:
+            continue
+        usable = ping(connection)
+        if not usable:
+            connection.close()
+        stats.add(not usable)
+
+
+def mark_released():
+    """リクエスト終了時に、各永続接続が最後に使われた時刻を記録する"""
+    now = time.monotonic()
+    for connection in connections.all():
+        if connection.connection is not None:
+            connection.last_released_at = now
+
+
+def ping(connection):
+    if connection.vendor == 'mysql':
+        # PyMySQLのpingは既定で自動的に再接続するため、再接続は行わずに結果だけ確認する
+        try:
+            connection.connection.ping(False)
+        except connection.Database.Error:
+            return False
+        return True
+    return connection.is_usable()
+
+
+# /api/metricsに出力する値(quiz.metrics.MetricsRegistry.register_values)
+METRICS = (
+    ('quiz_db_pool_size', 'gauge', 'Maximum connections in the pool.'),
+    ('quiz_db_pool_in_use', 'gauge', 'Connections currently lent out.'),
+    ('quiz_db_pool_idle', 'gauge', 'Connections waiting in the pool.'),
+    ('quiz_db_pool_connects_total', 'counter', 'New connections opened by the pool.'),
+    ('quiz_db_pool_reconnects_total', 'counter', 'Pooled connections replaced after a failed ping.'),
+    ('quiz_db_pool_waits_total', 'counter', 'Checkouts that waited for a free connection.'),
+    ('quiz_db_pool_wait_seconds_total', 'counter', 'Time spent waiting for a connection.'),
+    ('quiz_db_pool_timeouts_total', 'counter', 'Checkouts that gave up waiting.'),
+    ('quiz_db_health_checks_total', 'counter', 'Persistent connections pinged before reuse.'),
+    ('quiz_db_reconnects_total', 'counter', 'Persistent connections closed after a failed ping.'),
+)
+POOL_STATS = (('quiz_db_pool_size', 'max_size'), ('quiz_db_pool_in_use', 'in_use'), ('quiz_db_pool_idle', 'idle'),
+              ('quiz_db_pool_connects_total', 'created'), ('quiz_db_pool_reconnects_total', 'reconnects'),
+              ('quiz_db_pool_waits_total', 'waits'), ('quiz_db_pool_wait_seconds_total', 'wait_seconds'),
+              ('quiz_db_pool_timeouts_total', 'timeouts'))
+
+
+def collect_metrics():
+    """このプロセスの接続プールと永続接続のチェックの計測値を{(名前, ラベル): 値}で返す(全プロセス分はレジストリで合算する)"""
+    values = dict()
+    for alias, pool in pools.items():
+        pool_stats = pool.stats()
+        for name, key in POOL_STATS:
+            values[(name, 'alias="{}"'.format(alias))] = pool_stats[key]
+    values[('quiz_db_health_checks_total', '')] = stats.checks
+    values[('quiz_db_reconnects_total', '')] = stats.reconnects
+    return values
@@ -0,0 +1,97 @@
+import csv
+import io
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+
+from .models import Answer, ArchivedAnswer
+from .pagination import decode_cursor, encode_cursor
+
+# 1回のクエリで読み込む件数
+EXPORT_CHUNK_SIZE = 1000
+# 分析用のため、この秒数までの遅延を許容してレプリカから読む(quiz.routers.ReplicaRouter)
+EXPORT_REPLICA_MAX_LAG = 60
+# 成績取得(SelectUserRecordView)と同じく、回答にグループ名と問題の難易度を付ける。cursorはその行から再開するための値
+EXPORT_FIELDS = ('answer_id', 'user_id', 'group_id', 'group_name', 'question_id', 'degree', 'answer', 'is_correct',
+                 'challenge_count', 'create_date', 'cursor')
+
+
+def parse_export_cursor(cursor):
+    """エクスポートのカーソル(行のcursor列)を(create_date, answer_id)に戻す。不正な場合はValueError"""
+    value = decode_cursor(cursor)
+    if not (isinstance(value, list) and len(value) == 2 and all(isinstance(item, str) for item in value)):
+        raise ValueError('cursor is invalid.')
+    create_date = parse_datetime(value[0])
+    if create_date is None:
+        raise ValueError('cursor is invalid.')
+    return create_date, value[1]
+
+
+def export_answers(user_id=None, since=None, until=None, after=None, chunk_size=EXPORT_CHUNK_SIZE, using=None):
+    """回答を(create_date, answer_id)の順にchunk_size件ずつ読み込み、行のリストを順に返す
+
+    回答テーブルとアーカイブ(quiz.archive)を1つの順序で読む。チャンクごとに両方から前回の最後のキーより後ろを
+    chunk_size件ずつ読み、マージして先頭のchunk_size件を返す。アーカイブは回答テーブルからの削除と同じトランザクションで
+    行を移すため、回答テーブル、アーカイブの順に読めばエクスポート中に移された行も読み飛ばさない(両方で読めた行は1件にする)。
+    チャンクごとに独立したクエリを発行するため、サーバサイドカーソルやトランザクションを開いたまま書き出しを待つことがない。
+    """
+    fields = ('answer_id', 'user_id', 'group_id', 'question_id', 'answer', 'is_correct', 'challenge_count',
+              'create_date')
+    sources = list()
+    for answers in (Answer.objects.values(*fields, group_name=F('group__group_name'), degree=F('question__degree')),
+                    ArchivedAnswer.objects.values(*fields, 'group_name', 'degree')):
+        answers = answers.filter(is_deleted=False)
+        if using is not None:
+            answers = answers.using(using)
+        if user_id is not None:
+            answers = answers.filter(user_id=user_id)
+        if since is not None:
+            answers = answers.filter(create_date__gte=since)
+        if until is not None:
+            answers = answers.filter(create_date__lt=until)
+        sources.append(answers.order_by('create_date', 'answer_id'))
+
+    while True:
+        rows = dict()
+        for answers in sources:
+            for row in _read_chunk(answers, after, chunk_size):
+                rows.setdefault(row['answer_id'], row)
+        rows = sorted(rows.values(), key=lambda row: (row['create_date'], row['answer_id']))[:chunk_size]
+        if not rows:
+            return
+        for row in rows:
+            row['cursor'] = encode_cursor([row['create_date'].isoformat(), str(row['answer_id'])])
+        yield rows
+        # マージしてもchunk_size件に満たない場合は、どちらのテーブルも読み終えている
+        if len(rows) < chunk_size:
+            return
+        after = (rows[-1]['create_date'], rows[-1]['answer_id'])
+
+
+def _read_chunk(answers, after, chunk_size):
+    if after is not None:
+        # 先頭のcreate_date >= の条件でインデックスの途中から読み始める(ORだけでは先頭から走査される)
+        answers = answers.filter(Q(create_date__gt=after[0]) | Q(answer_id__gt=after[1]), create_date__gte=after[0])
+    return list(answers[:chunk_size])
+
+
+def format_chunks(chunks, fmt, header=True):
+    """行のリストをチャンクごとにCSV(headerの場合は1行目に列名)またはJSONLの文字列にする"""
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, EXPORT_FIELDS, lineterminator='\n')
+        if header:
+            writer.writeheader()
+        for rows in chunks:
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if header and buffer.getvalue():
+            yield buffer.getvalue()
+        return
+
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for rows in chunks:
+        yield ''.join(encoder.encode({field: row[field] for field in EXPORT_FIELDS}) + '\n' for row in rows)
@@ -0,0 +1,207 @@
+import csv
+import json
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+from .models import Group, Question, User, UserScore
+from .ratings import initial_rating
+from .serializers import ImportGroupRowSerializer, ImportQuestionRowSerializer, ImportUserRowSerializer
+from .versions import GROUPS, RANKING, bump, questions_key
+
+IMPORT_BATCH_SIZE = 1000
+# エンドポイントで返すエラーの上限(件数は全て数える)
+MAX_REPORTED_ERRORS = 1000
+FORMATS = ('csv', 'jsonl')
+
+
+def read_rows(lines, fmt):
+    """行(str)のiterableを1行ずつ解析し、(行番号, dict, エラー)を返す
+
+    CSVは1行目を列名とし、空の列は指定無しとして扱う。
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, {key: value for key, value in row.items() if key is not None and value != ''}, None
+        return
+
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_no, None, 'invalid JSON: {}'.format(e)
+            continue
+        if isinstance(row, dict):
+            yield line_no, row, None
+        else:
+            yield line_no, None, 'row must be a JSON object.'
+
+
+class Importer:
+    """行を検証してbatch_size件ごとにbulk_createで登録する
+
+    不正な行はon_error(行番号, 内容)に渡して読み飛ばし、残りの行の登録を続ける。
+    保持するのは1バッチ分の行と、登録前に読み込む外部キーの集合のみ。
+    """
+    serializer_class = None
+
+    def __init__(self, batch_size=IMPORT_BATCH_SIZE, on_error=None):
+        self.batch_size = batch_size
+        self.on_error = on_error or self._collect_error
+        self.serializer = self.serializer_class()
+        self.created = 0
+        self.error_count = 0
+        self.errors = list()
+
+    def run(self, rows):
+        self.prepare()
+        batch = list()
+        for line, row, error in rows:
+            if error is not None:
+                self._error(line, error)
+                continue
+            try:
+                batch.append((line, self.serializer.run_validation(row)))
+            except ValidationError as e:
+                self._error(line, e.detail)
+                continue
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = list()
+        self._flush(batch)
+        return self
+
+    def prepare(self):
+        """登録前に照合用のキーを読み込む"""
+
+    def check(self, batch):
+        """バッチ内の行を照合し、(行番号, エラー)のリストを返す"""
+        return list()
+
+    def insert(self, rows):
+        raise NotImplementedError
+
+    def _flush(self, batch):
+        rejected = dict(self.check(batch))
+        for line, detail in sorted(rejected.items()):
+            self._error(line, detail)
+        batch = [(line, data) for line, data in batch if line not in rejected]
+        if not batch:
+            return
+
+        try:
+            with transaction.atomic():
+                self.insert([data for _, data in batch])
+            self.created += len(batch)
+        except IntegrityError:
+            # 同時に登録された行と重複した場合は1行ずつ登録し直し、失敗した行を特定する
+            for line, data in batch:
+                try:
+                    with transaction.atomic():
+                        self.insert([data])
+                    self.created += 1
+                except IntegrityError as e:
+                    self._error(line, str(e))
+
+    def _error(self, line, detail):
+        self.error_count += 1
+        self.on_error(line, detail)
+
+    def _collect_error(self, line, detail):
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(dict(line=line, detail=detail))
+
+
+class UserImporter(Importer):
+    serializer_class = ImportUserRowSerializer
+
+    def check(self, batch):
+        user_ids = {data['user_id'] for _, data in batch}
+        names = {data['user_name'] for _, data in batch}
+        mails = {data['mail_address'] for _, data in batch}
+        existing = User.objects.filter(Q(user_id__in=user_ids) | Q(user_name__in=names) | Q(mail_address__in=mails))
+        taken = [set(), set(), set()]
+        for row in existing.values_list('user_id', 'user_name', 'mail_address'):
+            for keys, value in zip(taken, row):
+                keys.add(value)
+
+        errors = list()
+        for line, data in batch:
+            values = (data['user_id'], data['user_name'], data['mail_address'])
+            duplicated = [field for field, keys, value in zip(('user_id', 'user_name', 'mail_address'), taken, values)
+                          if value in keys]
+            if duplicated:
+                errors.append((line, {field: ['already exists.'] for field in duplicated}))
+                continue
+            for keys, value in zip(taken, values):
+                keys.add(value)
+        return errors
+
+    def insert(self, rows):
+        # bulk_createではsignalsが呼ばれないため、ランキング用の成績集計行も作成する
+        User.objects.bulk_create([User(**data) for data in rows])
+        UserScore.objects.bulk_create([UserScore(user_id=data['user_id'], user_name=data['user_name'])
+                                       for data in rows])
+        bump(RANKING)
+
+
+class GroupImporter(Importer):
+    serializer_class = ImportGroupRowSerializer
+
+    def check(self, batch):
+        names = {data['group_name'] for _, data in batch}
+        group_ids = {data['group_id'] for _, data in batch if 'group_id' in data}
+        existing = Group.objects.filter(Q(group_name__in=names) | Q(group_id__in=group_ids))
+        taken = set()
+        for group_id, group_name in existing.values_list('group_id', 'group_name'):
+            taken.update((group_id, group_name))
+
+        errors = list()
+        for line, data in batch:
+            duplicated = [field for field in ('group_id', 'group_name') if field in data and data[field] in taken]
+            if duplicated:
+                errors.append((line, {field: ['already exists.'] for field in duplicated}))
+                continue
+            taken.update(data.values())
+        return errors
+
+    def insert(self, rows):
+        Group.objects.bulk_create([Group(**data) for data in rows])
+        bump(GROUPS)
+
+
+class QuestionImporter(Importer):
+    serializer_class = ImportQuestionRowSerializer
+
+    def prepare(self):
+        self.group_ids = set(Group.objects.values_list('group_id', flat=True))
+        self.user_ids = set(User.objects.values_list('user_id', flat=True))
+
+    def check(self, batch):
+        errors = list()
+        for line, data in batch:
+            detail = dict()
+            if data['group_id'] not in self.group_ids:
+                detail['group_id'] = ['group_id is not found. group_id={}'.format(data['group_id'])]
+            if data['user_id'] not in self.user_ids:
+                detail['user_id'] = ['user_id is not found. user_id={}'.format(data['user_id'])]
+            if detail:
+                errors.append((line, detail))
+        return errors
+
+    def insert(self, rows):
+        Question.objects.bulk_create([Question(rating=initial_rating(data['degree']), **data) for data in rows])
+        # bulk_createではsignalsが呼ばれないため、出題対象の更新回数をまとめて加算する
+        for group_id, degree in {(data['group_id'], data['degree']) for data in rows}:
+            bump(questions_key(group_id, degree))
+
+
+IMPORTERS = {
+    'users': UserImporter,
+    'groups': GroupImporter,
+    'questions': QuestionImporter,
+}
@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from quiz.archive import ARCHIVE_BATCH_SIZE, archive_answers
+
+
+class Command(BaseCommand):
+    help = '論理削除された回答と古い回答をアーカイブ(ArchivedAnswer)に移し、チャレンジ回数ごとの集計に加える'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=getattr(settings, 'ANSWER_ARCHIVE_DAYS', 365),
+                            help='この日数より前の回答を移す')
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE,
+                            help='1回のトランザクションで移す件数')
+        parser.add_argument('--pause', type=float, default=0.1, help='トランザクションの間に待つ秒数')
+
+    def handle(self, *args, **options):
+        count = archive_answers(timedelta(days=options['days']), batch_size=options['batch_size'],
+                                pause=options['pause'])
+        self.stdout.write('archived {} answers'.format(count))
@@ -0,0 +1,49 @@
+import os
+import signal
+import sys
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from quiz.management.commands.benchmark_endpoints import BENCH_PREFIX
+from quiz.management.commands.loadtest import bench_paths, run_load, start_server
+from quiz.models import UserScore
+
+# 計測する接続方式と、serveに渡す環境変数
+MODES = (
+    ('per-request', dict(DB_CONN_MAX_AGE='0')),
+    ('persistent', dict(DB_CONN_MAX_AGE='60')),
+    ('pool', dict(DB_POOL_SIZE='2')),
+)
+
+
+class Command(BaseCommand):
+    help = 'リクエストごとの接続・永続接続・接続プールでserveを起動し、レイテンシを比較する'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', action='append', help='計測するパス(既定は/api/groupsなどの読み取り系)')
+        parser.add_argument('--concurrency', type=int, default=4, help='同時接続数')
+        parser.add_argument('--duration', type=float, default=10, help='方式ごとの計測秒数')
+        parser.add_argument('--threads', type=int, default=4, help='ワーカーのスレッド数')
+        parser.add_argument('--port', type=int, default=18000, help='起動するサーバのポート')
+
+    def handle(self, *args, **options):
+        if not UserScore.objects.filter(user__user_id__startswith=BENCH_PREFIX).exists():
+            call_command('generate_data', prefix=BENCH_PREFIX, stdout=self.stdout)
+        paths = options['path'] or bench_paths()
+        command = [sys.executable, os.path.join(settings.BASE_DIR, 'manage.py'), 'serve', '--host', '127.0.0.1',
+                   '--port', str(options['port']), '--workers', '1', '--threads', str(options['threads'])]
+
+        self.stdout.write('{:<12} {:>9} {:>9} {:>9} {:>7}'.format('mode', 'req/s', 'p50 ms', 'p99 ms', 'errors'))
+        for mode, env in MODES:
+            env = dict(os.environ, **env)
+            if mode != 'pool':
+                env.pop('DB_POOL_SIZE', None)
+            process = start_server(command, options['port'], env)
+            try:
+                result = run_load(options['port'], paths, options['concurrency'], options['duration'])
+            finally:
+                process.send_signal(signal.SIGTERM)
+                process.wait(30)
+            self.stdout.write('{:<12} {throughput:>9.1f} {p50:>9.2f} {p99:>9.2f} {errors:>7}'.format(mode, **result))
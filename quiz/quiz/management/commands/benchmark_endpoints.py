@@ -0,0 +1,106 @@
+import json
+import math
+import random
+import time
+import tracemalloc
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from quiz.models import Group, Question, User, UserScore
+
+BENCH_PREFIX = 'bench'
+
+
+def percentile(values, p):
+    """昇順に並んだvaluesのpパーセンタイル(最近傍法)"""
+    return values[max(0, math.ceil(len(values) * p / 100) - 1)]
+
+
+class Command(BaseCommand):
+    help = '主要エンドポイントのレイテンシ(p50/p95/p99)、クエリ数、ピークメモリを計測する'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=100, help='エンドポイントごとのリクエスト数')
+        parser.add_argument('--users', type=int, default=1000, help='データが無い場合に生成するユーザ数')
+        parser.add_argument('--answers', type=int, default=100000, help='データが無い場合に生成する回答数')
+        parser.add_argument('--endpoint', action='append', help='計測するエンドポイント名(複数指定可)')
+        parser.add_argument('--skip-writes', action='store_true', help='回答登録を計測しない')
+        parser.add_argument('--json', dest='json_path', help='結果をJSONで出力するファイル')
+
+    def handle(self, *args, **options):
+        if not User.objects.filter(user_id__startswith=BENCH_PREFIX).exists():
+            call_command('generate_data', users=options['users'], answers=options['answers'], prefix=BENCH_PREFIX,
+                         stdout=self.stdout)
+
+        endpoints = self._endpoints(options['skip_writes'])
+        if options['endpoint']:
+            endpoints = [endpoint for endpoint in endpoints if endpoint[0] in options['endpoint']]
+
+        client = Client(HTTP_HOST='localhost')
+        results = list()
+        self.stdout.write('{:<12} {:>6} {:>9} {:>9} {:>9} {:>8} {:>10}'.format(
+            'endpoint', 'errors', 'p50 ms', 'p95 ms', 'p99 ms', 'queries', 'peak KiB'))
+        for name, make_request in endpoints:
+            result = self._measure(client, name, make_request, options['requests'])
+            results.append(result)
+            self.stdout.write('{name:<12} {errors:>6} {p50:>9.2f} {p95:>9.2f} {p99:>9.2f} {queries:>8.1f} '
+                              '{peak_kib:>10.1f}'.format(**result))
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as f:
+                json.dump(results, f, indent=2)
+
+    def _endpoints(self, skip_writes):
+        user_ids = list(UserScore.objects.filter(user__user_id__startswith=BENCH_PREFIX, total_count__gt=0).values_list(
+            'user_id', flat=True)[:100])
+        group = Group.objects.filter(group_name__startswith=BENCH_PREFIX + '_').first()
+        question = Question.objects.filter(group=group).values('question_id', 'correct').first()
+
+        endpoints = [
+            ('groups', lambda c: c.get('/api/groups')),
+            ('users', lambda c: c.get('/api/users')),
+            ('user', lambda c: c.get('/api/users/{}'.format(random.choice(user_ids)))),
+            ('record', lambda c: c.get('/api/users/{}/record'.format(random.choice(user_ids)))),
+            ('questions', lambda c: c.get('/api/questions', dict(
+                group_id=group.group_id, degree=random.randint(1, 3), limit=5))),
+            ('ranking', lambda c: c.get('/api/ranking')),
+            ('ranking50', lambda c: c.get('/api/ranking', dict(limit=50))),
+            ('rank', lambda c: c.get('/api/users/{}/rank'.format(random.choice(user_ids)))),
+        ]
+        if not skip_writes:
+            endpoints.append(('answer', lambda c: c.post(
+                '/api/users/{}/answers'.format(random.choice(user_ids)),
+                json.dumps(dict(question_id=question['question_id'], group_id=str(group.group_id),
+                                answer=question['correct'], challenge_count=1)),
+                content_type='application/json')))
+        return endpoints
+
+    def _measure(self, client, name, make_request, count):
+        # 初回はキャッシュの作成などを含むため計測しない
+        make_request(client)
+
+        elapsed = list()
+        queries = 0
+        errors = 0
+        for _ in range(count):
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = make_request(client)
+                elapsed.append(time.perf_counter() - start)
+            queries += len(captured.captured_queries)
+            errors += 1 if response.status_code >= 400 else 0
+
+        # tracemallocはレイテンシに影響するため別に1回だけ計測する
+        tracemalloc.start()
+        make_request(client)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        elapsed.sort()
+        return dict(name=name, errors=errors, requests=count,
+                    p50=percentile(elapsed, 50) * 1000, p95=percentile(elapsed, 95) * 1000,
+                    p99=percentile(elapsed, 99) * 1000, queries=queries / count, peak_kib=peak / 1024)
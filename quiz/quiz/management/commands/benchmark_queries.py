@@ -0,0 +1,80 @@
+import random
+import statistics
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count, IntegerField, Sum
+from django.db.models.functions import Cast
+
+from quiz.models import Answer, Group, Question, User
+
+BENCH_PREFIX = 'bench'
+
+
+class Command(BaseCommand):
+    help = '各ビューの主要クエリの実行計画と実行時間を計測する(--compareで複合インデックス無しと比較する)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='生成するユーザ数')
+        parser.add_argument('--answers', type=int, default=200000, help='生成する回答数')
+        parser.add_argument('--repeat', type=int, default=20, help='クエリごとの計測回数')
+        parser.add_argument('--compare', action='store_true',
+                            help='複合インデックスを一時的に削除した状態でも計測する(開発用DBでのみ使用すること)')
+
+    def handle(self, *args, **options):
+        self._ensure_dataset(options['users'], options['answers'])
+        queries = self._queries()
+
+        results = [('with indexes', self._run(queries, options['repeat']))]
+        if options['compare']:
+            indexes = [(model, index) for model in (Question, Answer) for index in model._meta.indexes]
+            with connection.schema_editor() as editor:
+                for model, index in indexes:
+                    editor.remove_index(model, index)
+            try:
+                results.insert(0, ('without indexes', self._run(queries, options['repeat'])))
+            finally:
+                with connection.schema_editor() as editor:
+                    for model, index in indexes:
+                        editor.add_index(model, index)
+
+        for label, timings in results:
+            self.stdout.write('== {} =='.format(label))
+            for name, plan, median in timings:
+                self.stdout.write('{:<10} median {:>8.2f} ms'.format(name, median * 1000))
+                for line in plan.splitlines():
+                    self.stdout.write('    ' + line)
+
+    def _queries(self):
+        group = Group.objects.filter(group_name__startswith=BENCH_PREFIX + '_').first()
+        user_ids = list(User.objects.filter(user_id__startswith=BENCH_PREFIX).values_list('user_id', flat=True)[:50])
+        return [
+            ('questions', lambda: Question.objects.filter(
+                group_id=group.group_id, degree=random.randint(1, 3), is_deleted=False).order_by(
+                'question_id').values_list('question_id', flat=True)),
+            ('record', lambda: Answer.objects.filter(
+                user_id=random.choice(user_ids), is_deleted=False).order_by('challenge_count').values(
+                'group__group_name', 'is_correct', 'challenge_count', 'question__degree')),
+            ('scores', lambda: Answer.objects.filter(is_deleted=False).values('user_id').annotate(
+                total=Count('answer_id'), correct=Sum(Cast('is_correct', IntegerField()))).order_by()),
+        ]
+
+    def _run(self, queries, repeat):
+        timings = list()
+        for name, make_query in queries:
+            plan = make_query().explain()
+            elapsed = list()
+            for _ in range(repeat):
+                query = make_query()
+                start = time.perf_counter()
+                list(query)
+                elapsed.append(time.perf_counter() - start)
+            timings.append((name, plan, statistics.median(elapsed)))
+        return timings
+
+    def _ensure_dataset(self, users, answers):
+        """ベンチマーク用のデータが無ければ生成する"""
+        if not User.objects.filter(user_id__startswith=BENCH_PREFIX).exists():
+            call_command('generate_data', users=users, answers=answers, prefix=BENCH_PREFIX, stdout=self.stdout)
@@ -0,0 +1,69 @@
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from quiz.models import Group, User
+from quiz.views import GroupView, QuestionView, SelectUserView
+
+BENCH_PREFIX = 'bench'
+
+
+class DRFRenderedMixin:
+    """ビューの結果をDRFのResponseで返し直す(コンテンツネゴシエーション・レンダラを通す従来の経路)"""
+
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        return Response(response.data)
+
+
+class Command(BaseCommand):
+    help = '読み取り系GETの1リクエストあたりのCPU時間を、DRFのレンダラを通す経路と比較する'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=1000, help='経路ごとのリクエスト数')
+        parser.add_argument('--users', type=int, default=1000, help='データが無い場合に生成するユーザ数')
+        parser.add_argument('--answers', type=int, default=10000, help='データが無い場合に生成する回答数')
+        parser.add_argument('--accept', default='application/json', help='リクエストのAcceptヘッダ')
+
+    def handle(self, *args, **options):
+        if not User.objects.filter(user_id__startswith=BENCH_PREFIX).exists():
+            call_command('generate_data', users=options['users'], answers=options['answers'], prefix=BENCH_PREFIX,
+                         stdout=self.stdout)
+
+        factory = APIRequestFactory()
+        user_id = User.objects.filter(user_id__startswith=BENCH_PREFIX).values_list('user_id', flat=True).first()
+        group = Group.objects.filter(group_name__startswith=BENCH_PREFIX + '_').first()
+        endpoints = [
+            ('groups', GroupView, lambda: factory.get('/groups', HTTP_ACCEPT=options['accept']), ()),
+            ('user', SelectUserView, lambda: factory.get('/users/' + user_id, HTTP_ACCEPT=options['accept']),
+             (user_id,)),
+            ('questions', QuestionView, lambda: factory.get('/questions', dict(
+                group_id=group.group_id, degree=1, limit=5), HTTP_ACCEPT=options['accept']), ()),
+        ]
+
+        self.stdout.write('{:<10} {:>12} {:>12} {:>12} {:>8}'.format('endpoint', 'drf us', 'fast us', 'saved us',
+                                                                    'saved %'))
+        for name, view_class, make_request, args in endpoints:
+            drf_view = type('DRF' + view_class.__name__, (DRFRenderedMixin, view_class), {}).as_view()
+            drf = self._measure(drf_view, make_request, args, options['requests'])
+            fast = self._measure(view_class.as_view(), make_request, args, options['requests'])
+            self.stdout.write('{:<10} {:>12.1f} {:>12.1f} {:>12.1f} {:>7.1f}%'.format(
+                name, drf, fast, drf - fast, (drf - fast) / drf * 100))
+
+    def _measure(self, view, make_request, args, count):
+        """1リクエストあたりのプロセスCPU時間(マイクロ秒)。ボディの書き出しまでを含む"""
+        # 初回はキャッシュの作成などを含むため計測しない
+        self._request(view, make_request, args)
+        start = time.process_time()
+        for _ in range(count):
+            self._request(view, make_request, args)
+        return (time.process_time() - start) / count * 1000000
+
+    def _request(self, view, make_request, args):
+        response = view(make_request(), *args)
+        if hasattr(response, 'render'):
+            response.render()
+        return response.content
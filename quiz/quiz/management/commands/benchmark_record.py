@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from quiz.models import Answer, Group, Question, User
+from quiz.views import SelectUserRecordView
+
+BENCH_USER_ID = 'b' * 28
+ANSWERS_PER_CHALLENGE = 5
+
+
+class Command(BaseCommand):
+    help = '/users/{id}/record の集計処理を回答数ごとに計測する(データはロールバックされる)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 2000, 4000, 8000, 16000],
+                            help='計測する回答数')
+        parser.add_argument('--repeat', type=int, default=5, help='計測回数(最小値を採用する)')
+
+    def handle(self, *args, **options):
+        self.stdout.write('{:>8} {:>10} {:>10} {:>12}'.format('answers', 'challenges', 'ms', 'us/answer'))
+        for size in options['sizes']:
+            elapsed = self._measure(size, options['repeat'])
+            self.stdout.write('{:>8} {:>10} {:>10.2f} {:>12.3f}'.format(
+                size, size // ANSWERS_PER_CHALLENGE, elapsed * 1000, elapsed * 1000000 / size))
+
+    def _measure(self, size, repeat):
+        with transaction.atomic():
+            user = User.objects.create(user_id=BENCH_USER_ID, user_name='benchmark', mail_address='bench@example.com')
+            group = Group.objects.create(group_name='benchmark')
+            question = Question.objects.create(group=group, user=user, question='benchmark', correct='1', degree=1)
+            Answer.objects.bulk_create(
+                [Answer(user=user, group=group, question=question, answer='1', is_correct=i % 3 != 0,
+                        challenge_count=i // ANSWERS_PER_CHALLENGE + 1) for i in range(size)],
+                batch_size=500)
+
+            answers = Answer.objects.filter(user_id=user.user_id, is_deleted=False).order_by('challenge_count').values(
+                'group__group_name', 'is_correct', 'challenge_count', 'question__degree')
+            view = SelectUserRecordView()
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                view._make_response(user.user_id, answers)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+
+            transaction.set_rollback(True)
+
+        return best
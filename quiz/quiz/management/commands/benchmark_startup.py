@@ -0,0 +1,64 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 起動時に読み込まれてはいけない重いモジュール
+HEAVY_MODULES = ('pandas', 'numpy')
+
+# ワーカーと同じ手順(django.setup()とURLconfの読み込み)を新しいプロセスで実行し、時間とRSSを出力する
+PROBE = '''
+import importlib, json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+from django.conf import settings
+importlib.import_module(settings.ROOT_URLCONF)
+elapsed = time.perf_counter() - start
+rss = 0
+with open('/proc/self/status') as f:
+    for line in f:
+        if line.startswith('VmRSS:'):
+            rss = int(line.split()[1]) * 1024
+heavy = [name for name in {heavy} if name in sys.modules]
+print(json.dumps(dict(seconds=elapsed, rss=rss, heavy=heavy)))
+'''
+
+
+class Command(BaseCommand):
+    help = 'ワーカー起動(django.setup()とURLconfの読み込み)の時間とRSSを計測し、予算を超えた場合は失敗する'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='計測回数(中央値で判定する)')
+        parser.add_argument('--max-seconds', type=float, default=1.0, help='起動時間の予算(秒)')
+        parser.add_argument('--max-rss-mib', type=float, default=64.0, help='起動直後のRSSの予算(MiB)')
+
+    def handle(self, *args, **options):
+        results = [self._probe() for _ in range(options['runs'])]
+        seconds = statistics.median(result['seconds'] for result in results)
+        rss_mib = statistics.median(result['rss'] for result in results) / 1024 / 1024
+        heavy = sorted({name for result in results for name in result['heavy']})
+
+        self.stdout.write('startup {:.3f} s (budget {:.3f} s), rss {:.1f} MiB (budget {:.1f} MiB)'.format(
+            seconds, options['max_seconds'], rss_mib, options['max_rss_mib']))
+
+        errors = list()
+        if seconds > options['max_seconds']:
+            errors.append('startup time {:.3f} s exceeds {:.3f} s'.format(seconds, options['max_seconds']))
+        if rss_mib > options['max_rss_mib']:
+            errors.append('rss {:.1f} MiB exceeds {:.1f} MiB'.format(rss_mib, options['max_rss_mib']))
+        if heavy:
+            errors.append('heavy modules imported at startup: {}'.format(', '.join(heavy)))
+        if errors:
+            raise CommandError('; '.join(errors))
+
+    def _probe(self):
+        # 計測中のプロセスと同じ設定モジュール・環境変数で起動する
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        output = subprocess.check_output([sys.executable, '-c', PROBE.format(heavy=repr(HEAVY_MODULES))],
+                                         cwd=settings.BASE_DIR, env=env)
+        return json.loads(output.decode().strip().splitlines()[-1])
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import router
+from rest_framework.exceptions import ValidationError
+
+from quiz.exporter import EXPORT_CHUNK_SIZE, EXPORT_REPLICA_MAX_LAG, export_answers, format_chunks
+from quiz.models import Answer
+from quiz.routers import reset_state
+from quiz.serializers import ExportAnswersValidateSerializer
+
+
+class Command(BaseCommand):
+    help = '回答履歴(グループ名・問題の難易度付き)をキーセットで少しずつ読み込み、CSV/JSONLで書き出す'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=('csv', 'jsonl'), default='jsonl', help='出力形式')
+        parser.add_argument('--output', help='出力先のファイル(省略時は標準出力)。--cursorを指定した場合は追記する')
+        parser.add_argument('--user-id', help='指定したユーザの回答のみ')
+        parser.add_argument('--since', help='この日時以降の回答のみ(YYYY-MM-DDまたはISO 8601)')
+        parser.add_argument('--until', help='この日時より前の回答のみ(YYYY-MM-DDまたはISO 8601)')
+        parser.add_argument('--cursor', help='前回の出力の最後の行のcursor列。その次の行から再開する')
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE, help='1回のクエリで読み込む件数')
+        parser.add_argument('--database', help='読み込むDB(省略時はルータがレプリカを選ぶ)')
+
+    def handle(self, *args, **options):
+        param = {key: options[key] for key in ('user_id', 'since', 'until', 'cursor') if options[key]}
+        param['file_format'] = options['format']
+        data = ExportAnswersValidateSerializer(data=param)
+        try:
+            data.is_valid(raise_exception=True)
+        except ValidationError as e:
+            raise CommandError(e.detail)
+        data = data.validated_data
+
+        reset_state(max_lag=EXPORT_REPLICA_MAX_LAG)
+        chunks = export_answers(user_id=data.get('user_id'), since=data.get('since'), until=data.get('until'),
+                                after=data.get('cursor'), chunk_size=options['chunk_size'],
+                                using=options['database'] or router.db_for_read(Answer))
+        content = format_chunks(chunks, data['file_format'], header='cursor' not in data)
+
+        if not options['output']:
+            for chunk in content:
+                self.stdout.write(chunk, ending='')
+            return
+        mode = 'a' if 'cursor' in data else 'w'
+        with open(options['output'], mode, encoding='utf-8', newline='') as f:
+            for chunk in content:
+                f.write(chunk)
+                # 中断した場合も書き出し済みの最後の行のcursorから再開できるよう、チャンクごとに書き出す
+                f.flush()
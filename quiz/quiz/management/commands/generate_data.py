@@ -0,0 +1,118 @@
+import datetime
+import random
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from quiz.aggregates import reconcile_user_stats, rebuild_answered_questions, rebuild_user_scores
+from quiz.buckets import rebuild_score_buckets
+from quiz.models import Answer, Group, Question, User
+from quiz.ratings import initial_rating
+
+BATCH_SIZE = 500
+ANSWERS_PER_CHALLENGE = 5
+DEGREES = (1, 2, 3)
+
+
+class Command(BaseCommand):
+    help = 'ベンチマーク用のユーザ・グループ・問題・回答を一括登録する'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='ユーザ数')
+        parser.add_argument('--groups', type=int, default=10, help='グループ数')
+        parser.add_argument('--questions', type=int, default=10000, help='問題数')
+        parser.add_argument('--answers', type=int, default=100000, help='回答数')
+        parser.add_argument('--days', type=int, default=90, help='回答日時を分布させる日数')
+        parser.add_argument('--prefix', default='gen', help='生成するデータのID・名前の接頭辞')
+        parser.add_argument('--seed', type=int, default=None, help='乱数のシード')
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        if User.objects.filter(user_id__startswith=prefix).exists():
+            raise CommandError('data with prefix "{}" already exists.'.format(prefix))
+        random.seed(options['seed'])
+
+        # 途中で失敗した場合に一部のデータが残り、同じ接頭辞で再実行できなくならないよう1トランザクションで登録する
+        with transaction.atomic():
+            user_ids = self._create_users(prefix, options['users'])
+            groups = self._create_groups(prefix, options['groups'])
+            pools = self._create_questions(prefix, user_ids[0], groups, options['questions'])
+            count = self._create_answers(user_ids, pools, options['answers'], options['days'])
+            rebuild_score_buckets()
+            rebuild_user_scores()
+            rebuild_answered_questions()
+            reconcile_user_stats()
+
+        self.stdout.write('generated {} users, {} groups, {} questions, {} answers'.format(
+            len(user_ids), len(groups), options['questions'], count))
+
+    def _create_users(self, prefix, count):
+        width = 28 - len(prefix)
+        users = [User(user_id='{}{:0{}d}'.format(prefix, i, width), user_name='{}_user{}'.format(prefix, i),
+                      mail_address='{}{}@example.com'.format(prefix, i)) for i in range(count)]
+        User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+        return [user.user_id for user in users]
+
+    def _create_groups(self, prefix, count):
+        groups = [Group(group_name='{}_group{}'.format(prefix, i)) for i in range(count)]
+        Group.objects.bulk_create(groups, batch_size=BATCH_SIZE)
+        return groups
+
+    def _create_questions(self, prefix, owner_id, groups, count):
+        """問題を登録し、(group_id, degree)ごとの問題IDを返す"""
+        batch = list()
+        for i in range(count):
+            degree = DEGREES[i // len(groups) % len(DEGREES)]
+            batch.append(Question(group_id=groups[i % len(groups)].group_id, user_id=owner_id,
+                                  question='{}_question{}'.format(prefix, i), correct=str(random.randint(1, 4)),
+                                  choice_1='1', choice_2='2', choice_3='3', choice_4='4',
+                                  degree=degree, rating=initial_rating(degree)))
+            if len(batch) >= BATCH_SIZE:
+                Question.objects.bulk_create(batch)
+                batch = list()
+        Question.objects.bulk_create(batch)
+
+        pools = defaultdict(list)
+        rows = Question.objects.filter(question__startswith=prefix + '_question').values_list(
+            'question_id', 'group_id', 'degree', 'correct')
+        for question_id, group_id, degree, correct in rows.iterator():
+            pools[(group_id, degree)].append((question_id, correct))
+        return pools
+
+    def _create_answers(self, user_ids, pools, count, days):
+        """1チャレンジ5問の回答を、少数のユーザに回答が偏る分布(パレート分布)で登録する"""
+        weights = [random.paretovariate(1.16) for _ in user_ids]
+        cum_weights = list()
+        total = 0
+        for weight in weights:
+            total += weight
+            cum_weights.append(total)
+        abilities = {user_id: random.betavariate(2, 1.5) for user_id in user_ids}
+        challenge_counts = defaultdict(int)
+        keys = list(pools)
+        now = timezone.now()
+
+        created = 0
+        batch = list()
+        while created < count:
+            user_id = random.choices(user_ids, cum_weights=cum_weights)[0]
+            challenge_counts[user_id] += 1
+            group_id, degree = random.choice(keys)
+            pool = pools[(group_id, degree)]
+            questions = random.sample(pool, min(ANSWERS_PER_CHALLENGE, len(pool)))
+            answered_at = now - datetime.timedelta(seconds=random.randint(0, days * 86400))
+            probability = abilities[user_id] - 0.1 * (degree - 2)
+            for question_id, correct in questions[:count - created]:
+                is_correct = random.random() < probability
+                batch.append(Answer(user_id=user_id, group_id=group_id, question_id=question_id,
+                                    answer=correct if is_correct else '0', is_correct=is_correct,
+                                    challenge_count=challenge_counts[user_id],
+                                    create_date=answered_at, update_date=answered_at))
+                created += 1
+            if len(batch) >= BATCH_SIZE:
+                Answer.objects.bulk_create(batch)
+                batch = list()
+        Answer.objects.bulk_create(batch)
+        return created
@@ -0,0 +1,28 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz.importer import FORMATS, IMPORT_BATCH_SIZE, IMPORTERS, read_rows
+
+
+class Command(BaseCommand):
+    help = 'CSV/JSONL(1行1オブジェクト)のユーザ・グループ・問題を1行ずつ読み込んで一括登録する'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(IMPORTERS), help='登録する対象')
+        parser.add_argument('path', help='読み込むファイル')
+        parser.add_argument('--format', choices=FORMATS, help='ファイル形式(省略時は拡張子から判定する)')
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE, help='1回のbulk_createで登録する行数')
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or os.path.splitext(options['path'])[1].lstrip('.').lower()
+        if fmt not in FORMATS:
+            raise CommandError('unknown format: {} (use --format)'.format(fmt))
+
+        def on_error(line, detail):
+            self.stderr.write('line {}: {}'.format(line, detail))
+
+        with open(options['path'], encoding='utf-8-sig', newline='') as f:
+            importer = IMPORTERS[options['kind']](batch_size=options['batch_size'], on_error=on_error)
+            importer.run(read_rows(f, fmt))
+        self.stdout.write('imported {} {}, {} errors'.format(importer.created, options['kind'], importer.error_count))
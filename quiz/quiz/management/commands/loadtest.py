@@ -0,0 +1,131 @@
+import http.client
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz.management.commands.benchmark_endpoints import BENCH_PREFIX, percentile
+from quiz.models import Group, UserScore
+
+# サーバの起動を待つ秒数
+START_TIMEOUT = 60
+
+
+def bench_paths():
+    """ベンチマーク用データに対する読み取り系のパス"""
+    user_ids = list(UserScore.objects.filter(user__user_id__startswith=BENCH_PREFIX, total_count__gt=0).values_list(
+        'user_id', flat=True)[:20])
+    group = Group.objects.filter(group_name__startswith=BENCH_PREFIX + '_').first()
+    paths = ['/api/groups', '/api/ranking?limit=50',
+             '/api/questions?group_id={}&degree=1&limit=5'.format(group.group_id)]
+    paths += ['/api/users/{}'.format(user_id) for user_id in user_ids[:5]]
+    paths += ['/api/users/{}/record'.format(user_id) for user_id in user_ids[:5]]
+    return paths
+
+
+def start_server(command, port, env=None):
+    """commandでサーバを起動し、リクエストを受け付けるまで待つ"""
+    process = subprocess.Popen(command, cwd=settings.BASE_DIR, env=env, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.request('GET', '/api/metrics')
+            connection.getresponse().read()
+            connection.close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise CommandError('{} did not start.'.format(' '.join(command[1:])))
+
+
+def run_load(port, paths, concurrency, duration):
+    """concurrency本のkeep-alive接続からpathsを順にリクエストし続ける"""
+    elapsed = list()
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client(offset):
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        local = list()
+        local_errors = 0
+        i = offset
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                connection.request('GET', paths[i % len(paths)])
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 400:
+                    local_errors += 1
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            local.append(time.perf_counter() - start)
+            i += 1
+        connection.close()
+        with lock:
+            elapsed.extend(local)
+            errors[0] += local_errors
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    elapsed.sort()
+    return dict(throughput=len(elapsed) / duration, p50=percentile(elapsed, 50) * 1000,
+                p99=percentile(elapsed, 99) * 1000, errors=errors[0])
+
+
+class Command(BaseCommand):
+    help = 'runserverとserve(ワーカー数xスレッド数)をローカルで起動して負荷をかけ、スループットを比較する'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--configs', default='runserver,1x1,2x4',
+                            help='カンマ区切りの構成(runserver、または<ワーカー数>x<スレッド数>)')
+        parser.add_argument('--concurrency', type=int, default=16, help='同時接続数')
+        parser.add_argument('--duration', type=float, default=10, help='構成ごとの計測秒数')
+        parser.add_argument('--port', type=int, default=18000, help='起動するサーバのポート')
+        parser.add_argument('--users', type=int, default=1000, help='データが無い場合に生成するユーザ数')
+        parser.add_argument('--answers', type=int, default=100000, help='データが無い場合に生成する回答数')
+
+    def handle(self, *args, **options):
+        if not UserScore.objects.filter(user__user_id__startswith=BENCH_PREFIX).exists():
+            call_command('generate_data', users=options['users'], answers=options['answers'], prefix=BENCH_PREFIX,
+                         stdout=self.stdout)
+        paths = bench_paths()
+
+        self.stdout.write('{:<10} {:>9} {:>9} {:>9} {:>7}'.format('config', 'req/s', 'p50 ms', 'p99 ms', 'errors'))
+        for config in options['configs'].split(','):
+            process = start_server(self._command(config.strip(), options['port']), options['port'])
+            try:
+                result = run_load(options['port'], paths, options['concurrency'], options['duration'])
+            finally:
+                process.send_signal(signal.SIGTERM)
+                process.wait(30)
+            self.stdout.write('{:<10} {throughput:>9.1f} {p50:>9.2f} {p99:>9.2f} {errors:>7}'.format(
+                config, **result))
+
+    def _command(self, config, port):
+        manage = os.path.join(settings.BASE_DIR, 'manage.py')
+        if config == 'runserver':
+            return [sys.executable, manage, 'runserver', '127.0.0.1:{}'.format(port), '--noreload']
+        try:
+            workers, threads = (int(value) for value in config.split('x'))
+        except ValueError:
+            raise CommandError('invalid config: {}'.format(config))
+        return [sys.executable, manage, 'serve', '--host', '127.0.0.1', '--port', str(port),
+                '--workers', str(workers), '--threads', str(threads)]
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from quiz.aggregates import rebuild_answered_questions, rebuild_user_scores
+from quiz.buckets import rebuild_score_buckets
+
+
+class Command(BaseCommand):
+    help = '回答テーブルからユーザごとの成績集計(UserScore)、時間帯ごとのバケット(ScoreBucket)、正解済みの問題(AnsweredQuestions)を再作成する'
+
+    def handle(self, *args, **options):
+        # 成績集計の再作成でランキングの更新回数を加算するため、バケットを先に作り直す
+        count = rebuild_score_buckets()
+        self.stdout.write('rebuilt {} score buckets'.format(count))
+        count = rebuild_user_scores()
+        self.stdout.write('rebuilt {} user scores'.format(count))
+        count = rebuild_answered_questions()
+        self.stdout.write('rebuilt {} answered question sets'.format(count))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from quiz.aggregates import reconcile_user_stats
+
+
+class Command(BaseCommand):
+    help = '回答テーブルからUserの正答率(correct_answer_rate)・チャレンジ回数(challenge_count)・件数のずれを修正する'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='ずれているユーザ数のみ表示し、更新しない')
+
+    def handle(self, *args, **options):
+        count = reconcile_user_stats(dry_run=options['dry_run'])
+        if options['dry_run']:
+            self.stdout.write('{} users have drifted stats'.format(count))
+        else:
+            self.stdout.write('reconciled {} users'.format(count))
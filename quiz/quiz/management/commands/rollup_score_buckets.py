@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from quiz.buckets import rollup_score_buckets
+
+
+class Command(BaseCommand):
+    help = '前日までの1時間単位のバケット(ScoreBucket)を1日単位にまとめ、期間外のバケットを削除する(定期的に実行する)'
+
+    def handle(self, *args, **options):
+        rolled, deleted = rollup_score_buckets()
+        self.stdout.write('rolled up {} hourly buckets, deleted {} expired buckets'.format(rolled, deleted))
@@ -0,0 +1,228 @@
+import argparse
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# ワーカーの起動(ウォームアップ)を待つ秒数
+READY_TIMEOUT = 60
+# 停止時に、この秒数リクエストが無いkeep-alive接続を閉じる
+IDLE_CLOSE_SECONDS = 0.5
+
+
+class Command(BaseCommand):
+    help = 'WSGIアプリケーションをprefork型のワーカー(waitress)で起動する。SIGHUPでワーカーを入れ替える'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='0.0.0.0', help='待ち受けるアドレス')
+        parser.add_argument('--port', type=int, default=8000, help='待ち受けるポート')
+        parser.add_argument('--workers', type=int, default=getattr(settings, 'SERVE_WORKERS', 2),
+                            help='ワーカープロセス数')
+        parser.add_argument('--threads', type=int, default=getattr(settings, 'SERVE_THREADS', 4),
+                            help='ワーカーごとのスレッド数')
+        parser.add_argument('--graceful-timeout', type=float, default=30,
+                            help='停止・入れ替え時に処理中のリクエストの完了を待つ秒数')
+        parser.add_argument('--no-warm-up', action='store_false', dest='warm_up',
+                            help='ワーカー起動時にキャッシュを読み込まない')
+        # 以下はマスターがワーカーを起動するときに指定する
+        parser.add_argument('--worker-fd', type=int, help=argparse.SUPPRESS)
+        parser.add_argument('--ready-fd', type=int, help=argparse.SUPPRESS)
+
+    def handle(self, *args, **options):
+        if options['worker_fd'] is not None:
+            return Worker(options).run()
+        return Master(options, self.stdout).run()
+
+
+class Master:
+    """待ち受けソケットを作成してワーカーに引き継ぎ、ワーカーの監視・入れ替えを行う
+
+    ワーカーは新しいプロセスとして起動するため、SIGHUPによる入れ替えではコードと設定も読み直される。
+    新しいワーカーの準備(ウォームアップ)が完了してから古いワーカーを停止するため、入れ替え中も受け付けを止めない。
+    """
+
+    def __init__(self, options, stdout):
+        self.options = options
+        self.stdout = stdout
+        self.workers = dict()
+        self.reload_requested = False
+        self.stop_requested = False
+
+    def run(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((self.options['host'], self.options['port']))
+        self.sock.listen(1024)
+        self.sock.set_inheritable(True)
+
+        signal.signal(signal.SIGHUP, self._request_reload)
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        self.workers = self._spawn(self.options['workers'])
+        host, port = self.sock.getsockname()[:2]
+        self.stdout.write('serving on http://{}:{} with {} workers x {} threads (pid {})'.format(
+            host, port, self.options['workers'], self.options['threads'], os.getpid()))
+        self.stdout.flush()
+
+        while not self.stop_requested:
+            if self.reload_requested:
+                self.reload_requested = False
+                self._reload()
+            self._respawn()
+            time.sleep(0.2)
+
+        self._stop(list(self.workers.values()))
+        self.sock.close()
+
+    def _request_reload(self, signum, frame):
+        self.reload_requested = True
+
+    def _request_stop(self, signum, frame):
+        self.stop_requested = True
+
+    def _spawn(self, count):
+        """ワーカーをcount個起動し、全てのウォームアップの完了を待って{pid: Popen}を返す"""
+        started = list()
+        for _ in range(count):
+            read_fd, write_fd = os.pipe()
+            command = [sys.executable, os.path.join(settings.BASE_DIR, 'manage.py'), 'serve',
+                       '--threads', str(self.options['threads']),
+                       '--graceful-timeout', str(self.options['graceful_timeout']),
+                       '--worker-fd', str(self.sock.fileno()), '--ready-fd', str(write_fd)]
+            if not self.options['warm_up']:
+                command.append('--no-warm-up')
+            process = subprocess.Popen(command, pass_fds=(self.sock.fileno(), write_fd))
+            os.close(write_fd)
+            started.append((process, read_fd))
+
+        deadline = time.monotonic() + READY_TIMEOUT
+        for process, read_fd in started:
+            ready, _, _ = select.select([read_fd], [], [], max(0, deadline - time.monotonic()))
+            ok = bool(ready) and os.read(read_fd, 1) == b'1'
+            os.close(read_fd)
+            if not ok:
+                self._stop([process for process, _ in started])
+                raise CommandError('worker {} did not become ready.'.format(process.pid))
+        return {process.pid: process for process, _ in started}
+
+    def _reload(self):
+        old = list(self.workers.values())
+        try:
+            new = self._spawn(self.options['workers'])
+        except CommandError as e:
+            # 新しいワーカーが起動できない場合は古いワーカーで処理を続ける
+            self.stdout.write('reload failed: {}'.format(e))
+            return
+        self.workers = new
+        self._stop(old)
+        self.stdout.write('reloaded workers: {}'.format(', '.join(str(pid) for pid in sorted(new))))
+        self.stdout.flush()
+
+    def _respawn(self):
+        """異常終了したワーカーを起動し直す"""
+        exited = [pid for pid, process in self.workers.items() if process.poll() is not None]
+        for pid in exited:
+            del self.workers[pid]
+        self._retire(exited)
+        if exited and not self.stop_requested:
+            try:
+                self.workers.update(self._spawn(len(exited)))
+            except CommandError as e:
+                self.stdout.write('respawn failed: {}'.format(e))
+
+    def _stop(self, processes):
+        for process in processes:
+            if process.poll() is None:
+                process.send_signal(signal.SIGTERM)
+        deadline = time.monotonic() + self.options['graceful_timeout'] + 5
+        for process in processes:
+            try:
+                process.wait(max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        self._retire([process.pid for process in processes])
+
+    def _retire(self, pids):
+        """終了したワーカーの計測値のファイルを合算して削除する(同じpidで起動したワーカーの値と混ざらないため)"""
+        from quiz.metrics import registry
+
+        for pid in pids:
+            registry.retire(pid)
+
+
+class Worker:
+    """マスターから引き継いだソケットでリクエストを処理する
+
+    SIGTERMを受けると新しい接続の受け付けをやめ、処理中のリクエストが完了してから終了する。
+    """
+
+    def __init__(self, options):
+        self.options = options
+        self.stop_requested = False
+
+    def run(self):
+        from django.db import connections
+        from django.urls import get_resolver
+        from waitress import wasyncore
+        from waitress.channel import HTTPChannel
+        from waitress.server import create_server
+
+        from personality_analysis.wsgi import application
+        from quiz.caches import warm_up
+        from quiz.metrics import registry
+
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        # URLの解決・各キャッシュの読み込みを済ませてから受け付けを始める
+        get_resolver().reverse_dict
+        if self.options['warm_up']:
+            warm_up()
+        connections.close_all()
+
+        sock = socket.socket(fileno=self.options['worker_fd'])
+        socket_map = dict()
+        server = create_server(application, map=socket_map, sockets=[sock], threads=self.options['threads'])
+        os.write(self.options['ready_fd'], b'1')
+        os.close(self.options['ready_fd'])
+
+        parent = os.getppid()
+        deadline = None
+        while socket_map:
+            wasyncore.loop(timeout=IDLE_CLOSE_SECONDS, map=socket_map, count=1)
+            if os.getppid() != parent:
+                # マスターが終了した場合は残らずに終了する
+                self.stop_requested = True
+            if not self.stop_requested:
+                continue
+            if deadline is None:
+                deadline = time.monotonic() + self.options['graceful_timeout']
+                # 待ち受けソケットを閉じても、マスターと他のワーカーの待ち受けには影響しない
+                wasyncore.dispatcher.close(server)
+            channels = [channel for channel in list(socket_map.values()) if isinstance(channel, HTTPChannel)]
+            for channel in channels:
+                # 次のリクエストを待っているだけのkeep-alive接続は閉じる(受け付け直後の接続はリクエストの受信を待つ)
+                idle = not (channel.requests or channel.total_outbufs_len or channel.request is not None)
+                if idle and time.time() - channel.last_activity >= IDLE_CLOSE_SECONDS:
+                    channel.handle_close()
+            busy = [channel for channel in socket_map.values() if isinstance(channel, HTTPChannel)]
+            if not busy or time.monotonic() >= deadline:
+                break
+
+        timeout = self.options['graceful_timeout'] if deadline is None else max(0, deadline - time.monotonic())
+        server.task_dispatcher.shutdown(cancel_pending=False, timeout=timeout)
+        # 前回の書き出し以降の計測値を残す
+        if registry.directory:
+            registry.flush()
+
+    def _request_stop(self, signum, frame):
+        self.stop_requested = True
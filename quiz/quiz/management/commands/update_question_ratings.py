@@ -0,0 +1,20 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from quiz.ratings import RATING_CHUNK_SIZE, update_question_ratings
+
+
+class Command(BaseCommand):
+    help = '前回の実行以降に登録された回答を問題のレーティングにまとめて反映する(定期的に実行する)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lag', type=float, default=getattr(settings, 'QUESTION_RATING_LAG', 60),
+                            help='この秒数より前に登録された回答までを反映する(コミット待ちの回答を読み飛ばさないため)')
+        parser.add_argument('--chunk-size', type=int, default=RATING_CHUNK_SIZE,
+                            help='1回のトランザクションで反映する回答数')
+
+    def handle(self, *args, **options):
+        count = update_question_ratings(timedelta(seconds=options['lag']), chunk_size=options['chunk_size'])
+        self.stdout.write('applied {} answers to question ratings'.format(count))
@@ -0,0 +1,220 @@
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+
+# リクエスト処理時間のヒストグラムの区切り(秒)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 終了したプロセスの計測値を合算しておくファイル
+RETIRED_FILE = 'retired.json'
+
+
+class ViewStats:
+    """ビュー・メソッドごとの計測値"""
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.duration = 0.0
+        self.queries = 0
+        self.query_duration = 0.0
+        self.response_bytes = 0
+
+    def observe(self, duration, queries, query_duration, response_bytes):
+        for i, bound in enumerate(BUCKETS):
+            if duration <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.count += 1
+        self.duration += duration
+        self.queries += queries
+        self.query_duration += query_duration
+        self.response_bytes += response_bytes
+
+    def to_list(self):
+        return [self.buckets, self.count, self.duration, self.queries, self.query_duration, self.response_bytes]
+
+    def merge(self, values):
+        buckets, count, duration, queries, query_duration, response_bytes = values
+        self.buckets = [a + b for a, b in zip(self.buckets, buckets)]
+        self.count += count
+        self.duration += duration
+        self.queries += queries
+        self.query_duration += query_duration
+        self.response_bytes += response_bytes
+
+
+class MetricsRegistry:
+    """プロセス内の計測値を保持する
+
+    directoryを指定した場合はflush_interval秒ごとと終了時に<pid>.jsonへ書き出し、
+    exposeでは全プロセス分のファイルを合算する(prefork型のサーバで複数ワーカーを集計するため)。
+    終了したプロセスのファイルはretireでretired.jsonに合算して削除する。
+    """
+
+    def __init__(self, directory=None, flush_interval=5):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.metrics = list()
+        self.sources = list()
+        self._stats = defaultdict(ViewStats)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+
+    def observe(self, view, method, duration, queries, query_duration, response_bytes):
+        with self._lock:
+            self._stats[(view, method)].observe(duration, queries, query_duration, response_bytes)
+        if self.directory and time.monotonic() - self._flushed_at >= self.flush_interval:
+            self.flush()
+
+    def register_values(self, metrics, source):
+        """ビュー以外のプロセス単位の値を返すsource()を登録する
+
+        metricsは(名前, 'gauge'または'counter', 説明)の並び、source()は{(名前, ラベル): 値}を返す。
+        値はビューの計測値と同じく全プロセス分を名前・ラベルごとに合算して出力する。
+        """
+        self.metrics.extend(metrics)
+        self.sources.append(source)
+
+    def snapshot(self):
+        with self._lock:
+            snapshot = dict(views={'{}|{}'.format(*key): stats.to_list() for key, stats in self._stats.items()})
+        types = {name: metric_type for name, metric_type, _ in self.metrics}
+        values = dict(gauge=dict(), counter=dict())
+        for source in self.sources:
+            for (name, labels), value in source().items():
+                values[types[name]]['{}|{}'.format(name, labels)] = value
+        snapshot['gauges'] = values['gauge']
+        snapshot['counters'] = values['counter']
+        return snapshot
+
+    def flush(self):
+        # 他のスレッドが書き出し中の場合は次の機会に回す
+        if not self._flush_lock.acquire(blocking=False):
+            return
+        try:
+            self._flushed_at = time.monotonic()
+            self._write(self._path(os.getpid()), self.snapshot())
+        finally:
+            self._flush_lock.release()
+
+    def retire(self, pid):
+        """終了したプロセスpidの計測値をretired.jsonに合算し、<pid>.jsonを削除する
+
+        合計が減らないよう、合算したファイルを書いてから削除する。削除するまでの間は、
+        retired.jsonのmergedに記録した<pid>.jsonを集計から除く(同じpidの新しいプロセスの値は除かないよう後で消す)。
+        """
+        if not self.directory:
+            return
+        name = '{}.json'.format(pid)
+        snapshot = self._read(self._path(pid))
+        if snapshot is None:
+            return
+        retired = self._read(os.path.join(self.directory, RETIRED_FILE)) or dict()
+        views = self._merge([retired, snapshot])
+        # ゲージは終了したプロセスの分を残さず、カウンタのみ合算する
+        retired = dict(views={'{}|{}'.format(*key): stats.to_list() for key, stats in views.items()},
+                       counters=self._merge_values([retired, snapshot], 'counters'))
+        self._write(os.path.join(self.directory, RETIRED_FILE), dict(retired, merged=[name]))
+        os.remove(self._path(pid))
+        self._write(os.path.join(self.directory, RETIRED_FILE), retired)
+
+    def collect(self):
+        """全プロセス分の計測値を合算する"""
+        return self._merge(self._snapshots())
+
+    def _snapshots(self):
+        snapshots = [self.snapshot()]
+        if not self.directory:
+            return snapshots
+        own = self._path(os.getpid())
+        loaded = dict()
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            if path != own:
+                snapshot = self._read(path)
+                if snapshot is not None:
+                    loaded[os.path.basename(path)] = snapshot
+        # retired.jsonに合算済みで削除前のファイルは数えない
+        for name in loaded.get(RETIRED_FILE, dict()).get('merged', ()):
+            loaded.pop(name, None)
+        return snapshots + list(loaded.values())
+
+    def _merge(self, snapshots):
+        merged = defaultdict(ViewStats)
+        for snapshot in snapshots:
+            for key, values in snapshot.get('views', dict()).items():
+                merged[tuple(key.split('|', 1))].merge(values)
+        return merged
+
+    def _merge_values(self, snapshots, kind):
+        merged = defaultdict(int)
+        for snapshot in snapshots:
+            for key, value in snapshot.get(kind, dict()).items():
+                merged[key] += value
+        return merged
+
+    def _path(self, pid):
+        return os.path.join(self.directory, '{}.json'.format(pid))
+
+    def _read(self, path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path, snapshot):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(path + '.tmp', path)
+
+    def expose(self):
+        """Prometheusのテキスト形式で出力する"""
+        snapshots = self._snapshots()
+        stats = sorted(self._merge(snapshots).items())
+        lines = list()
+
+        lines.append('# HELP quiz_http_request_duration_seconds Request latency per view and method.')
+        lines.append('# TYPE quiz_http_request_duration_seconds histogram')
+        for (view, method), value in stats:
+            labels = 'view="{}",method="{}"'.format(view, method)
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ('+Inf',), value.buckets):
+                cumulative += count
+                lines.append('quiz_http_request_duration_seconds_bucket{{{},le="{}"}} {}'.format(
+                    labels, bound, cumulative))
+            lines.append('quiz_http_request_duration_seconds_sum{{{}}} {}'.format(labels, value.duration))
+            lines.append('quiz_http_request_duration_seconds_count{{{}}} {}'.format(labels, value.count))
+
+        for name, attr, help_text in (
+                ('quiz_db_queries_total', 'queries', 'Database queries per view and method.'),
+                ('quiz_db_query_duration_seconds_total', 'query_duration', 'Database time per view and method.'),
+                ('quiz_http_response_bytes_total', 'response_bytes', 'Response body size per view and method.')):
+            lines.append('# HELP {} {}'.format(name, help_text))
+            lines.append('# TYPE {} counter'.format(name))
+            for (view, method), value in stats:
+                lines.append('{}{{view="{}",method="{}"}} {}'.format(name, view, method, getattr(value, attr)))
+
+        values = self._merge_values(snapshots, 'gauges')
+        values.update(self._merge_values(snapshots, 'counters'))
+        series = defaultdict(list)
+        for key, value in sorted(values.items()):
+            name, labels = key.split('|', 1)
+            series[name].append((labels, value))
+        for name, metric_type, help_text in self.metrics:
+            lines.append('# HELP {} {}'.format(name, help_text))
+            lines.append('# TYPE {} {}'.format(name, metric_type))
+            for labels, value in series[name]:
+                lines.append('{}{} {}'.format(name, '{{{}}}'.format(labels) if labels else '', value))
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry(getattr(settings, 'METRICS_DIR', None), getattr(settings, 'METRICS_FLUSH_INTERVAL', 5))
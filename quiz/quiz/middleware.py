@@ -0,0 +1,105 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from .metrics import registry
+from .routers import is_pinned, pin, reset_state, state
+
+# 読み取り専用として扱うメソッド
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+# 書き込み後にプライマリから読ませるためのCookie(ワーカープロセスをまたいでread-your-writesを保つ)
+PIN_COOKIE = 'quiz_pin_primary'
+
+
+class QueryCounter:
+    """execute_wrapperとして登録し、クエリ数と実行時間を数える"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+
+class MetricsMiddleware:
+    """ビュー・メソッドごとの処理時間、クエリ数、DB時間、レスポンスサイズを計測する"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        start = time.perf_counter()
+        with self._count_queries(counter):
+            response = self.get_response(request)
+
+        if response.streaming:
+            # ストリーミングでは本文を読み出しながらクエリを発行するため、読み終えた(閉じた)時点で計測する
+            response.streaming_content = self._observe_stream(request, response.streaming_content, start, counter)
+            return response
+
+        registry.observe(self._view_name(request), request.method, time.perf_counter() - start, counter.count,
+                         counter.duration, len(response.content))
+        return response
+
+    def _observe_stream(self, request, content, start, counter):
+        response_bytes = 0
+        try:
+            with self._count_queries(counter):
+                for chunk in content:
+                    response_bytes += len(chunk)
+                    yield chunk
+        finally:
+            registry.observe(self._view_name(request), request.method, time.perf_counter() - start, counter.count,
+                             counter.duration, response_bytes)
+
+    def _count_queries(self, counter):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        return stack
+
+    def _view_name(self, request):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return 'unresolved'
+        func = getattr(match.func, 'view_class', match.func)
+        return func.__name__
+
+
+class ReplicaRoutingMiddleware:
+    """ビューのreplica_max_lag(秒)をもとに、リクエスト中の読み取り先の条件を設定する
+
+    replica_max_lagを持つビューのGETだけがレプリカから読む。書き込みを行ったリクエストのレスポンスでは
+    Cookieと対象ユーザを記録し、REPLICA_PIN_SECONDSの間は同じクライアント・ユーザの読み取りをプライマリに送る。
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        reset_state()
+        try:
+            response = self.get_response(request)
+            if state.wrote:
+                if getattr(request, 'replica_user_id', None) is not None:
+                    pin(request.replica_user_id)
+                response.set_cookie(PIN_COOKIE, '1', max_age=getattr(settings, 'REPLICA_PIN_SECONDS', 30))
+            return response
+        finally:
+            reset_state()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, 'view_class', None)
+        max_lag = getattr(view_class, 'replica_max_lag', None) if request.method in SAFE_METHODS else None
+        request.replica_user_id = view_kwargs.get('user_id')
+        pinned = PIN_COOKIE in request.COOKIES or is_pinned(request.replica_user_id)
+        reset_state(max_lag, pinned)
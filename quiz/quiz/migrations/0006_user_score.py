@@ -0,0 +1,38 @@
+# Generated by Django 2.1 on 2026-10-18 10:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.functions
+import django.utils.timezone
+
+
+def build_user_scores(apps, schema_editor):
+    Answer = apps.get_model('quiz', 'Answer')
+    UserScore = apps.get_model('quiz', 'UserScore')
+    rows = Answer.objects.filter(is_deleted=False).values('user_id').annotate(
+        total=models.Count('answer_id'),
+        correct=models.Sum(models.functions.Cast('is_correct', models.IntegerField()))).order_by()
+    UserScore.objects.bulk_create(
+        [UserScore(user_id=row['user_id'], total_count=row['total'], correct_answer_count=row['correct'],
+                   correct_answer_rate=row['correct'] / row['total']) for row in rows.iterator()])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0005_auto_20191207_1255'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserScore',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='quiz.User')),
+                ('total_count', models.IntegerField(default=0)),
+                ('correct_answer_count', models.IntegerField(default=0)),
+                ('correct_answer_rate', models.FloatField(default=0)),
+                ('update_date', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(build_user_scores, migrations.RunPython.noop),
+    ]
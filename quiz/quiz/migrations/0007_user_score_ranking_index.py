@@ -0,0 +1,43 @@
+# Generated by Django 2.1 on 2026-10-18 10:14
+
+from django.db import migrations, models
+
+
+def fill_user_scores(apps, schema_editor):
+    User = apps.get_model('quiz', 'User')
+    UserScore = apps.get_model('quiz', 'UserScore')
+    scored = set(UserScore.objects.values_list('user_id', flat=True))
+    for user in User.objects.values('user_id', 'user_name').iterator():
+        if user['user_id'] in scored:
+            UserScore.objects.filter(user_id=user['user_id']).update(user_name=user['user_name'])
+        else:
+            UserScore.objects.create(user_id=user['user_id'], user_name=user['user_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0006_user_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userscore',
+            name='user_name',
+            field=models.CharField(default='', max_length=30),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_user_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='userscore',
+            index=models.Index(fields=['-correct_answer_rate', 'user_name'], name='userscore_rate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userscore',
+            index=models.Index(fields=['-correct_answer_count', 'user_name'], name='userscore_correct_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userscore',
+            index=models.Index(fields=['-total_count', 'user_name'], name='userscore_total_idx'),
+        ),
+    ]
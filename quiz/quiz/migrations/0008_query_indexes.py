@@ -0,0 +1,25 @@
+# Generated by Django 2.1 on 2026-10-18 10:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0007_user_score_ranking_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['user', 'is_deleted', 'challenge_count'], name='answer_user_challenge_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['is_deleted', 'user', 'is_correct'], name='answer_deleted_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['group', 'degree', 'is_deleted'], name='question_group_degree_idx'),
+        ),
+    ]
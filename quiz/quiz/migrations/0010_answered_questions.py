@@ -0,0 +1,27 @@
+# Generated by Django 2.1 on 2026-10-18 12:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0009_data_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnsweredQuestions',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.IntegerField()),
+                ('bits', models.BigIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='quiz.User')),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='answeredquestions',
+            unique_together={('user', 'word')},
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 2.1 on 2026-10-18 12:40
+
+from django.db import migrations, models
+
+
+def set_question_ratings(apps, schema_editor):
+    # 既存の問題は作成時の難易度から初期レーティングを決める(quiz.ratings.initial_rating)
+    Question = apps.get_model('quiz', 'Question')
+    for degree in (1, 2, 3):
+        Question.objects.filter(degree=degree).update(rating=1500.0 + (degree - 2) * 200.0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0010_answered_questions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='rating',
+            field=models.FloatField(default=1500.0),
+        ),
+        migrations.AddField(
+            model_name='userscore',
+            name='rating',
+            field=models.FloatField(default=1500.0),
+        ),
+        migrations.AddField(
+            model_name='userscore',
+            name='rating_change',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['group', 'is_deleted', 'rating'], name='question_group_rating_idx'),
+        ),
+        migrations.RunPython(set_question_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 2.1 on 2026-10-18 13:05
+
+from django.db import migrations, models
+import django.db.models.functions
+
+
+def fill_user_stats(apps, schema_editor):
+    # これまで更新されていなかった正答率・チャレンジ回数を回答テーブルから埋める
+    Answer = apps.get_model('quiz', 'Answer')
+    User = apps.get_model('quiz', 'User')
+    rows = Answer.objects.filter(is_deleted=False).values('user_id').annotate(
+        total=models.Count('answer_id'),
+        correct=models.Sum(models.functions.Cast('is_correct', models.IntegerField())),
+        challenge=models.Max('challenge_count')).order_by()
+    for row in rows.iterator():
+        User.objects.filter(user_id=row['user_id']).update(
+            correct_answer_rate=row['correct'] / row['total'], challenge_count=row['challenge'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0011_ratings'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['is_deleted', 'user_id'], name='user_deleted_id_idx'),
+        ),
+        migrations.RunPython(fill_user_stats, migrations.RunPython.noop),
+    ]
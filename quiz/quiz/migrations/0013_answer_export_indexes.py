@@ -0,0 +1,21 @@
+# Generated by Django 2.1 on 2026-10-18 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0012_user_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['is_deleted', 'create_date', 'answer_id'], name='answer_create_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['user', 'is_deleted', 'create_date', 'answer_id'], name='answer_user_create_date_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 2.1 on 2026-10-18 16:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0013_answer_export_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedAnswer',
+            fields=[
+                ('answer_id', models.UUIDField(primary_key=True, serialize=False)),
+                ('group_id', models.UUIDField()),
+                ('group_name', models.CharField(max_length=30)),
+                ('question_id', models.IntegerField()),
+                ('degree', models.IntegerField()),
+                ('answer', models.CharField(max_length=20)),
+                ('is_correct', models.BooleanField(default=False)),
+                ('challenge_count', models.IntegerField(default=0)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('create_date', models.DateTimeField()),
+                ('update_date', models.DateTimeField()),
+                ('archive_date', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='quiz.User')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ChallengeRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('challenge_count', models.IntegerField()),
+                ('total_count', models.IntegerField(default=0)),
+                ('correct_answer_count', models.IntegerField(default=0)),
+                ('group_name', models.CharField(max_length=30)),
+                ('degree', models.IntegerField()),
+                ('last_answer_date', models.DateTimeField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='quiz.User')),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='challengerollup',
+            unique_together={('user', 'challenge_count')},
+        ),
+        migrations.AddIndex(
+            model_name='archivedanswer',
+            index=models.Index(fields=['is_deleted', 'create_date', 'answer_id'], name='archived_create_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedanswer',
+            index=models.Index(fields=['user', 'is_deleted', 'create_date', 'answer_id'], name='archived_user_create_date_idx'),
+        ),
+    ]
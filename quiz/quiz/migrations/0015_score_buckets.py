@@ -0,0 +1,33 @@
+# Generated by Django 2.1 on 2026-10-18 17:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0014_answer_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreBucket',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('span', models.CharField(max_length=4)),
+                ('start', models.DateTimeField()),
+                ('answer_count', models.IntegerField(default=0)),
+                ('correct_count', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='quiz.User')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='scorebucket',
+            index=models.Index(fields=['start', 'user'], name='score_bucket_start_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='scorebucket',
+            unique_together={('user', 'span', 'start')},
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 2.1 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+
+def copy_is_deleted(apps, schema_editor):
+    UserScore = apps.get_model('quiz', 'UserScore')
+    UserScore.objects.filter(user__is_deleted=True).update(is_deleted=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0015_score_buckets'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='userscore',
+            name='userscore_rate_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='userscore',
+            name='userscore_correct_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='userscore',
+            name='userscore_total_idx',
+        ),
+        migrations.AddField(
+            model_name='userscore',
+            name='is_deleted',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(copy_is_deleted, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='userscore',
+            index=models.Index(fields=['is_deleted', '-correct_answer_rate', 'user_name'], name='userscore_rate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userscore',
+            index=models.Index(fields=['is_deleted', '-correct_answer_count', 'user_name'], name='userscore_correct_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userscore',
+            index=models.Index(fields=['is_deleted', '-total_count', 'user_name'], name='userscore_total_idx'),
+        ),
+    ]
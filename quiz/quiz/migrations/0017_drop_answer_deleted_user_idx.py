@@ -0,0 +1,17 @@
+# Generated by Django 2.1 on 2026-10-18 18:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0016_userscore_is_deleted'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='answer',
+            name='answer_deleted_user_idx',
+        ),
+    ]
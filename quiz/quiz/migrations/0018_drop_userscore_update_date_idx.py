@@ -0,0 +1,17 @@
+# Generated by Django 2.1 on 2026-10-18 18:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0017_drop_answer_deleted_user_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='userscore',
+            name='userscore_update_date_idx',
+        ),
+    ]
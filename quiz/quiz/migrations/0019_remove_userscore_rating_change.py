@@ -0,0 +1,17 @@
+# Generated by Django 2.1 on 2026-10-18 19:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0018_drop_userscore_update_date_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='userscore',
+            name='rating_change',
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 2.1 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+def copy_counts(apps, schema_editor):
+    # 成績集計(回答テーブルとアーカイブの集計)の件数を写す
+    User = apps.get_model('quiz', 'User')
+    UserScore = apps.get_model('quiz', 'UserScore')
+    scores = UserScore.objects.filter(user_id=models.OuterRef('user_id'))
+    User.objects.filter(user_id__in=UserScore.objects.filter(total_count__gt=0).values('user_id')).update(
+        total_count=models.Subquery(scores.values('total_count')[:1]),
+        correct_answer_count=models.Subquery(scores.values('correct_answer_count')[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0019_remove_userscore_rating_change'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='correct_answer_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='total_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(copy_counts, migrations.RunPython.noop),
+    ]
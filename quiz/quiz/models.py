@@ -10,12 +10,22 @@ class User(models.Model):
     user_name = models.CharField(max_length=30, unique=True, null=False)
     mail_address = models.EmailField(unique=True, max_length=100, null=False)
     authority = models.BooleanField(max_length=5, default=False, null=False)
+    # 回答登録時に更新する(quiz.aggregates)。ずれはreconcile_user_statsコマンドで修正する
     challenge_count = models.IntegerField(default=0, null=False)
     correct_answer_rate = models.FloatField(null=True)
+    # 正答率を回答登録時にUserScoreを読まずに求めるための件数
+    total_count = models.IntegerField(default=0, null=False)
+    correct_answer_count = models.IntegerField(default=0, null=False)
     is_deleted = models.BooleanField(default=False, null=False)
     create_date = models.DateTimeField(default=timezone.now, null=False)
     update_date = models.DateTimeField(default=timezone.now, null=False)
 
+    class Meta:
+        indexes = [
+            # ユーザ一覧(UserView.get)の絞り込みとキーセットページングの並び順
+            models.Index(fields=['is_deleted', 'user_id'], name='user_deleted_id_idx'),
+        ]
+
 
 class Group(models.Model):
     group_id = models.UUIDField(primary_key=True, default=uuid.uuid4, null=False)
@@ -38,10 +48,20 @@ class Question(models.Model):
     choice_2 = models.CharField(max_length=255, null=True)
     choice_3 = models.CharField(max_length=255, null=True)
     choice_4 = models.CharField(max_length=255, null=True)
+    # 回答をまとめて反映する難しさ(quiz.ratings.update_question_ratings)
+    rating = models.FloatField(default=1500.0, null=False)
     is_deleted = models.BooleanField(default=False, null=False)
     create_date = models.DateTimeField(default=timezone.now, null=False)
     update_date = models.DateTimeField(default=timezone.now, null=False)
 
+    class Meta:
+        indexes = [
+            # 問題IDプールの読み込み(QuestionView.get)
+            models.Index(fields=['group', 'degree', 'is_deleted'], name='question_group_degree_idx'),
+            # ユーザのレーティングに近い問題の範囲検索(QuestionView.getのadaptive)
+            models.Index(fields=['group', 'is_deleted', 'rating'], name='question_group_rating_idx'),
+        ]
+
 
 class Answer(models.Model):
     answer_id = models.UUIDField(primary_key=True, default=uuid.uuid4, null=False)
@@ -54,3 +74,114 @@ class Answer(models.Model):
     is_deleted = models.BooleanField(default=False, null=False)
     create_date = models.DateTimeField(default=timezone.now, null=False)
     update_date = models.DateTimeField(default=timezone.now, null=False)
+
+    class Meta:
+        indexes = [
+            # ユーザの成績取得(SelectUserRecordView)
+            models.Index(fields=['user', 'is_deleted', 'challenge_count'], name='answer_user_challenge_idx'),
+            # 回答履歴のエクスポート(quiz.exporter)のキーセット。ユーザ指定時は後者を使う
+            models.Index(fields=['is_deleted', 'create_date', 'answer_id'], name='answer_create_date_idx'),
+            models.Index(fields=['user', 'is_deleted', 'create_date', 'answer_id'], name='answer_user_create_date_idx'),
+        ]
+
+
+class UserScore(models.Model):
+    """ユーザごとの成績集計(回答登録時に更新する)"""
+    user = models.OneToOneField(User, primary_key=True, on_delete=models.CASCADE)
+    user_name = models.CharField(max_length=30, null=False)
+    total_count = models.IntegerField(default=0, null=False)
+    correct_answer_count = models.IntegerField(default=0, null=False)
+    correct_answer_rate = models.FloatField(default=0, null=False)
+    # 回答ごとに更新する実力(quiz.ratings)
+    rating = models.FloatField(default=1500.0, null=False)
+    # User.is_deletedの写し(quiz.signals.user_saved)。ランキングをUserと結合せずにインデックスの範囲で求めるため
+    is_deleted = models.BooleanField(default=False, null=False)
+    update_date = models.DateTimeField(default=timezone.now, null=False)
+
+    class Meta:
+        # ランキングの並び順(各指標の降順、同値はユーザ名の昇順)をそのまま辿れるようにする
+        indexes = [
+            models.Index(fields=['is_deleted', '-correct_answer_rate', 'user_name'], name='userscore_rate_idx'),
+            models.Index(fields=['is_deleted', '-correct_answer_count', 'user_name'], name='userscore_correct_idx'),
+            models.Index(fields=['is_deleted', '-total_count', 'user_name'], name='userscore_total_idx'),
+        ]
+
+
+class DataVersion(models.Model):
+    """リソースごとの更新回数(ETagに使う)。書き込み時にquiz.versions.bumpで加算する"""
+    key = models.CharField(max_length=100, primary_key=True)
+    version = models.BigIntegerField(default=0, null=False)
+
+
+class AnsweredQuestions(models.Model):
+    """ユーザごとの正解済みの問題のビットマップ(quiz.bitmaps)。question_idを63ビットごとの語に分け、1語を1行で保持する
+
+    回答登録時は該当する語にビットをORで立てるUPDATEのみを発行する。
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    word = models.IntegerField(null=False)
+    bits = models.BigIntegerField(default=0, null=False)
+
+    class Meta:
+        unique_together = (('user', 'word'),)
+
+
+class ArchivedAnswer(models.Model):
+    """保存期間を過ぎた回答と論理削除された回答(quiz.archive)。分析用にグループ名と難易度も持つ"""
+    answer_id = models.UUIDField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # 問題・グループの削除後も残すため、外部キーにしない
+    group_id = models.UUIDField(null=False)
+    group_name = models.CharField(max_length=30, null=False)
+    question_id = models.IntegerField(null=False)
+    degree = models.IntegerField(null=False)
+    answer = models.CharField(max_length=20, null=False)
+    is_correct = models.BooleanField(default=False, null=False)
+    challenge_count = models.IntegerField(default=0, null=False)
+    is_deleted = models.BooleanField(default=False, null=False)
+    create_date = models.DateTimeField(null=False)
+    update_date = models.DateTimeField(null=False)
+    archive_date = models.DateTimeField(default=timezone.now, null=False)
+
+    class Meta:
+        indexes = [
+            # 回答履歴のエクスポート(quiz.exporter)のキーセット
+            models.Index(fields=['is_deleted', 'create_date', 'answer_id'], name='archived_create_date_idx'),
+            models.Index(fields=['user', 'is_deleted', 'create_date', 'answer_id'],
+                         name='archived_user_create_date_idx'),
+        ]
+
+
+class ChallengeRollup(models.Model):
+    """アーカイブした回答(論理削除を除く)のユーザ・チャレンジ回数ごとの集計。成績取得で回答テーブルの集計と合算する"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    challenge_count = models.IntegerField(null=False)
+    total_count = models.IntegerField(default=0, null=False)
+    correct_answer_count = models.IntegerField(default=0, null=False)
+    # チャレンジ内の最後の回答(last_answer_date)のグループ名と難易度
+    group_name = models.CharField(max_length=30, null=False)
+    degree = models.IntegerField(null=False)
+    last_answer_date = models.DateTimeField(null=False)
+
+    class Meta:
+        unique_together = (('user', 'challenge_count'),)
+
+
+class ScoreBucket(models.Model):
+    """ユーザの時間帯ごとの回答数・正解数(quiz.buckets)。期間を指定したランキングで期間内のバケットを合算する"""
+    HOUR = 'hour'
+    DAY = 'day'
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # 回答登録時は1時間単位に加算し、日が変わった後に1日単位にまとめる
+    span = models.CharField(max_length=4, null=False)
+    start = models.DateTimeField(null=False)
+    answer_count = models.IntegerField(default=0, null=False)
+    correct_count = models.IntegerField(default=0, null=False)
+
+    class Meta:
+        unique_together = (('user', 'span', 'start'),)
+        indexes = [
+            # 期間の開始日時以降のバケットを範囲検索する
+            models.Index(fields=['start', 'user'], name='score_bucket_start_idx'),
+        ]
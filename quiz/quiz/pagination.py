@@ -0,0 +1,25 @@
+import base64
+import binascii
+import json
+
+
+def encode_cursor(value):
+    """ページの最後のキーを不透明なカーソル文字列にする"""
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """カーソル文字列をキーに戻す。不正な場合はValueError"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode())
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(e)
+
+
+def paginate(queryset, key, limit, after=None):
+    """keyの昇順でafterより後ろをlimit件取得し、(rows, 次ページのカーソル)を返す(OFFSETを使わない)"""
+    if after is not None:
+        queryset = queryset.filter(**{key + '__gt': after})
+    rows = list(queryset.order_by(key)[:limit + 1])
+    next_cursor = encode_cursor(rows[limit - 1][key]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
@@ -0,0 +1,15 @@
+import hmac
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+
+class IsAdminToken(BasePermission):
+    """Authorization: Token <settings.ADMIN_TOKEN> を指定したリクエストのみ許可する(ADMIN_TOKEN未設定の場合は全て拒否)"""
+
+    def has_permission(self, request, view):
+        token = getattr(settings, 'ADMIN_TOKEN', None)
+        if not token:
+            return False
+        scheme, _, value = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+        return scheme == 'Token' and hmac.compare_digest(value.encode(), token.encode())
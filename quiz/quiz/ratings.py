@@ -0,0 +1,155 @@
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import ExpressionWrapper, F, FloatField, Value
+from django.utils import timezone
+
+from .caches import QUESTION_FIELDS
+from .models import Answer, DataVersion, Question, UserScore
+from .versions import ANSWER_KEYS, bump
+
+INITIAL_RATING = 1500.0
+# adaptiveで取得件数の何倍の候補をレーティングの近い順に読むか(毎回同じ問題にならないよう候補から選ぶ)
+CANDIDATE_FACTOR = 3
+# 問題作成時の難易度(degree 1〜3)ごとの初期レーティングの差
+DEGREE_RATING_STEP = 200.0
+# 問題のレーティングに反映済みの回答の範囲(quiz.ratings.update_question_ratings)
+QUESTION_RATINGS = 'ratings:questions'
+RATING_BATCH_SIZE = 500
+# 問題のレーティングに1回のトランザクションで反映する回答数
+RATING_CHUNK_SIZE = 5000
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def initial_rating(degree):
+    """難易度から問題の初期レーティングを求める(degree 2が平均的なユーザと同程度)"""
+    return INITIAL_RATING + (int(degree) - 2) * DEGREE_RATING_STEP
+
+
+def expected_score(question_rating, user_rating):
+    """期待正答率 E = 1 / (1 + 10^((問題 - ユーザ) / 400))"""
+    return 1.0 / (1.0 + 10.0 ** ((question_rating - user_rating) / 400.0))
+
+
+def user_rating_increment(results):
+    """回答結果[(問題のレーティング, 正誤)]からユーザのレーティング(Elo)の更新式を返す
+
+    ユーザに K * Σ(正誤 - E) を加える。問題のレーティングはキャッシュ済みの値を使い、
+    ユーザのレーティングは更新式の中で参照するため、SELECTせずUPDATE 1回で済む。
+    同じレーティングの問題はまとめ、件数に比例して式が長くならないようにする。
+    """
+    k = getattr(settings, 'RATING_K', 32)
+    counts = Counter(question_rating for question_rating, _ in results)
+    correct = sum(1 for _, is_correct in results if is_correct)
+    increment = F('rating') + k * correct
+    for question_rating, count in counts.items():
+        increment -= k * count / (1.0 + Value(10.0) ** ((question_rating - F('rating')) / 400.0))
+    return ExpressionWrapper(increment, output_field=FloatField())
+
+
+def initial_user_rating(results):
+    """成績集計の作成時(初回の回答)のユーザのレーティング"""
+    k = getattr(settings, 'RATING_K', 32)
+    return INITIAL_RATING + sum(k * ((1.0 if is_correct else 0.0) - expected_score(question_rating, INITIAL_RATING))
+                                for question_rating, is_correct in results)
+
+
+def update_question_ratings(lag, now=None, chunk_size=RATING_CHUNK_SIZE):
+    """前回の実行からnow - lagまでに登録された回答を、問題のレーティングにまとめて反映する
+
+    回答登録のたびに問題の行を更新すると同じ問題への回答がロックを待ち合うため、定期的に実行して問題ごとに
+    -K * Σ(正誤 - E) を1回のUPDATEで加える。Eは反映時点のユーザ・問題のレーティングで求める。
+    反映済みの範囲はDataVersion(QUESTION_RATINGS)にエポックからのマイクロ秒で残す。lagは実行時点で
+    コミットされていない回答を読み飛ばさないための猶予。初回は範囲を記録するだけで過去の回答は反映しない。
+    回答は(create_date, answer_id)の順にchunk_size件ずつ別のトランザクションで反映し、範囲もチャンクごとに進めるため、
+    溜まった回答が多くてもメモリと範囲の行のロックを持つ時間はチャンクの件数で決まる。反映した回答数を返す。
+    """
+    cutoff = (now or timezone.now()) - lag
+    position = _position(cutoff)
+    applied = 0
+    while True:
+        with transaction.atomic():
+            watermark = DataVersion.objects.select_for_update().filter(key=QUESTION_RATINGS).first()
+            if watermark is None:
+                try:
+                    with transaction.atomic():
+                        DataVersion.objects.create(key=QUESTION_RATINGS, version=position)
+                except IntegrityError:
+                    # 同時に別の実行が初期化した場合
+                    pass
+                return applied
+            if watermark.version >= position:
+                return applied
+
+            answers = Answer.objects.filter(is_deleted=False, create_date__lte=cutoff,
+                                            create_date__gt=EPOCH + timedelta(microseconds=watermark.version))
+            fields = ('create_date', 'user_id', 'question_id', 'is_correct')
+            rows = list(answers.order_by('create_date', 'answer_id').values_list(*fields)[:chunk_size])
+            reached = position
+            if len(rows) == chunk_size:
+                # 範囲は日時で進めるため、最後の日時の回答は次のチャンクで同じ日時の回答とまとめて反映する
+                last = rows[-1][0]
+                rows = [row for row in rows if row[0] < last]
+                reached = _position(last) - 1
+                if not rows:
+                    # chunk_size件以上が同じ日時の場合は、その日時の回答をまとめて反映する
+                    rows = list(answers.filter(create_date=last).values_list(*fields))
+                    reached = _position(last)
+
+            _apply_question_ratings(rows)
+            DataVersion.objects.filter(key=QUESTION_RATINGS).update(version=reached)
+        applied += len(rows)
+
+
+def _apply_question_ratings(rows):
+    user_ratings = _ratings(UserScore, {user_id for _, user_id, _, _ in rows})
+    question_ratings = _ratings(Question, {question_id for _, _, question_id, _ in rows})
+
+    k = getattr(settings, 'RATING_K', 32)
+    changes = defaultdict(float)
+    for _, user_id, question_id, is_correct in rows:
+        if question_id not in question_ratings:
+            continue
+        expected = expected_score(question_ratings[question_id], user_ratings.get(user_id, INITIAL_RATING))
+        changes[question_id] -= k * ((1.0 if is_correct else 0.0) - expected)
+
+    for question_id, change in changes.items():
+        Question.objects.filter(question_id=question_id).update(rating=F('rating') + change)
+    if changes:
+        # 各プロセスの正解のキャッシュ(AnswerKey.rating)を読み直させる
+        bump(ANSWER_KEYS)
+
+
+def _position(date):
+    return (date - EPOCH) // timedelta(microseconds=1)
+
+
+def _ratings(model, pks):
+    ratings = dict()
+    pks = list(pks)
+    # IN句の要素数の上限(SQLiteは999)を超えないよう分けて読む
+    for i in range(0, len(pks), RATING_BATCH_SIZE):
+        ratings.update(model.objects.filter(pk__in=pks[i:i + RATING_BATCH_SIZE]).values_list('pk', 'rating'))
+    return ratings
+
+
+def user_rating(user_id):
+    rating = UserScore.objects.filter(user_id=user_id).values_list('rating', flat=True).first()
+    return INITIAL_RATING if rating is None else rating
+
+
+def questions_near(group_id, rating, count):
+    """グループの問題からレーティングがratingに近い順にcount * CANDIDATE_FACTOR件を返す
+
+    ratingの上側・下側をそれぞれインデックスの範囲検索で読み、近いものから選ぶ。
+    """
+    limit = count * CANDIDATE_FACTOR
+    questions = Question.objects.filter(group_id=group_id, is_deleted=False).values(*QUESTION_FIELDS, 'rating')
+    above = list(questions.filter(rating__gte=rating).order_by('rating')[:limit])
+    below = list(questions.filter(rating__lt=rating).order_by('-rating')[:limit])
+    rows = sorted(above + below, key=lambda row: abs(row['rating'] - rating))[:limit]
+    for row in rows:
+        del row['rating']
+    return rows
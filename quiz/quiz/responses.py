@@ -0,0 +1,42 @@
+import datetime
+import decimal
+import json
+import uuid
+
+from django.db.models.query import QuerySet
+from django.http import HttpResponse
+
+
+def _default(obj):
+    # DRFのJSONEncoderと同じ表現にする(レスポンスボディを変えないため)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, QuerySet):
+        return tuple(obj)
+    if isinstance(obj, datetime.datetime):
+        representation = obj.isoformat()
+        if representation.endswith('+00:00'):
+            representation = representation[:-6] + 'Z'
+        return representation
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(obj).__name__))
+
+
+# DRFのJSONRenderer(UNICODE_JSON, COMPACT_JSON, STRICT_JSONが既定値の場合)と同じ設定
+_encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(',', ':'), default=_default)
+
+
+def encode_json(data):
+    return _encoder.encode(data).replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode()
+
+
+class JSONDataResponse(HttpResponse):
+    """DRFのコンテンツネゴシエーション・レンダラを通さずにJSONを書き出すレスポンス
+
+    ボディはDRFのResponseと同じ。呼び出し元から参照できるよう元のデータをdataに保持する。
+    """
+
+    def __init__(self, data, status=200):
+        super().__init__(encode_json(data), content_type='application/json', status=status)
+        self.data = data
@@ -0,0 +1,105 @@
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+from .caches import LRUCache
+
+PRIMARY = 'default'
+
+# リクエスト中の読み取り先の条件(ReplicaRoutingMiddlewareが設定する)
+state = threading.local()
+
+
+def reset_state(max_lag=None, pinned=False):
+    """max_lag秒までの遅延を許容してレプリカから読む。Noneの場合とpinned=Trueの場合はプライマリから読む"""
+    state.max_lag = max_lag
+    state.pinned = pinned
+    state.wrote = False
+
+
+class ReplicaLagMonitor:
+    """レプリカごとの遅延(秒)をinterval秒間保持する。確認できない場合はNone"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lags = dict()
+        self._lock = threading.Lock()
+
+    def lag(self, alias):
+        entry = self._lags.get(alias)
+        if entry is None or entry[0] < time.monotonic():
+            self.record(alias, self.measure(alias))
+            entry = self._lags[alias]
+        return entry[1]
+
+    def record(self, alias, lag):
+        with self._lock:
+            self._lags[alias] = (time.monotonic() + self.interval, lag)
+
+    def measure(self, alias):
+        connection = connections[alias]
+        if connection.vendor != 'mysql':
+            # SQLiteなどレプリケーションの無いDB(テスト・ローカル用)は遅延無しとする
+            return 0
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SHOW SLAVE STATUS')
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                columns = [column[0] for column in cursor.description]
+        except DatabaseError:
+            return None
+        return dict(zip(columns, row)).get('Seconds_Behind_Master')
+
+    def invalidate(self):
+        with self._lock:
+            self._lags.clear()
+
+
+lag_monitor = ReplicaLagMonitor(getattr(settings, 'REPLICA_LAG_CHECK_INTERVAL', 1))
+
+# 書き込みを行ったユーザID(URLのuser_id)と時刻。REPLICA_PIN_SECONDSの間はプライマリから読む
+recent_writes = LRUCache(getattr(settings, 'KNOWN_KEY_CACHE_SIZE', 10000))
+
+
+def is_pinned(user_id):
+    written_at = recent_writes.get(user_id) if user_id is not None else None
+    return written_at is not None and time.monotonic() - written_at < getattr(settings, 'REPLICA_PIN_SECONDS', 30)
+
+
+def pin(user_id):
+    recent_writes.set(user_id, time.monotonic())
+
+
+class ReplicaRouter:
+    """読み取り専用として指定されたビューの読み取りを、許容する遅延以内のレプリカに振り分ける
+
+    書き込みと、書き込み後のread-your-writes(同じリクエスト内、または同じユーザへの書き込みから一定時間)は
+    プライマリに送る。条件を満たすレプリカが無い場合もプライマリから読む。
+    """
+
+    def db_for_read(self, model, **hints):
+        max_lag = getattr(state, 'max_lag', None)
+        if max_lag is None or state.pinned or state.wrote:
+            return PRIMARY
+
+        replicas = list(getattr(settings, 'REPLICA_DATABASES', ()))
+        random.shuffle(replicas)
+        for alias in replicas:
+            lag = lag_monitor.lag(alias)
+            if lag is not None and lag <= max_lag:
+                return alias
+        return PRIMARY
+
+    def db_for_write(self, model, **hints):
+        if hasattr(state, 'wrote'):
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # レプリカはプライマリの複製のため、同じDBとして扱う
+        return True
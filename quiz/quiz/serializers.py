@@ -3,8 +3,14 @@ from rest_framework import serializers
 from rest_framework.compat import MinValueValidator, MaxValueValidator
 from rest_framework.exceptions import ValidationError
 from quiz.models import Question, User, Group, Answer
+from quiz.caches import answer_keys, known_groups, known_users
+from quiz.exporter import parse_export_cursor
+from quiz.buckets import WINDOWS
+from quiz.pagination import decode_cursor
 import uuid
 
+DEFAULT_PAGE_SIZE = 100
+
 
 class AnswerSerializer(serializers.Serializer):
     answer_cd = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -13,6 +19,23 @@ class AnswerSerializer(serializers.Serializer):
     answer = models.CharField(max_length=6)
 
 
+class PageValidateSerializer(serializers.Serializer):
+    """ページング(limit, cursor)用シリアライザー"""
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=1000)
+    cursor = serializers.CharField(required=False)
+
+    def validate_cursor(self, value):
+        try:
+            return decode_cursor(value)
+        except ValueError:
+            raise ValidationError(detail="cursor is invalid.")
+
+    def validate(self, attrs):
+        if 'cursor' in attrs and 'limit' not in attrs:
+            attrs['limit'] = DEFAULT_PAGE_SIZE
+        return attrs
+
+
 class RegisterGroupValidateSerializer(serializers.ModelSerializer):
     """グループ登録用シリアライザー"""
     class Meta:
@@ -42,30 +65,74 @@ class GetUserValidateSerializer(serializers.Serializer):
     user_id = serializers.CharField(max_length=28)
 
 
-class RegisterUserAnswerValidateSerializer(serializers.ModelSerializer):
-    """指定したユーザの回答登録用シリアライザー"""
-    class Meta:
-        model = Answer
-        fields = (
-            'user',
-            'question',
-            'group',
-            'answer',
-            'is_correct',
-            'challenge_count'
-        )
+class RegisterUserAnswerValidateSerializer(serializers.Serializer):
+    """指定したユーザの回答登録用シリアライザー(外部キーと正解はキャッシュで確認する)"""
+    user = serializers.CharField(max_length=28)
+    question = serializers.IntegerField()
+    group = serializers.UUIDField()
+    answer = serializers.CharField(max_length=20)
+    challenge_count = serializers.IntegerField()
+
+    def validate_user(self, value):
+        if not known_users.exists(value):
+            raise ValidationError(detail="user_id is not found. user_id={}".format(value))
+        return value
+
+    def validate_question(self, value):
+        key = answer_keys.get(value)
+        if key is None or key.is_deleted:
+            raise ValidationError(detail="question_id is not found. question_id={}".format(value))
+        return value
+
+    def validate_group(self, value):
+        if not known_groups.exists(value):
+            raise ValidationError(detail="group_id is not found. group_id={}".format(value))
+        return value
+
+    def validate(self, data):
+        # 採点と同じ正解で確認するため、確認に使った正解を返す(確認後に問題が削除されても採点できる)
+        key = answer_keys.get(data['question'])
+        if key is None or key.is_deleted:
+            raise ValidationError(detail="question_id is not found. question_id={}".format(data['question']))
+        if key.group_id != data['group']:
+            raise ValidationError(detail="question_id is not in group_id. question_id={}, group_id={}".format(
+                data['question'], data['group']))
+        data['answer_key'] = key
+        return data
+
+
+class UserAnswerItemValidateSerializer(serializers.Serializer):
+    """一括回答登録の1回答分のシリアライザー"""
+    question_id = serializers.IntegerField()
+    group_id = serializers.UUIDField()
+    answer = serializers.CharField(max_length=20)
+
+
+class RegisterUserAnswersValidateSerializer(serializers.Serializer):
+    """指定したユーザの一括回答登録用シリアライザー(外部キーの存在チェックはビューでまとめて行う)"""
+    user_id = serializers.CharField(max_length=28)
+    challenge_count = serializers.IntegerField()
+    answers = UserAnswerItemValidateSerializer(many=True, allow_empty=False)
 
 
 class GetQuestionValidateSerializer(serializers.Serializer):
     """問題取得用シリアライザー"""
     group_id = serializers.UUIDField(required=True)
     limit = serializers.IntegerField(required=False)
-    degree = serializers.IntegerField(required=True, validators=[MinValueValidator(1), MaxValueValidator(3)])
-
-    def validate_group_id(self, value):
-        if not Question.objects.filter(group=value).values().exists():
-            raise ValidationError(detail="group_id is not found. group_id={}".format(value))
-        return value
+    degree = serializers.IntegerField(required=False, allow_null=True,
+                                      validators=[MinValueValidator(1), MaxValueValidator(3)])
+    user_id = serializers.CharField(max_length=28, required=False)
+    # prefer: 正解済みの問題を後回しにする、only: 正解済みの問題を出題しない
+    unseen = serializers.ChoiceField(choices=('prefer', 'only'), required=False)
+    # ユーザのレーティングに近い問題を選ぶ(degreeは不要)
+    adaptive = serializers.BooleanField(required=False)
+
+    def validate(self, data):
+        if data.get('degree') is None and not data.get('adaptive'):
+            raise ValidationError(detail={'degree': ["This field is required."]})
+        if (data.get('unseen') or data.get('adaptive')) and not data.get('user_id'):
+            raise ValidationError(detail={'user_id': ["user_id is required when unseen or adaptive is specified."]})
+        return data
 
 
 class RegisterQuestionValidateSerializer(serializers.ModelSerializer):
@@ -87,12 +154,70 @@ class RegisterQuestionValidateSerializer(serializers.ModelSerializer):
         )
 
 class RankingValidateSerializer(serializers.Serializer):
-    sorted = serializers.ChoiceField(choices=['currect', 'count', 'rate'], default='rate')
+    """ランキング取得用シリアライザー"""
+    sorted = serializers.ChoiceField(choices=['currect', 'correct', 'count', 'rate'], default='rate')
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=1000)
+    offset = serializers.IntegerField(required=False, min_value=0, default=0)
+    window = serializers.ChoiceField(choices=WINDOWS, required=False)
 
     def validate_sorted(self, value):
-        if value == 'currect':
+        if value in ('currect', 'correct'):
             return 'correct_answer_count'
         if value == 'count':
             return 'total_count'
         if value == 'rate':
             return 'correct_answer_rate'
+
+
+class UserRankValidateSerializer(serializers.Serializer):
+    """指定したユーザの順位取得用シリアライザー"""
+    user_id = serializers.CharField(max_length=28)
+    sorted = serializers.ChoiceField(choices=['currect', 'correct', 'count', 'rate'], default='rate')
+    neighbors = serializers.IntegerField(required=False, min_value=0, max_value=50, default=2)
+
+    validate_sorted = RankingValidateSerializer.validate_sorted
+
+
+class ImportUserRowSerializer(serializers.Serializer):
+    """ユーザ一括登録の1行分(一意性はquiz.importerでバッチごとにまとめて確認する)"""
+    user_id = serializers.CharField(max_length=28)
+    user_name = serializers.CharField(max_length=30)
+    mail_address = serializers.EmailField(max_length=100)
+    authority = serializers.BooleanField(required=False, default=False)
+
+
+class ImportGroupRowSerializer(serializers.Serializer):
+    """グループ一括登録の1行分"""
+    group_id = serializers.UUIDField(required=False)
+    group_name = serializers.CharField(max_length=30)
+
+
+class ImportQuestionRowSerializer(serializers.Serializer):
+    """問題一括登録の1行分(group_id、user_idの存在はquiz.importerで読み込み済みのキーと照合する)"""
+    group_id = serializers.UUIDField()
+    user_id = serializers.CharField(max_length=28)
+    question_type = serializers.ChoiceField(choices=('input', 'select'), required=False, default='select')
+    degree = serializers.IntegerField(min_value=1, max_value=3)
+    question = serializers.CharField(max_length=255)
+    shape_path = serializers.URLField(required=False, allow_null=True)
+    correct = serializers.CharField(max_length=255)
+    choice_1 = serializers.CharField(max_length=255, required=False, allow_null=True)
+    choice_2 = serializers.CharField(max_length=255, required=False, allow_null=True)
+    choice_3 = serializers.CharField(max_length=255, required=False, allow_null=True)
+    choice_4 = serializers.CharField(max_length=255, required=False, allow_null=True)
+
+
+class ExportAnswersValidateSerializer(serializers.Serializer):
+    """回答履歴のエクスポート用シリアライザー(untilは含まない)"""
+    # formatはDRFがレンダラーの選択に使うため別の名前にする
+    file_format = serializers.ChoiceField(choices=('csv', 'jsonl'), required=False, default='jsonl')
+    user_id = serializers.CharField(max_length=28, required=False)
+    since = serializers.DateTimeField(required=False, input_formats=['iso-8601', '%Y-%m-%d'])
+    until = serializers.DateTimeField(required=False, input_formats=['iso-8601', '%Y-%m-%d'])
+    cursor = serializers.CharField(required=False)
+
+    def validate_cursor(self, value):
+        try:
+            return parse_export_cursor(value)
+        except ValueError:
+            raise ValidationError(detail="cursor is invalid.")
@@ -0,0 +1,79 @@
+from django.core.signals import request_finished, request_started
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .aggregates import record_answers
+from .caches import answer_keys, known_groups, known_users
+from .connections import check_connections, mark_released
+from .versions import ANSWER_KEYS, KNOWN_GROUPS, KNOWN_USERS, RANKING, bump, questions_key
+from .models import Answer, Group, Question, User, UserScore
+
+
+@receiver(post_save, sender=Answer)
+def answer_created(sender, instance, created, **kwargs):
+    """回答登録時に成績集計を更新する(bulk_createでは呼ばれないため個別にrecord_answersを呼ぶこと)"""
+    if created:
+        record_answers([instance])
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    """ランキング用の成績集計行をユーザと同時に作成し、ユーザ名と削除フラグを同期する"""
+    if created:
+        UserScore.objects.create(user_id=instance.user_id, user_name=instance.user_name,
+                                 is_deleted=instance.is_deleted)
+    else:
+        UserScore.objects.filter(user_id=instance.user_id).update(user_name=instance.user_name,
+                                                                  is_deleted=instance.is_deleted,
+                                                                  update_date=timezone.now())
+    bump(RANKING)
+
+
+@receiver(pre_save, sender=Question)
+def question_saving(sender, instance, **kwargs):
+    """更新前の(group_id, degree)を残す(変更された場合は変更前の出題対象からも外れるため)"""
+    if instance._state.adding:
+        return
+    instance._previous_pool = Question.objects.filter(pk=instance.pk).values_list('group_id', 'degree').first()
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def question_changed(sender, instance, **kwargs):
+    """問題の変更時に正解のキャッシュを破棄し、変更前後の出題対象の更新回数を加算する"""
+    answer_keys.invalidate(instance.question_id)
+    if not kwargs.get('created'):
+        # 登録時は他プロセスのキャッシュに古い正解が無いため、更新・削除時のみ破棄させる
+        bump(ANSWER_KEYS)
+    keys = {questions_key(instance.group_id, instance.degree)}
+    previous = getattr(instance, '_previous_pool', None)
+    if previous is not None:
+        keys.add(questions_key(*previous))
+    # 同時に更新するトランザクション同士がデッドロックしないよう、同じ順に加算する
+    for key in sorted(keys):
+        bump(key)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    known_users.invalidate(instance.user_id)
+    bump(KNOWN_USERS)
+    bump(RANKING)
+
+
+@receiver(post_delete, sender=Group)
+def group_deleted(sender, instance, **kwargs):
+    known_groups.invalidate(instance.group_id)
+    bump(KNOWN_GROUPS)
+
+
+@receiver(request_started)
+def request_started_check_connections(sender, **kwargs):
+    """一定時間使われていない永続接続をリクエストの処理前に確認する"""
+    check_connections()
+
+
+@receiver(request_finished)
+def request_finished_mark_connections(sender, **kwargs):
+    mark_released()
@@ -0,0 +1,42 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+# 1回のfetchで読み込む件数(.iterator()のchunk_size)と、1回に書き出す件数
+STREAM_CHUNK_SIZE = 500
+
+
+def is_stream(request):
+    """?stream=1(またはtrue)の場合はストリーミングで返す"""
+    return request.GET.get('stream', '').lower() in ('1', 'true')
+
+
+def iter_json_array(rows, transform=None, chunk_size=STREAM_CHUNK_SIZE):
+    """rowsを1件ずつJSONにし、chunk_size件ごとに配列の一部として返す"""
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    yield '['
+    buffer = list()
+    first = True
+    for row in rows:
+        if transform is not None:
+            row = transform(row)
+        buffer.append(encoder.encode(row))
+        if len(buffer) >= chunk_size:
+            yield ('' if first else ',') + ','.join(buffer)
+            first = False
+            buffer = list()
+    if buffer:
+        yield ('' if first else ',') + ','.join(buffer)
+    yield ']'
+
+
+def stream_json(queryset, transform=None, chunk_size=STREAM_CHUNK_SIZE):
+    """querysetを.iterator()でchunk_size件ずつ読み込み、JSON配列として逐次書き出すレスポンスを返す
+
+    全件のリストやレンダリング結果をメモリに持たないため、件数によらずワーカーのメモリ使用量が一定になる。
+    """
+    # レスポンスの書き出しはビューの処理後に行われるため、読み取り先のDBをここで確定させる
+    rows = queryset.using(queryset.db).iterator(chunk_size=chunk_size)
+    return StreamingHttpResponse((chunk.encode() for chunk in iter_json_array(rows, transform, chunk_size)),
+                                 content_type='application/json')
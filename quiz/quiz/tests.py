@@ -1,10 +1,42 @@
+import json
+import os
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
 import re
+import tempfile
+from io import StringIO
 import datetime
-from django.test import TestCase
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, connections
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIRequestFactory
 
-from quiz.models import Group, User, Answer, Question
-from quiz.views import GroupView, UserView, SelectUserAnswerView, QuestionView, SelectUserRecordView, RankingView
+from quiz.aggregates import answered_questions, rebuild_user_scores
+from quiz.archive import archive_answers
+from quiz.buckets import rebuild_score_buckets, rollup_score_buckets, window_start
+from quiz.backends.pool import ConnectionPool, PoolTimeout
+from quiz.caches import AnswerKeyCache, KnownKeyCache, answer_keys, known_groups, question_pool, warm_up
+from quiz.connections import stats as connection_stats
+from quiz.exporter import export_answers
+from quiz.metrics import MetricsRegistry, registry
+from quiz.ratings import questions_near, update_question_ratings
+from quiz.routers import lag_monitor, recent_writes
+from quiz.streaming import iter_json_array
+from quiz.versions import ANSWER_KEYS, KNOWN_USERS, RANKING, bump, get_version, questions_key
+from quiz.models import Group, User, Answer, AnsweredQuestions, ArchivedAnswer, ChallengeRollup, Question, \
+    ScoreBucket, UserScore
+from quiz.views import GroupView, UserView, SelectUserView, SelectUserAnswerView, QuestionView, SelectUserRecordView, \
+    RankingView, SelectUserRankView, SelectUserAnswersBatchView
 
 factory = APIRequestFactory()
 UUID_PATTERN = '[a-f0-9]{8}-?[a-f0-9]{4}-?4[a-f0-9]{3}-?[89ab][a-f0-9]{3}-?[a-f0-9]{12}'
@@ -37,6 +69,14 @@ class TestGroup(TestCase):
         self.assertEqual(type(datetime.datetime.today()), type(record1['update_date']))
 
 
+    def test_get_group_body(self):
+        """GETのボディはDRFのJSONRendererと同じ"""
+        response = GroupView.as_view()(factory.get('/groups'))
+        expected = Group.objects.filter(is_deleted=False).values('group_id', 'group_name')
+
+        self.assertEqual('application/json', response['Content-Type'])
+        self.assertEqual(JSONRenderer().render(expected), response.content)
+
     def test_get_group_not_found(self):
         """GETの異常系(レコードが存在しない場合)"""
         Group.objects.all().delete()
@@ -49,6 +89,26 @@ class TestGroup(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
+    def test_get_group_page(self):
+        """GETの正常系(キーセットページング)"""
+        Group.objects.create(group_name='名前0', is_deleted=False)
+        get_groups = GroupView.as_view()
+        response = get_groups(factory.get('/groups', data=dict(limit=2)))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(['名前0', '名前1'], [r['group_name'] for r in response.data['results']])
+        self.assertIsNotNone(response.data['next_cursor'])
+
+        response = get_groups(factory.get('/groups', data=dict(limit=2, cursor=response.data['next_cursor'])))
+        self.assertEqual(['名前2'], [r['group_name'] for r in response.data['results']])
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_get_group_page_invalid_cursor(self):
+        """GETの異常系(不正なカーソル)"""
+        response = GroupView.as_view()(factory.get('/groups', data=dict(limit=2, cursor='!!!')))
+
+        self.assertEqual(400, response.status_code)
+
     def test_post_group_success(self):
         """POST正常系"""
 
@@ -119,6 +179,34 @@ class TestUser(TestCase):
         self.assertEqual(type(datetime.datetime.today()), type(record1['create_date']))
         self.assertEqual(type(datetime.datetime.today()), type(record1['update_date']))
 
+    def test_get_user_page(self):
+        """GETの正常系(キーセットページング)"""
+        get_users = UserView.as_view()
+        response = get_users(factory.get('/users', data=dict(limit=1)))
+        self.assertEqual(["1" * 28], [r['user_id'] for r in response.data['results']])
+
+        response = get_users(factory.get('/users', data=dict(limit=1, cursor=response.data['next_cursor'])))
+        self.assertEqual(["3" * 28], [r['user_id'] for r in response.data['results']])
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_get_user_stream(self):
+        """GETの正常系(ストリーミング)"""
+        response = UserView.as_view()(factory.get('/users', data=dict(stream=1)))
+
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content).decode())
+        self.assertEqual(["1" * 28, "3" * 28], sorted(r['user_id'] for r in data))
+        self.assertEqual('ユーザ1', [r for r in data if r['user_id'] == "1" * 28][0]['user_name'])
+
+    def test_iter_json_array(self):
+        """chunk_size件ごとに書き出しても全体で1つのJSON配列になる"""
+        for count in (0, 1, 2, 5):
+            rows = [dict(id=i, name='名前{}'.format(i)) for i in range(count)]
+            chunks = list(iter_json_array(iter(rows), chunk_size=2))
+            self.assertEqual(rows, json.loads(''.join(chunks)))
+            self.assertEqual(2 + (count + 1) // 2, len(chunks))
+
     def test_get_user_not_found(self):
         """GETの異常系(not found)"""
         User.objects.all().delete()
@@ -232,6 +320,16 @@ class TestSelectUser(TestCase):
         self.assertEqual(type(datetime.datetime.today()), type(record['create_date']))
         self.assertEqual(type(datetime.datetime.today()), type(record['update_date']))
 
+    def test_get_user_body(self):
+        """GETのボディはDRFのJSONRendererと同じ"""
+        obj = User.objects.get(user_name='ユーザ3')
+        response = SelectUserView.as_view()(factory.get('/users/{}'.format(obj.user_id)), obj.user_id)
+        expected = dict(user_id=obj.user_id, user_name=obj.user_name, mail_address=obj.mail_address,
+                        authority=obj.authority, challenge_count=obj.challenge_count)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(JSONRenderer().render(expected), response.content)
+
     def test_get_user_bad_request(self):
         """GETの異常系(bad request)"""
 
@@ -377,6 +475,34 @@ class TestSelectUserRecord(TestCase):
         self.assertEqual('100.0', detail[2].get('correct_answer_rate'))
         self.assertEqual(group2.group_name, detail[2].get('group_name'))
 
+    def test_get_user_page(self):
+        """GETの正常系(detailのページング)"""
+        user = User.objects.get(user_name='ユーザ1')
+        get_answers = SelectUserRecordView.as_view()
+
+        response = get_answers(factory.get('/users/{}/record'.format(user.user_id), data=dict(limit=2)), user.user_id)
+        data = response.data
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(5, data.get('total_count'))
+        self.assertEqual('80.0', data.get('correct_answer_rate'))
+        self.assertEqual([1, 2], [d['challenge_count'] for d in data['detail']])
+        self.assertEqual('50.0', data['detail'][1]['correct_answer_rate'])
+
+        response = get_answers(factory.get('/users/{}/record'.format(user.user_id),
+                                           data=dict(limit=2, cursor=data['next_cursor'])), user.user_id)
+        self.assertEqual([3], [d['challenge_count'] for d in response.data['detail']])
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_get_user_deleted_answers_only(self):
+        """GETの異常系(削除済みの回答しか存在しない場合)"""
+        user = User.objects.get(user_name='ユーザ1')
+        Answer.objects.filter(user_id=user.user_id).update(is_deleted=True)
+
+        request = factory.get('/users/{}/record'.format(user.user_id))
+        response = SelectUserRecordView.as_view()(request, user.user_id)
+
+        self.assertEqual(response.status_code, 404)
+
     def test_get_user_not_found(self):
         """GETの異常系(not found)"""
         user = User.objects.get(user_name='ユーザ1')
@@ -422,7 +548,7 @@ class TestSelectUserAnswer(TestCase):
     def test_post_user_answer_success_true(self):
         """POST正常系(resultがtrue)"""
         user = User.objects.get(user_name='ユーザ1')
-        group = Group.objects.get(group_name='名前3')
+        group = Group.objects.get(group_name='名前2')
         question = Question.objects.get()
         body = dict(
             question_id=question.question_id,
@@ -451,7 +577,7 @@ class TestSelectUserAnswer(TestCase):
     def test_post_user_answer_success_false(self):
         """POST正常系(resultがfalse)"""
         user = User.objects.get(user_name='ユーザ1')
-        group = Group.objects.get(group_name='名前3')
+        group = Group.objects.get(group_name='名前2')
         question = Question.objects.get()
         body = dict(
             question_id=question.question_id,
@@ -478,6 +604,71 @@ class TestSelectUserAnswer(TestCase):
         self.assertEqual(type(datetime.datetime.today()), type(record.update_date))
 
 
+    def test_post_user_answer_no_select(self):
+        """POST正常系(キャッシュ済みの場合はSELECTを発行せず、問題の行を更新しない)"""
+        user = User.objects.get(user_name='ユーザ1')
+        group = Group.objects.get(group_name='名前2')
+        question = Question.objects.get()
+        body = dict(question_id=question.question_id, group_id=group.group_id, answer='1', challenge_count=1)
+        post_user = SelectUserAnswerView.as_view()
+        post_user(factory.post('/users/{}/answers'.format(user.user_id), data=body, format='json'), user.user_id)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = post_user(factory.post('/users/{}/answers'.format(user.user_id), data=body, format='json'),
+                                 user.user_id)
+
+        self.assertEqual(True, response.data.get('result'))
+        sqls = [q['sql'] for q in queries.captured_queries]
+        self.assertFalse([sql for sql in sqls if sql.startswith('SELECT')])
+        self.assertEqual(1, len([sql for sql in sqls if sql.startswith('INSERT')]))
+        # 成績集計・Userの写し・バケット・正解済みの問題・成績のバージョン(問題とランキングの行は更新しない)
+        updates = [sql for sql in sqls if sql.startswith('UPDATE')]
+        self.assertEqual(5, len(updates))
+        self.assertFalse([sql for sql in updates if sql.startswith('UPDATE "quiz_question"')])
+        # 他のテーブルを読む副問い合わせも含めない
+        self.assertFalse([sql for sql in updates if 'SELECT' in sql])
+
+    def test_post_user_answer_question_updated(self):
+        """POST正常系(問題の正解を変更した場合は変更後の正解で採点する)"""
+        user = User.objects.get(user_name='ユーザ1')
+        group = Group.objects.get(group_name='名前2')
+        question = Question.objects.get()
+        body = dict(question_id=question.question_id, group_id=group.group_id, answer='2', challenge_count=1)
+        post_user = SelectUserAnswerView.as_view()
+        response = post_user(factory.post('/users/{}/answers'.format(user.user_id), data=body, format='json'),
+                             user.user_id)
+        self.assertEqual(False, response.data.get('result'))
+
+        question.correct = '2'
+        question.save()
+        response = post_user(factory.post('/users/{}/answers'.format(user.user_id), data=body, format='json'),
+                             user.user_id)
+        self.assertEqual(True, response.data.get('result'))
+
+    def test_post_user_answer_question_not_exist(self):
+        """POST異常系(問題が存在しない)"""
+        user = User.objects.get(user_name='ユーザ1')
+        group = Group.objects.get(group_name='名前2')
+        body = dict(question_id=9999, group_id=group.group_id, answer='1', challenge_count=1)
+        request = factory.post('/users/{}/answers'.format(user.user_id), data=body, format='json')
+        response = SelectUserAnswerView.as_view()(request, user.user_id)
+
+        self.assertEqual(400, response.status_code)
+        self.assertFalse(Answer.objects.exists())
+
+    def test_post_user_answer_group_mismatch(self):
+        """POST異常系(問題が指定したグループのものではない)"""
+        user = User.objects.get(user_name='ユーザ1')
+        group = Group.objects.get(group_name='名前1')
+        body = dict(question_id=Question.objects.get().question_id, group_id=group.group_id, answer='1',
+                    challenge_count=1)
+        request = factory.post('/users/{}/answers'.format(user.user_id), data=body, format='json')
+        response = SelectUserAnswerView.as_view()(request, user.user_id)
+
+        self.assertEqual(400, response.status_code)
+        self.assertFalse(Answer.objects.exists())
+        self.assertEqual(0, UserScore.objects.get(user_id=user.user_id).total_count)
+
     def test_post_user_answer_body_error(self):
         """POST異常系(body不正(challenge_countが存在しない))"""
         user = User.objects.get(user_name='ユーザ1')
@@ -494,6 +685,69 @@ class TestSelectUserAnswer(TestCase):
         response = post_user(request, user.user_id)
         self.assertEqual(400, response.status_code)
 
+class TestSelectUserAnswersBatch(TestCase):
+    """SelectUserAnswersBatchテスト"""
+
+    def setUp(self):
+        """初期処理"""
+        User.objects.create(user_id="1"*28, user_name='ユーザ1', mail_address='aiu1@mail.com', is_deleted=False)
+        Group.objects.create(group_name='名前1', is_deleted=False)
+
+        group = Group.objects.get(group_name='名前1')
+        for i in range(1, 4):
+            Question.objects.create(group_id=group.group_id, user_id="1"*28, question_type='select',
+                                    question='問題{}'.format(i), correct=str(i), degree=1)
+
+    def _body(self, answers):
+        group = Group.objects.get(group_name='名前1')
+        return dict(challenge_count=1, answers=[
+            dict(question_id=Question.objects.get(question=question).question_id, group_id=str(group.group_id),
+                 answer=answer) for question, answer in answers])
+
+    def test_post_answers_success(self):
+        """POST正常系"""
+        body = self._body([('問題1', '1'), ('問題2', '1'), ('問題3', '3')])
+        request = factory.post('/users/{}/answers/batch'.format("1"*28), data=body, format='json')
+        response = SelectUserAnswersBatchView.as_view()(request, "1"*28)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([True, False, True], [r['result'] for r in response.data])
+        self.assertEqual(3, Answer.objects.filter(user_id="1"*28, challenge_count=1).count())
+        score = UserScore.objects.get(user_id="1"*28)
+        self.assertEqual(3, score.total_count)
+        self.assertEqual(2, score.correct_answer_count)
+
+    def test_post_answers_question_not_exist(self):
+        """POST異常系(存在しない問題が含まれる場合は1件も登録しない)"""
+        body = self._body([('問題1', '1')])
+        body['answers'].append(dict(question_id=9999, group_id=body['answers'][0]['group_id'], answer='1'))
+        request = factory.post('/users/{}/answers/batch'.format("1"*28), data=body, format='json')
+        response = SelectUserAnswersBatchView.as_view()(request, "1"*28)
+
+        self.assertEqual(400, response.status_code)
+        self.assertFalse(Answer.objects.exists())
+
+    def test_post_answers_group_mismatch(self):
+        """POST異常系(他のグループの問題が含まれる場合は1件も登録しない)"""
+        other = Group.objects.create(group_name='名前2', is_deleted=False)
+        body = self._body([('問題1', '1'), ('問題2', '2')])
+        body['answers'][1]['group_id'] = str(other.group_id)
+        request = factory.post('/users/{}/answers/batch'.format("1"*28), data=body, format='json')
+        response = SelectUserAnswersBatchView.as_view()(request, "1"*28)
+
+        self.assertEqual(400, response.status_code)
+        self.assertIn(str(Question.objects.get(question='問題2').question_id), str(response.data))
+        self.assertFalse(Answer.objects.exists())
+
+    def test_post_answers_empty(self):
+        """POST異常系(回答が空)"""
+        request = factory.post('/users/{}/answers/batch'.format("1"*28), data=dict(challenge_count=1, answers=[]),
+                               format='json')
+        response = SelectUserAnswersBatchView.as_view()(request, "1"*28)
+
+        self.assertEqual(400, response.status_code)
+
+
 class TestQuestion(TestCase):
     """Questionテスト"""
 
@@ -619,6 +873,61 @@ class TestQuestion(TestCase):
             val2 += q
         self.assertNotEqual(val1, val2)
 
+    def test_get_question_body(self):
+        """GETのボディはDRFのJSONRendererと同じ"""
+        group = Group.objects.get(group_name='名前1')
+        request = factory.get('/questions', data=dict(group_id=group.group_id, degree=1, limit=3))
+        response = QuestionView.as_view()(request)
+
+        self.assertEqual(JSONRenderer().render(response.data), response.content)
+        self.assertEqual([d['question_id'] for d in response.data],
+                         [d['question_id'] for d in json.loads(response.content.decode())])
+
+    def test_warm_up(self):
+        """ウォームアップ後は問題IDプール・正解・グループの存在確認にクエリを発行しない"""
+        question_pool.invalidate()
+        answer_keys.invalidate()
+        known_groups.invalidate()
+        group = Group.objects.get(group_name='名前1')
+        question = Question.objects.get(question='問題1')
+
+        warm_up()
+        version = get_version(questions_key(group.group_id, 1))
+
+        with self.assertNumQueries(0):
+            rows = question_pool.get(group.group_id, 1, version)
+            self.assertIn(question.question_id, [row['question_id'] for row in rows])
+            self.assertEqual('1', answer_keys.get(question.question_id).correct)
+            self.assertTrue(known_groups.exists(group.group_id))
+
+    def test_key_caches_other_process(self):
+        """他プロセスでの問題の更新・ユーザの削除を、DataVersionの確認で検知して読み込み直す"""
+        question = Question.objects.get(question='問題1')
+        user = User.objects.get(user_name='ユーザ1')
+        keys = AnswerKeyCache(10, 0)
+        users = KnownKeyCache(User, 10, KNOWN_USERS, 0)
+        self.assertEqual('1', keys.get(question.question_id).correct)
+        self.assertTrue(users.exists(user.user_id))
+
+        # signalsを経由しない更新はバージョンが変わるまでキャッシュの値を返す
+        Question.objects.filter(question_id=question.question_id).update(correct='2')
+        User.objects.filter(user_id=user.user_id)._raw_delete(connection.alias)
+        self.assertEqual('1', keys.get(question.question_id).correct)
+        self.assertTrue(users.exists(user.user_id))
+
+        bump(ANSWER_KEYS)
+        bump(KNOWN_USERS)
+        self.assertEqual('2', keys.get(question.question_id).correct)
+        self.assertFalse(users.exists(user.user_id))
+
+    def test_key_caches_check_interval(self):
+        """バージョンの確認は間隔ごとに1回だけ行う"""
+        question = Question.objects.get(question='問題1')
+        keys = AnswerKeyCache(10, 60)
+        keys.get(question.question_id)
+        with self.assertNumQueries(0):
+            keys.get(question.question_id)
+
     def test_get_question_limit_not_exist(self):
         """GETの正常系(limit無し)"""
         group = Group.objects.get(group_name='名前1')
@@ -695,6 +1004,125 @@ class TestQuestion(TestCase):
         self.assertEqual(type(datetime.datetime.today()), type(obj.create_date))
         self.assertEqual(type(datetime.datetime.today()), type(obj.update_date))
 
+    def test_get_question_query_count(self):
+        """GETの正常系(プール取得後は更新回数の取得のみ)"""
+        group = Group.objects.get(group_name='名前1')
+        request = factory.get('/questions', data=dict(group_id=group.group_id, degree=1, limit=2))
+        get_questions = QuestionView.as_view()
+
+        # 初回は更新回数とプールの読み込み
+        with self.assertNumQueries(2):
+            get_questions(request)
+
+        with self.assertNumQueries(1):
+            response = get_questions(request)
+
+        self.assertEqual(2, len(response.data))
+        self.assertIn('ETag', response)
+
+    def test_get_question_unknown_group_after_pool(self):
+        """GETの異常系(プールが空の場合のみgroup_idの存在を確認する)"""
+        request = factory.get('/questions', data=dict(group_id='f5f1e5c5-0b6d-4e0f-9a8e-000000000000', degree=1))
+        response = QuestionView.as_view()(request)
+
+        self.assertEqual(400, response.status_code)
+        self.assertIn('group_id', response.data)
+
+    def _answer_correctly(self, question):
+        request = factory.post('/users/{}/answers'.format("1" * 28), data=dict(
+            question_id=question.question_id, group_id=str(question.group_id), answer='1', challenge_count=1),
+            format='json')
+        SelectUserAnswerView.as_view()(request, user_id="1" * 28)
+
+    def test_get_question_unseen_only(self):
+        """GETの正常系(unseen=onlyは正解済みの問題を出題しない)"""
+        group = Group.objects.get(group_name='名前1')
+        answered = Question.objects.get(question='問題1')
+        self._answer_correctly(answered)
+
+        request = factory.get('/questions', data=dict(group_id=group.group_id, degree=1, limit=10, unseen='only',
+                                                      user_id="1" * 28))
+        response = QuestionView.as_view()(request)
+
+        question_ids = [row['question_id'] for row in response.data]
+        self.assertEqual(3, len(question_ids))
+        self.assertNotIn(answered.question_id, question_ids)
+
+    def test_get_question_unseen_prefer(self):
+        """GETの正常系(unseen=preferは正解済みの問題を不足分にのみ使う)"""
+        group = Group.objects.get(group_name='名前1')
+        answered = Question.objects.get(question='問題1')
+        self._answer_correctly(answered)
+        get_questions = QuestionView.as_view()
+
+        request = factory.get('/questions', data=dict(group_id=group.group_id, degree=1, limit=3, unseen='prefer',
+                                                      user_id="1" * 28))
+        self.assertNotIn(answered.question_id, [row['question_id'] for row in get_questions(request).data])
+
+        request = factory.get('/questions', data=dict(group_id=group.group_id, degree=1, limit=4, unseen='prefer',
+                                                      user_id="1" * 28))
+        question_ids = [row['question_id'] for row in get_questions(request).data]
+        self.assertEqual(answered.question_id, question_ids[-1])
+
+        # 更新回数とビットマップの取得のみ(回答履歴の件数によらない)
+        with self.assertNumQueries(2):
+            get_questions(request)
+
+    def test_get_question_unseen_etag(self):
+        """GETの正常系(unseen指定時は回答登録でETagが変わる)"""
+        group = Group.objects.get(group_name='名前1')
+        data = dict(group_id=group.group_id, degree=1, unseen='only', user_id="1" * 28)
+        etag = self.client.get('/api/questions', data)['ETag']
+
+        self._answer_correctly(Question.objects.get(question='問題1'))
+
+        self.assertEqual(200, self.client.get('/api/questions', data, HTTP_IF_NONE_MATCH=etag).status_code)
+
+    def test_get_question_unseen_without_user(self):
+        """GETの異常系(unseen指定時はuser_idが必須)"""
+        group = Group.objects.get(group_name='名前1')
+        request = factory.get('/questions', data=dict(group_id=group.group_id, degree=1, unseen='only'))
+        response = QuestionView.as_view()(request)
+
+        self.assertEqual(400, response.status_code)
+        self.assertIn('user_id', response.data)
+
+    def test_get_question_adaptive(self):
+        """GETの正常系(adaptiveはdegree無しでユーザのレーティングに近い問題を選ぶ)"""
+        group = Group.objects.get(group_name='名前1')
+        for name, rating in (('問題1', 1000), ('問題2', 1100), ('問題3', 2000), ('問題4', 2100)):
+            Question.objects.filter(question=name).update(rating=rating)
+        UserScore.objects.filter(user_id="1" * 28).update(rating=1050)
+
+        rows = questions_near(group.group_id, 1050, 1)
+        self.assertEqual({'問題1', '問題2'}, {row['question'] for row in rows[:2]})
+        self.assertNotIn('問題4', [row['question'] for row in rows])
+
+        request = factory.get('/questions', data=dict(group_id=group.group_id, limit=1, adaptive=1,
+                                                      user_id="1" * 28))
+        get_questions = QuestionView.as_view()
+        get_questions(request)
+        # ユーザのレーティングと、その上側・下側の範囲検索のみ
+        with self.assertNumQueries(3):
+            response = get_questions(request)
+
+        self.assertEqual(200, response.status_code)
+        self.assertIn(response.data[0]['question'], ('問題1', '問題2', '問題3'))
+
+    def test_post_question_invalidates_pool(self):
+        """POSTした問題が次のGETから取得対象になる"""
+        user = User.objects.get(user_name='ユーザ1')
+        group = Group.objects.get(group_name='名前2')
+        request = factory.get('/questions', data=dict(group_id=group.group_id, degree=1, limit=5))
+        get_questions = QuestionView.as_view()
+        self.assertEqual(1, len(get_questions(request).data))
+
+        body = dict(group_id=group.group_id, user_id=user.user_id, question_type='select', question='問題11',
+                    correct=1, choice_1='a', choice_2='b', choice_3='c', choice_4='d', degree=1)
+        QuestionView.as_view()(factory.post('/questions', data=body, format='json'))
+
+        self.assertEqual(2, len(get_questions(request).data))
+
     def test_post_question_body_error(self):
         """POST異常系(body不正)"""
         user = User.objects.get(user_name='ユーザ1', mail_address='aiu1@mail.com', is_deleted=False)
@@ -871,3 +1299,1081 @@ class TestRanking(TestCase):
         self.assertEqual(5, data[2]['total_count'])
         self.assertEqual(3, data[2]['correct_answer_count'])
         self.assertEqual('60.0', data[2]['correct_answer_rate'])
+
+
+class TestUserScore(TestCase):
+    """UserScore(成績集計)テスト"""
+
+    def setUp(self):
+        """初期処理"""
+        User.objects.create(user_id="1"*28, user_name='ユーザ1', mail_address='aiu1@mail.com', is_deleted=False)
+        User.objects.create(user_id="2"*28, user_name='ユーザ2', mail_address='aiu2@mail.com', is_deleted=False)
+        Group.objects.create(group_name='名前1', is_deleted=False)
+
+        user = User.objects.get(user_name='ユーザ1')
+        group = Group.objects.get(group_name='名前1')
+        Question.objects.create(
+            group_id=group.group_id,
+            user_id=user.user_id,
+            question_type='select',
+            question='問題1',
+            correct=1,
+            choice_1='a',
+            choice_2='b',
+            choice_3='c',
+            choice_4='d',
+            degree=1
+        )
+
+    def _post_answer(self, user, answer):
+        group = Group.objects.get(group_name='名前1')
+        question = Question.objects.get()
+        body = dict(question_id=question.question_id, group_id=group.group_id, answer=answer, challenge_count=1)
+        request = factory.post('/users/{}/answers'.format(user.user_id), data=body, format='json')
+        return SelectUserAnswerView.as_view()(request, user.user_id)
+
+    def test_post_answer_updates_score(self):
+        """回答登録で成績集計が更新される"""
+        user = User.objects.get(user_name='ユーザ1')
+        self._post_answer(user, '1')
+        self._post_answer(user, '2')
+        self._post_answer(user, '1')
+
+        score = UserScore.objects.get(user_id=user.user_id)
+        self.assertEqual(3, score.total_count)
+        self.assertEqual(2, score.correct_answer_count)
+        self.assertAlmostEqual(2 / 3, score.correct_answer_rate)
+
+    def test_post_answer_updates_user_stats(self):
+        """回答登録でUserの正答率とチャレンジ回数が更新される"""
+        user = User.objects.get(user_name='ユーザ1')
+        self._post_answer(user, '1')
+        self._post_answer(user, '2')
+        Answer.objects.filter(user_id=user.user_id).update(challenge_count=3)
+        self._post_answer(user, '1')
+
+        user = User.objects.get(user_id=user.user_id)
+        self.assertAlmostEqual(2 / 3, user.correct_answer_rate)
+        self.assertEqual(1, user.challenge_count)
+        self.assertEqual((3, 2), (user.total_count, user.correct_answer_count))
+
+        User.objects.filter(user_id=user.user_id).update(challenge_count=3)
+        self._post_answer(user, '1')
+        self.assertEqual(3, User.objects.get(user_id=user.user_id).challenge_count)
+
+    def test_reconcile_user_stats(self):
+        """修正コマンドでUserの正答率・チャレンジ回数・件数が回答テーブルと一致する"""
+        user1 = User.objects.get(user_name='ユーザ1')
+        user2 = User.objects.get(user_name='ユーザ2')
+        self._post_answer(user1, '1')
+        User.objects.filter(user_id=user1.user_id).update(correct_answer_rate=0.5, challenge_count=7, total_count=2)
+        User.objects.filter(user_id=user2.user_id).update(correct_answer_rate=0.5)
+
+        out = StringIO()
+        call_command('reconcile_user_stats', dry_run=True, stdout=out)
+        self.assertIn('2 users', out.getvalue())
+        self.assertEqual(7, User.objects.get(user_id=user1.user_id).challenge_count)
+
+        call_command('reconcile_user_stats', stdout=StringIO())
+        user1 = User.objects.get(user_id=user1.user_id)
+        self.assertEqual(1.0, user1.correct_answer_rate)
+        self.assertEqual(1, user1.challenge_count)
+        self.assertEqual((1, 1), (user1.total_count, user1.correct_answer_count))
+        self.assertIsNone(User.objects.get(user_id=user2.user_id).correct_answer_rate)
+
+        out = StringIO()
+        call_command('reconcile_user_stats', dry_run=True, stdout=out)
+        self.assertIn('0 users', out.getvalue())
+
+    def test_post_answer_updates_ratings(self):
+        """回答登録でユーザのレーティングが変わり、問題のレーティングはまとめて逆向きに反映される"""
+        user = User.objects.get(user_name='ユーザ1')
+        question = Question.objects.get()
+        # 初回は反映済みの範囲を記録するだけ
+        call_command('update_question_ratings', lag=0, stdout=StringIO())
+        self._post_answer(user, '1')
+
+        # 同じレーティング同士は期待正答率0.5のため、K(32) * (1 - 0.5)だけ変わる
+        self.assertAlmostEqual(1516.0, UserScore.objects.get(user_id=user.user_id).rating)
+        self.assertAlmostEqual(1500.0, Question.objects.get(pk=question.pk).rating)
+
+        out = StringIO()
+        call_command('update_question_ratings', lag=0, stdout=out)
+        self.assertIn('applied 1 answers', out.getvalue())
+        # 反映時点のユーザのレーティング(1516)で期待正答率を求める
+        expected = 1.0 / (1.0 + 10.0 ** ((1500.0 - 1516.0) / 400.0))
+        self.assertAlmostEqual(1500.0 - 32 * (1 - expected), Question.objects.get(pk=question.pk).rating)
+
+        self._post_answer(user, '2')
+        self.assertLess(UserScore.objects.get(user_id=user.user_id).rating, 1516.0)
+
+    def test_update_question_ratings_watermark(self):
+        """問題のレーティングは初回より前の回答を反映せず、同じ回答を2回反映しない"""
+        user = User.objects.get(user_name='ユーザ1')
+        question = Question.objects.get()
+        self._post_answer(user, '1')
+        call_command('update_question_ratings', lag=0, stdout=StringIO())
+        self.assertAlmostEqual(1500.0, Question.objects.get(pk=question.pk).rating)
+
+        self._post_answer(user, '2')
+        # 猶予(lag)内の回答はまだ反映しない
+        out = StringIO()
+        call_command('update_question_ratings', lag=60, stdout=out)
+        self.assertIn('applied 0 answers', out.getvalue())
+
+        call_command('update_question_ratings', lag=0, stdout=StringIO())
+        rating = Question.objects.get(pk=question.pk).rating
+        self.assertGreater(rating, 1500.0)
+        call_command('update_question_ratings', lag=0, stdout=StringIO())
+        self.assertEqual(rating, Question.objects.get(pk=question.pk).rating)
+
+    def test_update_question_ratings_chunks(self):
+        """回答をチャンクに分けて反映する(同じ日時の回答はチャンクの件数を超えてもまとめて反映する)"""
+        user = User.objects.get(user_name='ユーザ1')
+        question = Question.objects.get()
+        base = timezone.now() - datetime.timedelta(minutes=10)
+        update_question_ratings(datetime.timedelta(0), now=base)
+        offsets = (1, 1, 1, 2, 3)
+        Answer.objects.bulk_create([Answer(user_id=user.user_id, group_id=question.group_id,
+                                           question_id=question.question_id, answer='1', is_correct=True,
+                                           create_date=base + datetime.timedelta(seconds=offset))
+                                    for offset in offsets])
+
+        self.assertEqual(5, update_question_ratings(datetime.timedelta(0), chunk_size=2))
+        self.assertLess(Question.objects.get(pk=question.pk).rating, 1500.0)
+        self.assertEqual(0, update_question_ratings(datetime.timedelta(0), chunk_size=2))
+
+    def test_update_question_ratings_answer_keys(self):
+        """問題のレーティングの反映後は、回答登録時に反映後のレーティングを使う"""
+        user = User.objects.get(user_name='ユーザ1')
+        question = Question.objects.get()
+        call_command('update_question_ratings', lag=0, stdout=StringIO())
+        self._post_answer(user, '2')
+
+        # 他プロセスのキャッシュ(確認間隔0)がバージョンの変化で読み直す
+        keys = AnswerKeyCache(10, 0)
+        self.assertEqual(1500.0, keys.get(question.question_id).rating)
+        call_command('update_question_ratings', lag=0, stdout=StringIO())
+        self.assertEqual(Question.objects.get(pk=question.pk).rating, keys.get(question.question_id).rating)
+
+    def test_rebuild_user_scores(self):
+        """再集計コマンドで回答テーブルと一致する"""
+        user1 = User.objects.get(user_name='ユーザ1')
+        user2 = User.objects.get(user_name='ユーザ2')
+        self._post_answer(user1, '1')
+        self._post_answer(user2, '2')
+        Answer.objects.filter(user_id=user2.user_id).update(is_deleted=True)
+        UserScore.objects.filter(user_id=user1.user_id).update(total_count=100)
+
+        call_command('rebuild_user_scores', stdout=StringIO())
+
+        score = UserScore.objects.get(user_id=user1.user_id)
+        self.assertEqual(1, score.total_count)
+        self.assertEqual(1, score.correct_answer_count)
+        self.assertEqual(1.0, score.correct_answer_rate)
+        self.assertEqual(0, UserScore.objects.get(user_id=user2.user_id).total_count)
+
+    def test_rebuild_answered_questions(self):
+        """再集計コマンドで正解済みの問題が回答テーブルと一致する"""
+        user1 = User.objects.get(user_name='ユーザ1')
+        self._post_answer(user1, '1')
+        question_id = Answer.objects.get(user_id=user1.user_id).question_id
+        self.assertIn(question_id, answered_questions(user1.user_id))
+
+        Answer.objects.filter(user_id=user1.user_id).update(is_deleted=True)
+        call_command('rebuild_user_scores', stdout=StringIO())
+
+        self.assertNotIn(question_id, answered_questions(user1.user_id))
+
+    def test_rebuild_many_rows(self):
+        """再集計で作成する行がSQLiteの1文の上限(500行)を超えても作り直せる"""
+        user1 = User.objects.get(user_name='ユーザ1')
+        group = Group.objects.get(group_name='名前1')
+        # 問題IDを63ずつ離し、正解済みの問題のビットマップを501語(501行)にする
+        Question.objects.bulk_create([Question(question_id=63 * i + 100, group_id=group.group_id,
+                                               user_id=user1.user_id, question='多数{}'.format(i), correct='1',
+                                               degree=1) for i in range(501)])
+        Answer.objects.bulk_create([Answer(user_id=user1.user_id, group_id=group.group_id,
+                                           question_id=63 * i + 100, answer='1', is_correct=True)
+                                    for i in range(501)])
+        User.objects.bulk_create([User(user_id='m{:027d}'.format(i), user_name='多数{}'.format(i),
+                                       mail_address='many{}@mail.com'.format(i)) for i in range(501)])
+
+        call_command('rebuild_user_scores', stdout=StringIO())
+
+        self.assertEqual(501, AnsweredQuestions.objects.filter(user_id=user1.user_id).count())
+        self.assertEqual(503, UserScore.objects.count())
+        self.assertEqual(501, UserScore.objects.get(user_id=user1.user_id).total_count)
+
+    def test_generate_data_answered_questions(self):
+        """生成したデータの正解済みの問題は回答テーブルと一致する"""
+        call_command('generate_data', users=3, groups=1, questions=10, answers=60, prefix='gen', seed=1,
+                     stdout=StringIO())
+
+        rows = set(Answer.objects.filter(is_deleted=False, is_correct=True).values_list('user_id', 'question_id'))
+        self.assertTrue(rows)
+        for user_id, question_id in rows:
+            self.assertIn(question_id, answered_questions(user_id))
+
+    def test_generate_data_rollback(self):
+        """途中で失敗した場合はデータを残さず、同じ接頭辞で再実行できる"""
+        Group.objects.create(group_name='gen_group0')
+        with self.assertRaises(IntegrityError):
+            call_command('generate_data', users=3, groups=1, questions=10, answers=10, prefix='gen', seed=1,
+                         stdout=StringIO())
+        self.assertFalse(User.objects.filter(user_id__startswith='gen').exists())
+
+        Group.objects.filter(group_name='gen_group0').delete()
+        call_command('generate_data', users=3, groups=1, questions=10, answers=10, prefix='gen', seed=1,
+                     stdout=StringIO())
+        self.assertEqual(10, Answer.objects.count())
+
+    def test_ranking_does_not_scan_answers(self):
+        """ランキングは回答テーブルを参照しない"""
+        user = User.objects.get(user_name='ユーザ1')
+        self._post_answer(user, '1')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = RankingView.as_view()(factory.get('/ranking'))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('100.0', response.data[0]['correct_answer_rate'])
+        self.assertEqual('0.0', response.data[1]['correct_answer_rate'])
+        for query in queries.captured_queries:
+            self.assertNotIn('quiz_answer', query['sql'])
+
+
+class TestRankingPage(TestCase):
+    """ランキングのページングと順位取得テスト"""
+
+    def setUp(self):
+        """初期処理(ユーザiはi問中i-1問正解)"""
+        Group.objects.create(group_name='名前1', is_deleted=False)
+        group = Group.objects.get(group_name='名前1')
+        for i in range(1, 7):
+            User.objects.create(user_id=str(i) * 28, user_name='ユーザ{}'.format(i),
+                                mail_address='aiu{}@mail.com'.format(i), is_deleted=False)
+        question = Question.objects.create(group_id=group.group_id, user_id="1" * 28, question_type='select',
+                                           question='問題1', correct=1, degree=1)
+        for i in range(1, 7):
+            for j in range(i):
+                Answer.objects.create(user_id=str(i) * 28, group_id=group.group_id, question_id=question.question_id,
+                                      answer="1", is_correct=j > 0, challenge_count=1)
+
+    def test_get_ranking_limit_offset(self):
+        """limit/offsetで指定した範囲のみ取得する"""
+        request = factory.get('/ranking', data=dict(sorted='count', limit=2, offset=1))
+        response = RankingView.as_view()(request)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(['ユーザ5', 'ユーザ4'], [r['user_name'] for r in response.data])
+        self.assertEqual(5, response.data[0]['total_count'])
+        self.assertEqual('80.0', response.data[0]['correct_answer_rate'])
+
+    def test_get_ranking_correct(self):
+        """sorted=correctで正解数順に取得する"""
+        request = factory.get('/ranking', data=dict(sorted='correct', limit=1))
+        response = RankingView.as_view()(request)
+
+        self.assertEqual(['ユーザ6'], [r['user_name'] for r in response.data])
+
+    def test_get_user_rank(self):
+        """指定したユーザの順位と前後のユーザを取得する"""
+        request = factory.get('/users/{}/rank'.format("3" * 28), data=dict(sorted='rate', neighbors=1))
+        response = SelectUserRankView.as_view()(request, "3" * 28)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(4, response.data['rank'])
+        self.assertEqual('ユーザ3', response.data['user_name'])
+        self.assertEqual('66.7', response.data['correct_answer_rate'])
+        self.assertEqual([('ユーザ4', 3)], [(r['user_name'], r['rank']) for r in response.data['above']])
+        self.assertEqual([('ユーザ2', 5)], [(r['user_name'], r['rank']) for r in response.data['below']])
+
+    def test_get_user_rank_deleted_user(self):
+        """削除済みのユーザは順位と前後のユーザに含めず、Userと結合せずに求める"""
+        user = User.objects.get(user_id="4" * 28)
+        user.is_deleted = True
+        user.save()
+
+        request = factory.get('/users/{}/rank'.format("3" * 28), data=dict(sorted='rate', neighbors=1))
+        with CaptureQueriesContext(connection) as queries:
+            response = SelectUserRankView.as_view()(request, "3" * 28)
+
+        self.assertEqual(3, response.data['rank'])
+        self.assertEqual([('ユーザ5', 2)], [(r['user_name'], r['rank']) for r in response.data['above']])
+        self.assertFalse([q['sql'] for q in queries.captured_queries if '"quiz_user"' in q['sql']])
+
+    def test_get_user_rank_not_found(self):
+        """存在しないユーザは404"""
+        request = factory.get('/users/{}/rank'.format("9" * 28))
+        response = SelectUserRankView.as_view()(request, "9" * 28)
+
+        self.assertEqual(404, response.status_code)
+
+    def test_get_ranking_stream(self):
+        """stream=1で同じ内容をストリーミングで返す"""
+        request = factory.get('/ranking', data=dict(sorted='count', limit=2, offset=1, stream=1))
+        response = RankingView.as_view()(request)
+
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content).decode())
+        self.assertEqual(['ユーザ5', 'ユーザ4'], [r['user_name'] for r in data])
+        self.assertEqual('80.0', data[0]['correct_answer_rate'])
+
+    def test_put_user_name_updates_ranking(self):
+        """ユーザ名の更新がランキングに反映される"""
+        request = factory.put('/users/{}'.format("6" * 28), data=dict(user_name='ユーザ0'), format='json')
+        SelectUserView.as_view()(request, "6" * 28)
+
+        response = RankingView.as_view()(factory.get('/ranking', data=dict(sorted='count', limit=1)))
+        self.assertEqual('ユーザ0', response.data[0]['user_name'])
+
+
+class TestMetrics(TestCase):
+    """Metricsテスト"""
+
+    def setUp(self):
+        """初期処理"""
+        Group.objects.create(group_name='名前1', is_deleted=False)
+
+    def test_get_metrics(self):
+        """リクエストしたビューの計測値が出力される"""
+        self.client.get('/api/groups')
+        response = self.client.get('/api/metrics')
+        body = response.content.decode()
+
+        self.assertEqual(200, response.status_code)
+        self.assertIn('quiz_http_request_duration_seconds_count{view="GroupView",method="GET"}', body)
+        self.assertIn('quiz_db_queries_total{view="GroupView",method="GET"}', body)
+        self.assertIn('quiz_http_response_bytes_total{view="GroupView",method="GET"}', body)
+
+    def test_get_metrics_stream(self):
+        """ストリーミングのレスポンスは本文を読み終えた時点のサイズとクエリ数を計測する"""
+        before = registry.collect().get(('GroupView', 'GET'))
+        before = (before.count, before.queries, before.response_bytes) if before else (0, 0, 0)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/groups', dict(stream=1))
+            body = b''.join(response.streaming_content)
+
+        stats = registry.collect()[('GroupView', 'GET')]
+        self.assertEqual(1, stats.count - before[0])
+        self.assertEqual(len(queries.captured_queries), stats.queries - before[1])
+        self.assertEqual(len(body), stats.response_bytes - before[2])
+
+    def test_collect_multiple_processes(self):
+        """他プロセスが書き出した計測値と合算する"""
+        with tempfile.TemporaryDirectory() as directory:
+            other = MetricsRegistry(directory)
+            other.observe('GroupView', 'GET', 0.002, 2, 0.001, 100)
+            other.flush()
+            os.rename(os.path.join(directory, '{}.json'.format(os.getpid())), os.path.join(directory, '1.json'))
+
+            local = MetricsRegistry(directory)
+            local.observe('GroupView', 'GET', 0.2, 1, 0.1, 50)
+            stats = local.collect()[('GroupView', 'GET')]
+            body = local.expose()
+
+        self.assertEqual(2, stats.count)
+        self.assertEqual(3, stats.queries)
+        self.assertEqual(150, stats.response_bytes)
+        self.assertIn('quiz_http_request_duration_seconds_bucket{view="GroupView",method="GET",le="0.005"} 1', body)
+
+    def test_values_multiple_processes(self):
+        """プロセス単位の値は全プロセス分を合算し、終了したプロセスのゲージは残さない"""
+        metrics = (('quiz_test_in_use', 'gauge', 'Gauge.'), ('quiz_test_total', 'counter', 'Counter.'))
+        with tempfile.TemporaryDirectory() as directory:
+            other = MetricsRegistry(directory)
+            other.register_values(metrics, lambda: {('quiz_test_in_use', 'alias="default"'): 2,
+                                                    ('quiz_test_total', ''): 5})
+            other.flush()
+            os.rename(os.path.join(directory, '{}.json'.format(os.getpid())), os.path.join(directory, '1.json'))
+
+            local = MetricsRegistry(directory)
+            local.register_values(metrics, lambda: {('quiz_test_in_use', 'alias="default"'): 1,
+                                                    ('quiz_test_total', ''): 3})
+            body = local.expose()
+            self.assertIn('# TYPE quiz_test_in_use gauge', body)
+            self.assertIn('quiz_test_in_use{alias="default"} 3', body)
+            self.assertIn('quiz_test_total 8', body)
+
+            local.retire(1)
+            body = local.expose()
+            self.assertIn('quiz_test_in_use{alias="default"} 1', body)
+            self.assertIn('quiz_test_total 8', body)
+
+    def test_retire(self):
+        """終了したプロセスの計測値はretired.jsonに合算し、同じpidの新しいプロセスの値と混ざらない"""
+        with tempfile.TemporaryDirectory() as directory:
+            other = MetricsRegistry(directory)
+            other.observe('GroupView', 'GET', 0.002, 2, 0.001, 100)
+            other.flush()
+            os.rename(os.path.join(directory, '{}.json'.format(os.getpid())), os.path.join(directory, '1.json'))
+
+            local = MetricsRegistry(directory)
+            local.retire(1)
+            self.assertEqual(['retired.json'], os.listdir(directory))
+            self.assertEqual(1, local.collect()[('GroupView', 'GET')].count)
+
+            # 同じpidで起動したプロセスの値は上書きせずに加える
+            other.flush()
+            os.rename(os.path.join(directory, '{}.json'.format(os.getpid())), os.path.join(directory, '1.json'))
+            self.assertEqual(2, local.collect()[('GroupView', 'GET')].count)
+            local.retire(1)
+            self.assertEqual(2, local.collect()[('GroupView', 'GET')].count)
+
+
+class TestStartup(TestCase):
+    """起動時間・RSSのベンチマークテスト"""
+
+    def test_startup_within_budget(self):
+        """起動時に重いモジュールを読み込まず、予算内に収まる"""
+        out = StringIO()
+        call_command('benchmark_startup', runs=1, max_seconds=10, max_rss_mib=256, stdout=out)
+
+        self.assertIn('startup', out.getvalue())
+
+    def test_startup_over_budget(self):
+        """予算を超えた場合は失敗する"""
+        with self.assertRaises(CommandError):
+            call_command('benchmark_startup', runs=1, max_seconds=10, max_rss_mib=1, stdout=StringIO())
+
+
+class TestBenchmarkRecord(TestCase):
+    """成績取得のベンチマークテスト"""
+
+    def test_benchmark_record(self):
+        """回答数ごとの計測結果を出力し、データを残さない"""
+        out = StringIO()
+        call_command('benchmark_record', sizes=[10, 20], repeat=1, stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertEqual(['10', '2'], lines[1].split()[:2])
+        self.assertFalse(User.objects.exists())
+
+
+class TestServe(TestCase):
+    """serveコマンドテスト"""
+
+    def test_serve_reload(self):
+        """SIGHUPでワーカーを入れ替え、SIGTERMで終了する"""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        process = subprocess.Popen([sys.executable, os.path.join(settings.BASE_DIR, 'manage.py'), 'serve',
+                                    '--host', '127.0.0.1', '--port', str(port), '--workers', '2', '--threads', '1',
+                                    '--no-warm-up'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            self.assertIn(b'serving on', process.stdout.readline())
+            url = 'http://127.0.0.1:{}/api/metrics'.format(port)
+            self.assertEqual(200, urllib.request.urlopen(url).status)
+
+            process.send_signal(signal.SIGHUP)
+            self.assertIn(b'reloaded workers', process.stdout.readline())
+            self.assertEqual(200, urllib.request.urlopen(url).status)
+
+            process.send_signal(signal.SIGTERM)
+            self.assertEqual(0, process.wait(30))
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+    def test_serve_metrics_files(self):
+        """終了したワーカーの計測値は書き出してから合算し、ワーカーごとのファイルは残さない"""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        with tempfile.TemporaryDirectory() as directory:
+            process = subprocess.Popen([sys.executable, os.path.join(settings.BASE_DIR, 'manage.py'), 'serve',
+                                        '--host', '127.0.0.1', '--port', str(port), '--workers', '1',
+                                        '--threads', '1', '--no-warm-up'],
+                                       env=dict(os.environ, METRICS_DIR=directory),
+                                       stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            try:
+                self.assertIn(b'serving on', process.stdout.readline())
+                url = 'http://127.0.0.1:{}/api/metrics'.format(port)
+                self.assertEqual(200, urllib.request.urlopen(url).status)
+
+                process.send_signal(signal.SIGHUP)
+                self.assertIn(b'reloaded workers', process.stdout.readline())
+                self.assertEqual(200, urllib.request.urlopen(url).status)
+
+                process.send_signal(signal.SIGTERM)
+                self.assertEqual(0, process.wait(30))
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+            self.assertEqual(['retired.json'], os.listdir(directory))
+            self.assertEqual(2, MetricsRegistry(directory).collect()[('MetricsView', 'GET')].count)
+
+
+class TestConnectionPool(TestCase):
+    """接続プールテスト"""
+
+    def _pool(self, **kwargs):
+        def ping(raw):
+            try:
+                raw.execute('SELECT 1')
+            except sqlite3.Error:
+                return False
+            return True
+        return ConnectionPool(lambda: sqlite3.connect(':memory:', check_same_thread=False), ping, **kwargs)
+
+    def test_reuse(self):
+        """返却した接続を再利用する"""
+        pool = self._pool(max_size=2)
+        raw = pool.acquire()
+        pool.release(raw)
+
+        self.assertIs(raw, pool.acquire())
+        self.assertEqual(1, pool.stats()['created'])
+        self.assertEqual(1, pool.stats()['in_use'])
+
+    def test_wait_and_timeout(self):
+        """上限まで貸し出している場合は返却を待ち、timeout秒で失敗する"""
+        pool = self._pool(max_size=1, timeout=0.05)
+        raw = pool.acquire()
+
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+        threading.Timer(0.01, pool.release, (raw,)).start()
+        pool.timeout = 5
+        self.assertIs(raw, pool.acquire())
+        self.assertEqual(2, pool.stats()['waits'])
+        self.assertEqual(1, pool.stats()['timeouts'])
+
+    def test_reconnect(self):
+        """使えなくなった接続は貸し出す前に接続し直す"""
+        pool = self._pool(max_size=1, check_idle=0)
+        raw = pool.acquire()
+        pool.release(raw)
+        raw.close()
+
+        new = pool.acquire()
+        self.assertIsNot(raw, new)
+        new.execute('SELECT 1')
+        self.assertEqual(1, pool.stats()['reconnects'])
+
+    def test_discard(self):
+        """discard=Trueで返却した接続は再利用しない"""
+        pool = self._pool(max_size=1)
+        raw = pool.acquire()
+        pool.release(raw, discard=True)
+
+        self.assertIsNot(raw, pool.acquire())
+        self.assertEqual(0, pool.stats()['idle'])
+
+    @override_settings(DB_HEALTH_CHECK_IDLE=0)
+    def test_check_persistent_connections(self):
+        """一定時間使われていない永続接続はリクエストの処理前に確認する"""
+        connection.ensure_connection()
+        connection.last_released_at = 0
+        checks = connection_stats.checks
+
+        self.client.get('/api/metrics')
+
+        self.assertLess(checks, connection_stats.checks)
+        self.assertIsNotNone(connection.connection)
+        self.assertIn('quiz_db_health_checks_total', self.client.get('/api/metrics').content.decode())
+
+
+@override_settings(REPLICA_DATABASES=['replica'])
+class TestReplicaRouter(TestCase):
+    """レプリカへの読み取りの振り分けテスト(プライマリ・レプリカとも別々のSQLite)"""
+
+    def setUp(self):
+        """初期処理(レプリカにはユーザ名の異なる同じユーザと、成績のみを登録する)"""
+        self.directory = tempfile.TemporaryDirectory()
+        connections.databases['replica'] = dict(ENGINE='django.db.backends.sqlite3',
+                                                NAME=os.path.join(self.directory.name, 'replica.sqlite3'))
+        connections.ensure_defaults('replica')
+        connections.prepare_test_settings('replica')
+        call_command('migrate', database='replica', verbosity=0)
+        lag_monitor.invalidate()
+        recent_writes.clear()
+
+        User.objects.create(user_id="1" * 28, user_name='ユーザ1', mail_address='aiu1@mail.com')
+        Group.objects.create(group_name='名前1')
+        group = Group.objects.get(group_name='名前1')
+        question = Question.objects.create(group_id=group.group_id, user_id="1" * 28, question_type='select',
+                                           question='問題1', correct='1', degree=1)
+        Answer.objects.create(user_id="1" * 28, group_id=group.group_id, question_id=question.question_id,
+                              answer='1', is_correct=True, challenge_count=1)
+
+        # bulk_createはsignalsを呼ばないため、プライマリには書き込まれない
+        User.objects.using('replica').bulk_create([
+            User(user_id="1" * 28, user_name='レプリカ1', mail_address='aiu1@mail.com')])
+        UserScore.objects.using('replica').bulk_create([
+            UserScore(user_id="1" * 28, user_name='レプリカ1', total_count=1, correct_answer_count=1,
+                      correct_answer_rate=1)])
+
+    def tearDown(self):
+        connections['replica'].close()
+        del connections['replica']
+        del connections.databases['replica']
+        self.directory.cleanup()
+
+    def test_read_from_replica(self):
+        """指定したビューのGETはレプリカから、それ以外はプライマリから読む"""
+        self.assertEqual(['レプリカ1'], [r['user_name'] for r in self.client.get('/api/users').json()])
+        self.assertEqual(['レプリカ1'], [r['user_name'] for r in self.client.get('/api/ranking').json()])
+        self.assertEqual('ユーザ1', self.client.get('/api/users/{}'.format("1" * 28)).json()['user_name'])
+
+    def test_replica_lag(self):
+        """遅延が許容範囲を超えるレプリカは使わない"""
+        lag_monitor.record('replica', 20)
+
+        self.assertEqual(['ユーザ1'], [r['user_name'] for r in self.client.get('/api/users').json()])
+        self.assertEqual(['レプリカ1'], [r['user_name'] for r in self.client.get('/api/ranking').json()])
+
+        lag_monitor.record('replica', None)
+        self.assertEqual(['ユーザ1'], [r['user_name'] for r in self.client.get('/api/ranking').json()])
+
+    def test_read_your_writes(self):
+        """書き込み後は同じクライアント・同じユーザの読み取りをプライマリに送る"""
+        # レプリカには回答が無い
+        self.assertEqual(404, self.client.get('/api/users/{}/record'.format("1" * 28)).status_code)
+
+        question = Question.objects.get(question='問題1')
+        response = self.client.post('/api/users/{}/answers'.format("1" * 28), json.dumps(dict(
+            question_id=question.question_id, group_id=str(question.group_id), answer='1', challenge_count=2)),
+            content_type='application/json')
+        self.assertEqual(200, response.status_code)
+
+        response = self.client.get('/api/users/{}/record'.format("1" * 28))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, response.json()['total_count'])
+
+        # Cookieの無いクライアントでも、書き込み対象のユーザはプライマリから読む
+        self.assertEqual(200, Client().get('/api/users/{}/record'.format("1" * 28)).status_code)
+        self.assertEqual(['レプリカ1'], [r['user_name'] for r in Client().get('/api/users').json()])
+
+
+class TestConditionalGet(TestCase):
+    """ETag・If-None-Matchテスト"""
+
+    def setUp(self):
+        """初期処理"""
+        User.objects.create(user_id="1" * 28, user_name='ユーザ1', mail_address='aiu1@mail.com')
+        Group.objects.create(group_name='名前1')
+        self.group = Group.objects.get(group_name='名前1')
+        self.question = Question.objects.create(group_id=self.group.group_id, user_id="1" * 28,
+                                                question_type='select', question='問題1', correct='1', degree=1)
+        self._answer()
+
+    def _answer(self):
+        return self.client.post('/api/users/{}/answers'.format("1" * 28), json.dumps(dict(
+            question_id=self.question.question_id, group_id=str(self.group.group_id), answer='1',
+            challenge_count=1)), content_type='application/json')
+
+    def _assert_not_modified(self, path, data=None):
+        """2回目のGETはバージョンの取得のみで304を返し、ETagを返す"""
+        response = self.client.get(path, data)
+        self.assertEqual(200, response.status_code)
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(path, data, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(etag, response['ETag'])
+        self.assertEqual(b'', response.content)
+        return etag
+
+    def test_groups(self):
+        """グループ登録でETagが変わる"""
+        etag = self._assert_not_modified('/api/groups')
+
+        self.client.post('/api/groups', json.dumps(dict(group_name='名前2')), content_type='application/json')
+        response = self.client.get('/api/groups', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response['ETag'])
+
+    def test_record(self):
+        """回答登録でETagが変わる。クエリ文字列が異なる場合はETagも異なる"""
+        path = '/api/users/{}/record'.format("1" * 28)
+        etag = self._assert_not_modified(path)
+        self.assertNotEqual(etag, self.client.get(path, dict(limit=1))['ETag'])
+
+        self._answer()
+        self.assertEqual(200, self.client.get(path, HTTP_IF_NONE_MATCH=etag).status_code)
+
+    def test_questions(self):
+        """同じ(group_id, degree)の問題登録でETagが変わる"""
+        data = dict(group_id=self.group.group_id, degree=1)
+        etag = self._assert_not_modified('/api/questions', data)
+
+        self.client.post('/api/questions', json.dumps(dict(
+            group_id=str(self.group.group_id), user_id="1" * 28, question_type='select', question='問題2',
+            correct='1', degree=2)), content_type='application/json')
+        self.assertEqual(304, self.client.get('/api/questions', data, HTTP_IF_NONE_MATCH=etag).status_code)
+
+        self.client.post('/api/questions', json.dumps(dict(
+            group_id=str(self.group.group_id), user_id="1" * 28, question_type='select', question='問題3',
+            correct='1', degree=1)), content_type='application/json')
+        self.assertEqual(200, self.client.get('/api/questions', data, HTTP_IF_NONE_MATCH=etag).status_code)
+
+    def test_questions_moved(self):
+        """問題の難易度・グループの変更で変更前の(group_id, degree)のETagも変わる"""
+        data = dict(group_id=self.group.group_id, degree=1)
+        etag = self._assert_not_modified('/api/questions', data)
+        other = dict(group_id=self.group.group_id, degree=2)
+        Question.objects.create(group_id=self.group.group_id, user_id="1" * 28, question_type='select',
+                                question='問題2', correct='1', degree=2)
+        other_etag = self._assert_not_modified('/api/questions', other)
+
+        self.question.degree = 2
+        self.question.save()
+        # 変更前の(group_id, degree)は問題が無くなる
+        self.assertEqual(404, self.client.get('/api/questions', data, HTTP_IF_NONE_MATCH=etag).status_code)
+        self.assertEqual(200, self.client.get('/api/questions', other, HTTP_IF_NONE_MATCH=other_etag).status_code)
+
+    @override_settings(RANKING_ETAG_SECONDS=0.2)
+    def test_ranking(self):
+        """回答による変化はRANKING_ETAG_SECONDS秒ごとにETagへ反映する"""
+        etag = self._assert_not_modified('/api/ranking')
+
+        self._answer()
+        time.sleep(0.2)
+        self.assertEqual(200, self.client.get('/api/ranking', HTTP_IF_NONE_MATCH=etag).status_code)
+
+    def test_ranking_answer_does_not_bump(self):
+        """回答登録ではランキングの更新回数の行を更新しない(全ての回答がロックを待ち合わないため)"""
+        before = get_version(RANKING)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(200, self._answer().status_code)
+
+        self.assertEqual(before, get_version(RANKING))
+        self.assertFalse([q['sql'] for q in queries.captured_queries if "'ranking'" in q['sql']])
+
+    def test_ranking_user_changes(self):
+        """ユーザの削除・名前の変更でETagが変わる(成績集計の値は変わらない)"""
+        user = User.objects.create(user_id="2" * 28, user_name='ユーザ2', mail_address='aiu2@mail.com')
+        etag = self._assert_not_modified('/api/ranking')
+
+        user.is_deleted = True
+        user.save()
+        response = self.client.get('/api/ranking', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response.status_code)
+
+        etag = response['ETag']
+        self.client.put('/api/users/{}'.format("1" * 28), json.dumps(dict(user_name='ユーザ0')),
+                        content_type='application/json')
+        self.assertEqual(200, self.client.get('/api/ranking', HTTP_IF_NONE_MATCH=etag).status_code)
+
+
+class TestImport(TestCase):
+    """一括登録テスト"""
+
+    def setUp(self):
+        """初期処理"""
+        User.objects.create(user_id="1" * 28, user_name='ユーザ1', mail_address='aiu1@mail.com')
+        self.group = Group.objects.create(group_name='名前1')
+
+    def _write(self, suffix, content):
+        f = tempfile.NamedTemporaryFile('w', suffix=suffix, encoding='utf-8', delete=False)
+        f.write(content)
+        f.close()
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def test_import_users_csv(self):
+        """CSVのユーザを登録し、重複・不正な行はエラーとして読み飛ばす"""
+        path = self._write('.csv', 'user_id,user_name,mail_address,authority\n'
+                                   '{},ユーザ2,aiu2@mail.com,0\n'
+                                   '{},ユーザ1,aiu3@mail.com,0\n'
+                                   '{},ユーザ4,not-a-mail,1\n'
+                                   '{},ユーザ5,aiu5@mail.com,1\n'.format("2" * 28, "3" * 28, "4" * 28, "5" * 28))
+        out = StringIO()
+        err = StringIO()
+        call_command('import_data', 'users', path, batch_size=2, stdout=out, stderr=err)
+
+        self.assertIn('imported 2 users, 2 errors', out.getvalue())
+        self.assertIn('line 3:', err.getvalue())
+        self.assertIn('line 4:', err.getvalue())
+        self.assertTrue(User.objects.get(user_id="5" * 28).authority)
+        # signalsを経由しなくてもランキング用の成績集計行が作成される
+        self.assertTrue(UserScore.objects.filter(user_id="2" * 28).exists())
+
+    def test_import_questions_jsonl(self):
+        """JSONLの問題を登録し、存在しないグループ・ユーザの行はエラーにする"""
+        rows = [dict(group_id=str(self.group.group_id), user_id="1" * 28, question='問題{}'.format(i), correct='1',
+                     choice_1='a', degree=3) for i in range(5)]
+        rows.append(dict(group_id=str(self.group.group_id), user_id="9" * 28, question='問題x', correct='1', degree=1))
+        lines = [json.dumps(row, ensure_ascii=False) for row in rows] + ['', '{invalid']
+        path = self._write('.jsonl', '\n'.join(lines) + '\n')
+        out = StringIO()
+        err = StringIO()
+        call_command('import_data', 'questions', path, batch_size=2, stdout=out, stderr=err)
+
+        self.assertIn('imported 5 questions, 2 errors', out.getvalue())
+        self.assertIn('line 6:', err.getvalue())
+        self.assertIn('line 8:', err.getvalue())
+        self.assertEqual(1700.0, Question.objects.get(question='問題0').rating)
+
+        # 出題対象の更新回数が加算され、プールに反映される
+        response = self.client.get('/api/questions', dict(group_id=self.group.group_id, degree=3, limit=10))
+        self.assertEqual(5, len(response.json()))
+
+    @override_settings(ADMIN_TOKEN='secret')
+    def test_import_endpoint(self):
+        """エンドポイントはトークンを指定した場合のみ登録する"""
+        body = 'group_name\n名前2\n名前1\n'
+        response = self.client.post('/api/import/groups', body, content_type='text/csv')
+        self.assertEqual(403, response.status_code)
+
+        response = self.client.post('/api/import/groups', body, content_type='text/csv',
+                                    HTTP_AUTHORIZATION='Token secret')
+        self.assertEqual(200, response.status_code)
+        data = response.json()
+        self.assertEqual(1, data['created'])
+        self.assertEqual(1, data['error_count'])
+        self.assertEqual(3, data['errors'][0]['line'])
+        self.assertIn('group_name', data['errors'][0]['detail'])
+        self.assertTrue(Group.objects.filter(group_name='名前2').exists())
+
+    @override_settings(ADMIN_TOKEN='secret')
+    def test_import_endpoint_file_format(self):
+        """形式はfile_formatで指定できる(?format=はDRFのレンダラーの選択に使われる)"""
+        body = '{"group_name": "名前2"}\n'
+        response = self.client.post('/api/import/groups?file_format=jsonl', body, content_type='text/plain',
+                                    HTTP_AUTHORIZATION='Token secret')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(1, response.json()['created'])
+
+        response = self.client.post('/api/import/groups?file_format=xml', body, content_type='text/plain',
+                                    HTTP_AUTHORIZATION='Token secret')
+        self.assertEqual(400, response.status_code)
+
+    def test_import_endpoint_without_token_setting(self):
+        """ADMIN_TOKENが未設定の場合は利用できない"""
+        response = self.client.post('/api/import/groups', 'group_name\n名前2\n', content_type='text/csv',
+                                    HTTP_AUTHORIZATION='Token ')
+        self.assertEqual(403, response.status_code)
+
+
+class TestExport(TestCase):
+    """回答履歴エクスポートテスト"""
+
+    def setUp(self):
+        """初期処理"""
+        User.objects.create(user_id="1" * 28, user_name='ユーザ1', mail_address='aiu1@mail.com')
+        User.objects.create(user_id="2" * 28, user_name='ユーザ2', mail_address='aiu2@mail.com')
+        group = Group.objects.create(group_name='名前1')
+        question = Question.objects.create(group_id=group.group_id, user_id="1" * 28, question_type='select',
+                                           question='問題1', correct='1', degree=2)
+        # 同じ日時の回答を含めてキーセットの順序を確認する
+        dates = [datetime.datetime(2026, 1, day, tzinfo=datetime.timezone.utc) for day in (1, 2, 2, 2, 3)]
+        for i, create_date in enumerate(dates):
+            Answer.objects.create(user_id="1" * 28 if i < 4 else "2" * 28, group_id=group.group_id,
+                                  question_id=question.question_id, answer='1', is_correct=True,
+                                  challenge_count=1, create_date=create_date)
+
+    def _export(self, **options):
+        out = StringIO()
+        call_command('export_answers', stdout=out, **options)
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_export_jsonl_resume(self):
+        """チャンクに分けて全件を順に書き出し、行のcursorから続きを再開できる"""
+        rows = self._export(chunk_size=2)
+        self.assertEqual(5, len(rows))
+        self.assertEqual('名前1', rows[0]['group_name'])
+        self.assertEqual(2, rows[0]['degree'])
+        keys = [(row['create_date'], row['answer_id']) for row in rows]
+        self.assertEqual(sorted(keys), keys)
+
+        resumed = self._export(chunk_size=2, cursor=rows[1]['cursor'])
+        self.assertEqual([row['answer_id'] for row in rows[2:]], [row['answer_id'] for row in resumed])
+
+    def test_export_filters(self):
+        """ユーザと日付の範囲で絞り込む(untilは含まない)"""
+        self.assertEqual(4, len(self._export(user_id="1" * 28)))
+        self.assertEqual(3, len(self._export(since='2026-01-02', until='2026-01-03')))
+
+    def test_export_query_per_chunk(self):
+        """チャンクごとに独立したクエリで読み込む"""
+        with CaptureQueriesContext(connection) as queries:
+            self._export(chunk_size=2)
+        # 3チャンク分、それぞれ回答テーブルとアーカイブの1回ずつ
+        self.assertEqual(6, len(queries.captured_queries))
+
+    def test_export_archived_during_export(self):
+        """エクスポートの途中でアーカイブに移された回答も読み飛ばさず、重複もしない"""
+        expected = [str(answer_id) for answer_id in Answer.objects.order_by(
+            'create_date', 'answer_id').values_list('answer_id', flat=True)]
+        chunks = export_answers(chunk_size=2)
+        rows = next(chunks)
+        archive_answers(datetime.timedelta(days=1))
+        self.assertFalse(Answer.objects.exists())
+        for chunk in chunks:
+            rows += chunk
+        self.assertEqual(expected, [str(row['answer_id']) for row in rows])
+
+    @override_settings(ADMIN_TOKEN='secret')
+    def test_export_endpoint(self):
+        """エンドポイントはトークンを指定した場合のみCSVを書き出す"""
+        self.assertEqual(403, self.client.get('/api/export/answers').status_code)
+
+        response = self.client.get('/api/export/answers', dict(file_format='csv', user_id="2" * 28),
+                                   HTTP_AUTHORIZATION='Token secret')
+        self.assertEqual(200, response.status_code)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[0].startswith('answer_id,user_id,group_id,group_name'))
+
+        response = self.client.get('/api/export/answers', dict(cursor='invalid'), HTTP_AUTHORIZATION='Token secret')
+        self.assertEqual(400, response.status_code)
+
+
+class TestArchive(TestCase):
+    """回答のアーカイブテスト"""
+
+    def setUp(self):
+        """初期処理"""
+        User.objects.create(user_id="1" * 28, user_name='ユーザ1', mail_address='aiu1@mail.com')
+        User.objects.create(user_id="2" * 28, user_name='ユーザ2', mail_address='aiu2@mail.com')
+        group1 = Group.objects.create(group_name='名前1')
+        group2 = Group.objects.create(group_name='名前2')
+        question1 = Question.objects.create(group_id=group1.group_id, user_id="1" * 28, question_type='select',
+                                            question='問題1', correct='1', degree=1)
+        question2 = Question.objects.create(group_id=group2.group_id, user_id="1" * 28, question_type='select',
+                                            question='問題2', correct='1', degree=2)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        old = now - datetime.timedelta(days=400)
+        recent = now - datetime.timedelta(days=1)
+        # (ユーザ, 問題, 正誤, チャレンジ回数, 日時, 論理削除)
+        answers = [("1" * 28, question1, True, 1, old, False),
+                   ("1" * 28, question2, False, 1, old + datetime.timedelta(minutes=1), False),
+                   ("1" * 28, question1, True, 2, old + datetime.timedelta(minutes=2), False),
+                   ("1" * 28, question2, True, 2, recent, False),
+                   ("1" * 28, question1, False, 3, recent, True),
+                   ("2" * 28, question2, True, 1, recent, False)]
+        for user_id, question, is_correct, challenge_count, create_date, is_deleted in answers:
+            Answer.objects.create(user_id=user_id, group_id=question.group_id, question_id=question.question_id,
+                                  answer='1' if is_correct else '2', is_correct=is_correct,
+                                  challenge_count=challenge_count, create_date=create_date, is_deleted=is_deleted)
+        rebuild_user_scores()
+
+    def _get(self, path, **params):
+        response = self.client.get(path, params)
+        self.assertEqual(200, response.status_code)
+        return json.loads(response.content)
+
+    def test_archive_answers(self):
+        """古い回答と論理削除された回答を移し、論理削除以外をチャレンジ回数ごとに集計する"""
+        out = StringIO()
+        call_command('archive_answers', days=365, pause=0, stdout=out)
+        self.assertEqual('archived 4 answers', out.getvalue().strip())
+        self.assertEqual(2, Answer.objects.count())
+        self.assertEqual(4, ArchivedAnswer.objects.count())
+
+        rollups = ChallengeRollup.objects.filter(user_id="1" * 28).order_by('challenge_count')
+        self.assertEqual([(1, 2, 1, '名前2', 2), (2, 1, 1, '名前1', 1)],
+                         [(rollup.challenge_count, rollup.total_count, rollup.correct_answer_count,
+                           rollup.group_name, rollup.degree) for rollup in rollups])
+
+        # 2回目は移す回答が無い
+        call_command('archive_answers', days=365, pause=0, stdout=StringIO())
+        self.assertEqual(4, ArchivedAnswer.objects.count())
+
+    def test_record_unchanged(self):
+        """アーカイブの前後で成績・ランキング・エクスポートの結果が変わらない"""
+        record_path = '/api/users/{}/record'.format("1" * 28)
+        record = self._get(record_path)
+        first = self._get(record_path, limit=1)
+        pages = [first, self._get(record_path, limit=1, cursor=first['next_cursor'])]
+        ranking = self._get('/api/ranking')
+        exported = StringIO()
+        call_command('export_answers', stdout=exported)
+
+        archive_answers(datetime.timedelta(days=365), batch_size=1)
+        self.assertEqual(2, Answer.objects.count())
+
+        self.assertEqual(record, self._get(record_path))
+        self.assertEqual(pages, [self._get(record_path, limit=1),
+                                 self._get(record_path, limit=1, cursor=first['next_cursor'])])
+        self.assertEqual(ranking, self._get('/api/ranking'))
+        rebuild_user_scores()
+        self.assertEqual(ranking, self._get('/api/ranking'))
+        out = StringIO()
+        call_command('export_answers', stdout=out)
+        self.assertEqual(exported.getvalue(), out.getvalue())
+
+
+class TestWindowRanking(TestCase):
+    """期間を指定したランキングテスト"""
+
+    def setUp(self):
+        """初期処理(ユーザ1は今日2問中1問、ユーザ2は今月の初めに3問中3問、ユーザ3は昨年に1問正解)"""
+        group = Group.objects.create(group_name='名前1')
+        for i in range(1, 4):
+            User.objects.create(user_id=str(i) * 28, user_name='ユーザ{}'.format(i),
+                                mail_address='aiu{}@mail.com'.format(i))
+        question = Question.objects.create(group_id=group.group_id, user_id="1" * 28, question_type='select',
+                                           question='問題1', correct='1', degree=1)
+        now = timezone.now()
+        month = window_start('month', now)
+        answers = [("1" * 28, True, now), ("1" * 28, False, now),
+                   ("2" * 28, True, month), ("2" * 28, True, month), ("2" * 28, True, month),
+                   ("3" * 28, True, month - datetime.timedelta(days=365))]
+        for user_id, is_correct, create_date in answers:
+            Answer.objects.create(user_id=user_id, group_id=group.group_id, question_id=question.question_id,
+                                  answer='1' if is_correct else '2', is_correct=is_correct, challenge_count=1,
+                                  create_date=create_date)
+
+    def _ranking(self, **params):
+        response = self.client.get('/api/ranking', params)
+        self.assertEqual(200, response.status_code)
+        return [(row['user_name'], row['total_count'], row['correct_answer_count'], row['correct_answer_rate'])
+                for row in json.loads(response.content)]
+
+    def test_get_ranking_window(self):
+        """期間内の回答のみで順位を付ける"""
+        today = [('ユーザ1', 2, 1, '50.0')]
+        if window_start('month') == window_start('day'):
+            # 月の初日はユーザ2の回答も今日に含まれる
+            today.insert(0, ('ユーザ2', 3, 3, '100.0'))
+        self.assertEqual(today, self._ranking(window='day'))
+        self.assertEqual([('ユーザ2', 3, 3, '100.0'), ('ユーザ1', 2, 1, '50.0')],
+                         self._ranking(window='month', sorted='count'))
+        self.assertEqual(3, len(self._ranking()))
+        self.assertEqual(400, self.client.get('/api/ranking', dict(window='year')).status_code)
+
+    def test_get_ranking_window_not_found(self):
+        """期間内に回答が無い場合は404"""
+        Answer.objects.all().delete()
+        ScoreBucket.objects.filter(user_id="1" * 28).delete()
+        self.assertEqual(404, self.client.get('/api/ranking', dict(window='day')).status_code)
+
+    def test_rollup(self):
+        """前日までのバケットを1日単位にまとめ、期間外のバケットを削除しても結果が変わらない"""
+        expected = self._ranking(window='month')
+        rolled, deleted = rollup_score_buckets()
+        self.assertEqual(1, deleted)
+        self.assertFalse(ScoreBucket.objects.filter(span=ScoreBucket.HOUR, start__lt=window_start('day')).exists())
+        self.assertEqual(expected, self._ranking(window='month'))
+
+        # 作り直しても同じバケットになる
+        buckets = set(ScoreBucket.objects.values_list('user_id', 'span', 'start', 'answer_count', 'correct_count'))
+        rebuild_score_buckets()
+        self.assertEqual(buckets, set(ScoreBucket.objects.values_list(
+            'user_id', 'span', 'start', 'answer_count', 'correct_count')))
+
+    def test_rebuild_many_buckets(self):
+        """作り直すバケットがSQLiteの1文の上限(500行)を超えても作り直せる"""
+        group = Group.objects.get(group_name='名前1')
+        question = Question.objects.get()
+        User.objects.bulk_create([User(user_id='m{:027d}'.format(i), user_name='多数{}'.format(i),
+                                       mail_address='many{}@mail.com'.format(i)) for i in range(501)])
+        Answer.objects.bulk_create([Answer(user_id='m{:027d}'.format(i), group_id=group.group_id,
+                                           question_id=question.question_id, answer='1', is_correct=True)
+                                    for i in range(501)])
+
+        self.assertEqual(503, rebuild_score_buckets())
+        self.assertEqual(503, ScoreBucket.objects.count())
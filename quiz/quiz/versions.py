@@ -0,0 +1,76 @@
+import time
+import zlib
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .buckets import WINDOWS, window_start
+from .models import DataVersion
+
+GROUPS = 'groups'
+# ランキングのユーザ名・削除フラグの更新と成績集計の再作成の回数(回答登録では加算しない。quiz.versions.ranking_etag)
+RANKING = 'ranking'
+# プロセスごとのキャッシュ(quiz.caches)を他プロセスで破棄させるためのキー
+ANSWER_KEYS = 'answer_keys'
+KNOWN_USERS = 'known:users'
+KNOWN_GROUPS = 'known:groups'
+
+
+def record_key(user_id):
+    return 'record:{}'.format(user_id)
+
+
+def questions_key(group_id, degree):
+    return 'questions:{}:{}'.format(group_id, int(degree))
+
+
+def get_version(key):
+    return DataVersion.objects.filter(key=key).values_list('version', flat=True).first() or 0
+
+
+def get_versions(*keys):
+    """複数のキーのバージョンを1クエリで取得し、keysの順に返す"""
+    versions = dict(DataVersion.objects.filter(key__in=keys).values_list('key', 'version'))
+    return [versions.get(key, 0) for key in keys]
+
+
+def bump(key):
+    """keyの更新回数を加算する。書き込みと同じトランザクション内で呼ぶこと"""
+    if DataVersion.objects.filter(key=key).update(version=F('version') + 1):
+        return
+
+    try:
+        with transaction.atomic():
+            DataVersion.objects.create(key=key, version=1)
+    except IntegrityError:
+        # 同時に別リクエストが行を作成した場合は加算し直す
+        DataVersion.objects.filter(key=key).update(version=F('version') + 1)
+
+
+def make_etag(request, version):
+    """バージョンとクエリ文字列(limit、cursorなどで内容が変わるため)からETagを作る"""
+    return '{}-{:x}'.format(version, zlib.crc32(request.META.get('QUERY_STRING', '').encode()))
+
+
+def version_etag(key_func):
+    """key_func(request, *args, **kwargs)のキーのバージョンからETagを作る関数を返す(conditionのetag_func用)"""
+    def etag_func(request, *args, **kwargs):
+        return make_etag(request, get_version(key_func(request, *args, **kwargs)))
+    return etag_func
+
+
+def ranking_etag(request, *args, **kwargs):
+    """ランキングの更新回数(ユーザの登録・更新・削除で加算する)とRANKING_ETAG_SECONDS秒ごとの時間帯からETagを作る
+
+    回答はすべてランキングを変えるが、回答登録のたびに1行の更新回数を加算すると全ての回答のトランザクションが
+    その行のロックを待ち合う。そのため回答による変化は時間帯で反映し、最大でRANKING_ETAG_SECONDS秒遅れる
+    (ランキングはレプリカから最大30秒遅れて読むため、それより短くする)。
+    """
+    period = int(time.time() / getattr(settings, 'RANKING_ETAG_SECONDS', 5))
+    version = '{}.{}'.format(get_version(RANKING), period)
+    window = request.GET.get('window')
+    if window in WINDOWS:
+        # 期間を指定した場合は、日付が変わって期間の開始日時が変わったときにも内容が変わる
+        version = '{}.{}'.format(version, window_start(window).timestamp())
+    return make_etag(request, version)
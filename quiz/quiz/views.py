@@ -2,49 +2,139 @@ from collections import OrderedDict
 
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.exceptions import NotFound, APIException
-from .models import Group, User, Answer, Question
+from rest_framework.exceptions import NotFound, APIException, ValidationError
+from django.db import IntegrityError, router, transaction
+from django.db.models import ExpressionWrapper, FloatField, Max, Sum
+from .models import Group, User, Answer, Question, ScoreBucket, UserScore
+from .aggregates import answered_questions, record_answers
+from .archive import challenge_rollups
+from .buckets import window_start
+from .caches import answer_keys, known_groups, known_users, pick, question_pool
+from .metrics import registry
+from .exporter import EXPORT_REPLICA_MAX_LAG, export_answers, format_chunks
+from .importer import FORMATS, IMPORTERS, read_rows
+from .pagination import encode_cursor, paginate
+from .permissions import IsAdminToken
+from .ratings import initial_rating, questions_near, user_rating
+from .responses import JSONDataResponse
+from .versions import GROUPS, RANKING, bump, get_version, get_versions, make_etag, questions_key, ranking_etag, \
+    record_key, version_etag
+from .streaming import is_stream, stream_json
 from .serializers import GetUserValidateSerializer, RegisterUserAnswerValidateSerializer, \
     GetQuestionValidateSerializer, RegisterGroupValidateSerializer, RegisterUserValidateSerializer, \
-    RegisterQuestionValidateSerializer, UpdateUserValidateSerializer, RankingValidateSerializer
-from django.http import HttpResponse
+    RegisterQuestionValidateSerializer, UpdateUserValidateSerializer, RankingValidateSerializer, \
+    UserRankValidateSerializer, RegisterUserAnswersValidateSerializer, PageValidateSerializer, \
+    ExportAnswersValidateSerializer
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.http import condition
+import codecs
 import json
-import pandas
-import random
 
 TO_PERCENTAGE = 100
 NUMBER_OF_DIGITS = 3
+GROUP_FIELDS = ('group_id', 'group_name')
+USER_FIELDS = ('user_id', 'user_name', 'mail_address', 'authority', 'challenge_count')
+RANKING_FIELDS = ('user_name', 'total_count', 'correct_answer_count', 'correct_answer_rate')
+
+
+def format_rate(rate):
+    """正答率を百分率の文字列に変換する"""
+    return '%.1f' % (round(rate, NUMBER_OF_DIGITS) * TO_PERCENTAGE)
+
+
+def get_page_param(request):
+    """limit/cursorの指定があればページング条件を返す(無い場合は従来どおり全件を返すためNone)"""
+    param = {key: request.GET.get(key) for key in ('limit', 'cursor') if request.GET.get(key)}
+    if not param:
+        return None
+
+    data = PageValidateSerializer(data=param)
+    data.is_valid(raise_exception=True)
+    return data.validated_data
+
+
+def paginated_response(queryset, key, page):
+    """keyをキーにしたキーセットページングでレスポンスを作成する"""
+    rows, next_cursor = paginate(queryset, key, page['limit'], page.get('cursor'))
+    if not rows and 'cursor' not in page:
+        raise NotFound(detail="The target record is not found.")
+
+    res = OrderedDict()
+    res['results'] = rows
+    res['next_cursor'] = next_cursor
+    return Response(res)
+
+
+def ranked_scores(sort):
+    """ランキング順(指標の降順、同値はユーザ名の昇順)の成績集計。UserScoreのインデックス順に取得する"""
+    return UserScore.objects.filter(is_deleted=False).order_by('-' + sort, 'user_name').values(*RANKING_FIELDS)
+
+
+def windowed_scores(sort, since):
+    """since以降のバケット(ScoreBucket)をユーザごとに合算した成績集計をランキング順に返す"""
+    return ScoreBucket.objects.filter(start__gte=since, user__is_deleted=False).values('user_id').annotate(
+        user_name=Max('user__user_name'), total_count=Sum('answer_count'), correct_answer_count=Sum('correct_count'),
+        correct_answer_rate=ExpressionWrapper(Sum('correct_count') * 1.0 / Sum('answer_count'),
+                                              output_field=FloatField())).order_by(
+        '-' + sort, 'user_name').values(*RANKING_FIELDS)
+
 
 class GroupView(APIView):
     """/group"""
 
+    @method_decorator(condition(etag_func=version_etag(lambda request: GROUPS)))
     def get(self, request):
         """グループ取得"""
-        res = Group.objects.filter(is_deleted=False).values('group_id', 'group_name')
-        if not res.exists():
+        res = Group.objects.filter(is_deleted=False).values(*GROUP_FIELDS)
+        page = get_page_param(request)
+        if page is not None:
+            return paginated_response(res, 'group_name', page)
+
+        if is_stream(request):
+            if not res.exists():
+                raise NotFound(detail="The target record is not found.")
+            return stream_json(res)
+
+        # 取得結果の有無の確認とレスポンスの作成を1クエリで行う
+        if not res:
             raise NotFound(detail="The target record is not found.")
-
-        return Response(res)
+        return JSONDataResponse(res)
 
     def post(self, request):
         """グループ登録"""
         param = json.loads(request.body)
         data = RegisterGroupValidateSerializer(data=param)
         data.is_valid(raise_exception=True)
-        Group.objects.create(**data.validated_data)
+        with transaction.atomic():
+            Group.objects.create(**data.validated_data)
+            bump(GROUPS)
         return HttpResponse(status=204)
 
 
 class UserView(APIView):
     """/users"""
+    # GETはこの秒数までの遅延を許容してレプリカから読む(quiz.routers.ReplicaRouter)
+    replica_max_lag = 10
 
     def get(self, request):
         """ユーザ取得"""
+        # 正答率・チャレンジ回数は回答登録時に更新済みのため、回答テーブルは参照しない
         res = User.objects.filter(is_deleted=False).values(
-            'user_id', 'user_name', 'mail_address', 'authority', 'correct_answer_rate')
+            'user_id', 'user_name', 'mail_address', 'authority', 'correct_answer_rate', 'challenge_count')
+        page = get_page_param(request)
+        if page is not None:
+            return paginated_response(res, 'user_id', page)
+
         if not res.exists():
             raise NotFound(detail="The target record is not found.")
 
+        if is_stream(request):
+            return stream_json(res)
         return Response(res)
 
     def post(self, request):
@@ -68,17 +158,11 @@ class SelectUserView(APIView):
         data.is_valid(raise_exception=True)
 
         try:
-            val = User.objects.get(**data.validated_data, is_deleted=False)
+            res = User.objects.values(*USER_FIELDS).get(**data.validated_data, is_deleted=False)
         except User.DoesNotExist:
             raise NotFound(detail="The target record is not found.")
 
-        res = dict()
-        res['user_id'] = val.user_id
-        res['user_name'] = val.user_name
-        res['mail_address'] = val.mail_address
-        res['authority'] = val.authority
-        res['challenge_count'] = val.challenge_count
-        return Response(res)
+        return JSONDataResponse(res)
 
     def put(self, request, user_id):
         """ユーザ情報更新"""
@@ -91,7 +175,12 @@ class SelectUserView(APIView):
         data.is_valid(raise_exception=True)
 
         try:
-            User.objects.filter(user_id=user_id).update(**data.validated_data)
+            with transaction.atomic():
+                User.objects.filter(user_id=user_id).update(**data.validated_data)
+                if 'user_name' in data.validated_data:
+                    UserScore.objects.filter(user_id=user_id).update(user_name=data.validated_data['user_name'],
+                                                                     update_date=timezone.now())
+                    bump(RANKING)
         except Exception as e:
             raise APIException(e)
 
@@ -99,7 +188,9 @@ class SelectUserView(APIView):
 
 class SelectUserRecordView(APIView):
     """/users/{id}/record"""
+    replica_max_lag = 5
 
+    @method_decorator(condition(etag_func=version_etag(lambda request, user_id: record_key(user_id))))
     def get(self, request, user_id):
         """指定したユーザの成績を取得"""
         param = dict(user_id=user_id)
@@ -110,47 +201,106 @@ class SelectUserRecordView(APIView):
         answers = Answer.objects.filter(
             **data.validated_data, is_deleted=False).select_related('group', 'question').order_by('challenge_count').values(
             'group__group_name', 'is_correct', 'challenge_count', 'question__degree')
-        if not answers.exists():
-            raise NotFound(detail="The target record is not found.")
 
-        res = self._make_response(answers)
+        page = get_page_param(request)
+        if page is not None:
+            res = self._make_page(data.validated_data['user_id'], answers, page)
+        else:
+            res = self._make_response(data.validated_data['user_id'], answers)
+        if res is None:
+            raise NotFound(detail="The target record is not found.")
         return Response(res)
 
-    def _make_response(self, answers):
-        df = pandas.DataFrame(answers)
+    def _make_response(self, user_id, answers):
+        total_count, correct_answer_count, challenges = self._aggregate(answers, challenge_rollups(user_id))
+        if not total_count:
+            return None
+
+        response = OrderedDict()
+        response['total_count'] = total_count
+        response['correct_answer_count'] = correct_answer_count
+        response['correct_answer_rate'] = format_rate(correct_answer_count / total_count)
+        response['detail'] = self._make_detail(challenges, 1)
+
+        return response
+
+    def _make_page(self, user_id, answers, page):
+        """detailをチャレンジ回数のキーセットでページングする。合計値は成績集計から取得する"""
+        try:
+            score = UserScore.objects.get(user_id=user_id, total_count__gt=0)
+        except UserScore.DoesNotExist:
+            return None
+
+        if not isinstance(page.get('cursor', 0), int):
+            raise ValidationError(detail="cursor is invalid.")
+        start = page.get('cursor', 0) + 1
+        stop = start + page['limit']
+        # 次のページの有無を判定するため、アーカイブの集計は1回分多く取得する
+        rollups = challenge_rollups(user_id, start, stop + 1)
+        _, _, challenges = self._aggregate(answers.filter(challenge_count__gte=start, challenge_count__lt=stop),
+                                           rollups)
+        detail = self._make_detail(challenges, start, stop)
+
         response = OrderedDict()
-        response['total_count'] = df['is_correct'].count()
-        response['correct_answer_count'] = df['is_correct'].sum()
-        response['correct_answer_rate'] = round(df['is_correct'].mean(), NUMBER_OF_DIGITS) * TO_PERCENTAGE
-        response['correct_answer_rate'] = '%.1f' % (round(df['is_correct'].mean(), NUMBER_OF_DIGITS) * TO_PERCENTAGE)
+        response['total_count'] = score.total_count
+        response['correct_answer_count'] = score.correct_answer_count
+        response['correct_answer_rate'] = format_rate(score.correct_answer_rate)
+        response['detail'] = detail
+        response['next_cursor'] = None
+        if len(detail) == page['limit'] and (stop in rollups or answers.filter(challenge_count=stop).exists()):
+            response['next_cursor'] = encode_cursor(stop - 1)
 
-        correct_answer_rates = df.groupby('challenge_count').mean().to_dict().get('is_correct')
-        correct_answer_counts = df.groupby('challenge_count').sum().to_dict().get('is_correct')
-        total_counts = df.groupby('challenge_count').count().to_dict().get('is_correct')
+        return response
 
-        count = 1
+    def _aggregate(self, answers, rollups):
+        # チャレンジ回数順に1回だけ走査し、チャレンジ回数ごとの問題数、正解数を集計する
+        total_count = correct_answer_count = 0
+        challenges = OrderedDict()
+        for answer in answers.iterator():
+            total_count += 1
+            correct_answer_count += 1 if answer['is_correct'] else 0
+
+            challenge = challenges.get(answer['challenge_count'])
+            if challenge is None:
+                challenge = challenges[answer['challenge_count']] = dict(total_count=0, correct_answer_count=0)
+            challenge['total_count'] += 1
+            challenge['correct_answer_count'] += 1 if answer['is_correct'] else 0
+            # 問題種別と難易度はチャレンジ内の最後の回答の値を使う
+            challenge['group_name'] = answer['group__group_name']
+            challenge['degree'] = answer['question__degree']
+
+        # アーカイブ済みの回答の集計を加える。アーカイブは回答テーブルより古いため、問題種別と難易度は回答テーブルを優先する
+        for count, rollup in rollups.items():
+            total_count += rollup['total_count']
+            correct_answer_count += rollup['correct_answer_count']
+            challenge = challenges.get(count)
+            if challenge is None:
+                challenges[count] = dict(total_count=rollup['total_count'],
+                                         correct_answer_count=rollup['correct_answer_count'],
+                                         group_name=rollup['group_name'], degree=rollup['degree'])
+                continue
+            challenge['total_count'] += rollup['total_count']
+            challenge['correct_answer_count'] += rollup['correct_answer_count']
+
+        return total_count, correct_answer_count, challenges
+
+    def _make_detail(self, challenges, start, stop=None):
+        """チャレンジ回数start以降の連続した回のdetailを作成する"""
+        count = start
         detail_list = list()
-        while True:
-            # チャレンジ回数ごとの問題数、正解数、平均正解率を計算する
-            correct_answer_rate = correct_answer_rates.get(count, None)
-            correct_answer_count = correct_answer_counts.get(count, None)
-            total_count = total_counts.get(count, None)
-
-            if correct_answer_rate is None:
-                break
+        while count in challenges and (stop is None or count < stop):
+            challenge = challenges[count]
             detail = dict()
             detail['challenge_count'] = count
-            detail['total_count'] = total_count
-            detail['correct_answer_count'] = int(correct_answer_count)
-            detail['correct_answer_rate'] = '%.1f' % (round(correct_answer_rate, NUMBER_OF_DIGITS) * TO_PERCENTAGE)
-            detail['group_name'] = list(df[df['challenge_count'] == count].get('group__group_name').to_dict().values()).pop()
-            detail['degree'] = list(df[df['challenge_count'] == count].get('question__degree').to_dict().values()).pop()
+            detail['total_count'] = challenge['total_count']
+            detail['correct_answer_count'] = challenge['correct_answer_count']
+            detail['correct_answer_rate'] = format_rate(challenge['correct_answer_count'] / challenge['total_count'])
+            detail['group_name'] = challenge['group_name']
+            detail['degree'] = challenge['degree']
             detail_list.append(detail)
             count += 1
 
-        response['detail'] = detail_list
-
-        return response
+        return detail_list
 
 
 class SelectUserAnswerView(APIView):
@@ -166,20 +316,84 @@ class SelectUserAnswerView(APIView):
                       answer=data.get('answer'),
                       challenge_count=data.get('challenge_count')))
         data.is_valid(raise_exception=True)
+        data = data.validated_data
 
+        res = dict()
+        res['result'] = data['answer_key'].correct == data['answer']
         try:
-            question_id = data.validated_data.get('question').question_id
-            query = Question.objects.get(question_id=question_id)
+            # 回答と成績集計(signals経由)を同一トランザクションで登録する
+            with transaction.atomic():
+                Answer.objects.create(user_id=data['user'], question_id=data['question'], group_id=data['group'],
+                                      answer=data['answer'], challenge_count=data['challenge_count'],
+                                      is_correct=res['result'])
+                bump(record_key(data['user']))
+        except IntegrityError:
+            # キャッシュ済みのユーザ・グループ・問題が削除されていた場合
+            known_users.invalidate(data['user'])
+            known_groups.invalidate(data['group'])
+            answer_keys.invalidate(data['question'])
+            raise ValidationError(detail="user_id, group_id or question_id is not found.")
         except Exception as e:
             raise APIException(e)
 
-        res = dict()
-        res['result'] = True if query.correct == data.validated_data.get('answer') else False
+        return Response(res)
+
+
+class SelectUserAnswersBatchView(APIView):
+    """/users/{id}/answers/batch"""
+
+    def post(self, request, user_id):
+        """指定したユーザの1チャレンジ分の回答をまとめて登録し、問題ごとの結果を返却する"""
+        param = json.loads(request.body)
+        data = RegisterUserAnswersValidateSerializer(
+            data=dict(user_id=user_id,
+                      challenge_count=param.get('challenge_count'),
+                      answers=param.get('answers')))
+        data.is_valid(raise_exception=True)
+        items = data.validated_data['answers']
+
+        # 外部キーの存在チェックと正解の取得はキャッシュに無いものだけそれぞれ1クエリで行う
+        if not known_users.exists(user_id):
+            raise ValidationError(detail="user_id is not found. user_id={}".format(user_id))
+
+        missing_group_ids = known_groups.missing({item['group_id'] for item in items})
+        if missing_group_ids:
+            raise ValidationError(detail="group_id is not found. group_id={}".format(
+                ','.join(str(group_id) for group_id in missing_group_ids)))
+
+        question_ids = {item['question_id'] for item in items}
+        keys = {question_id: key for question_id, key in answer_keys.get_many(question_ids).items()
+                if not key.is_deleted}
+        if question_ids - set(keys):
+            raise ValidationError(detail="question_id is not found. question_id={}".format(
+                ','.join(str(question_id) for question_id in sorted(question_ids - set(keys)))))
+        # 他のグループの問題への回答をバケット・正解済みの問題・レーティングに反映しない
+        mismatched = {item['question_id'] for item in items if keys[item['question_id']].group_id != item['group_id']}
+        if mismatched:
+            raise ValidationError(detail="question_id is not in group_id. question_id={}".format(
+                ','.join(str(question_id) for question_id in sorted(mismatched))))
+
+        answers = [Answer(user_id=user_id,
+                          group_id=item['group_id'],
+                          question_id=item['question_id'],
+                          answer=item['answer'],
+                          is_correct=keys[item['question_id']].correct == item['answer'],
+                          challenge_count=data.validated_data['challenge_count']) for item in items]
         try:
-            Answer.objects.create(**data.validated_data, is_correct=res['result'])
+            # bulk_createではsignalsが呼ばれないため成績集計を明示的に更新する
+            with transaction.atomic():
+                Answer.objects.bulk_create(answers)
+                record_answers(answers)
+                bump(record_key(user_id))
         except Exception as e:
             raise APIException(e)
 
+        res = list()
+        for answer in answers:
+            result = dict()
+            result['question_id'] = answer.question_id
+            result['result'] = answer.is_correct
+            res.append(result)
         return Response(res)
 
 
@@ -192,21 +406,60 @@ class QuestionView(APIView):
         degree = request.GET.get('degree')
         limit = request.GET.get('limit', 5)
 
-        data = GetQuestionValidateSerializer(data=dict(group_id=group_id, limit=limit, degree=degree))
+        param = dict(group_id=group_id, limit=limit, degree=degree)
+        param.update((key, request.GET[key]) for key in ('user_id', 'unseen', 'adaptive') if key in request.GET)
+        data = GetQuestionValidateSerializer(data=param)
         data.is_valid(raise_exception=True)
         group_id = data.validated_data['group_id']
         degree = data.validated_data['degree']
-        query = Question.objects.filter(group_id=group_id, degree=degree, is_deleted=0).values(
-            'question_id', 'group_id', 'user_id', 'question_type', 'question',
-            'shape_path', 'correct', 'choice_1', 'choice_2', 'choice_3', 'choice_4'
-        )
-        if query.count() < data.validated_data['limit']:
-            data.validated_data['limit'] = query.count()
-        if not query.exists():
-            raise NotFound(detail="The target record is not found.")
+        limit = data.validated_data['limit']
+        unseen = data.validated_data.get('unseen')
+        user_id = data.validated_data.get('user_id')
+
+        if data.validated_data.get('adaptive'):
+            return self._get_adaptive(group_id, user_id, limit, unseen)
+
+        # 更新回数の取得だけをDBに問い合わせ、ETagの比較とプールの鮮度確認の両方に使う
+        if unseen:
+            # 正解済みの問題は回答登録で変わるため、ユーザの成績の更新回数もETagに含める
+            if not known_users.exists(user_id):
+                raise ValidationError(detail="user_id is not found. user_id={}".format(user_id))
+            version, record_version = get_versions(questions_key(group_id, degree), record_key(user_id))
+            etag = quote_etag(make_etag(request, '{}.{}'.format(version, record_version)))
+        else:
+            version = get_version(questions_key(group_id, degree))
+            etag = quote_etag(make_etag(request, version))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            if unseen:
+                questions = question_pool.sample(group_id, degree, limit, version,
+                                                 answered=answered_questions(user_id), exclude=unseen == 'only')
+            else:
+                questions = question_pool.sample(group_id, degree, limit, version)
+            if not questions:
+                if not Question.objects.filter(group=group_id).exists():
+                    raise ValidationError(detail={'group_id': ["group_id is not found. group_id={}".format(group_id)]})
+                raise NotFound(detail="The target record is not found.")
+            response = JSONDataResponse(questions)
+        response['ETag'] = etag
+        return response
 
-        response = random.sample(list(query), data.validated_data['limit'])
-        return Response(response)
+    def _get_adaptive(self, group_id, user_id, limit, unseen):
+        """ユーザのレーティングに近い問題を難易度(degree)によらず選ぶ
+
+        レーティングは回答ごとに変わるため、プールとETagは使わない。
+        """
+        if not known_users.exists(user_id):
+            raise ValidationError(detail="user_id is not found. user_id={}".format(user_id))
+
+        rows = questions_near(group_id, user_rating(user_id), limit)
+        answered = answered_questions(user_id) if unseen else None
+        questions = pick(rows, limit, answered, exclude=unseen == 'only')
+        if not questions:
+            if not Question.objects.filter(group=group_id).exists():
+                raise ValidationError(detail={'group_id': ["group_id is not found. group_id={}".format(group_id)]})
+            raise NotFound(detail="The target record is not found.")
+        return JSONDataResponse(questions)
 
     def post(self, request):
         """問題登録"""
@@ -216,8 +469,11 @@ class QuestionView(APIView):
         data = RegisterQuestionValidateSerializer(data=param)
         data.is_valid(raise_exception=True)
 
+        # 問題と更新回数(signalsで加算する)を同一トランザクションで登録する(各ワーカーのプールは次のGETで読み直される)
         try:
-            Question.objects.create(**data.validated_data)
+            with transaction.atomic():
+                Question.objects.create(rating=initial_rating(data.validated_data['degree']),
+                                        **data.validated_data)
         except Exception as e:
             raise APIException(detail=e)
 
@@ -226,50 +482,159 @@ class QuestionView(APIView):
 
 class RankingView(APIView):
     """/ranking"""
+    replica_max_lag = 30
 
+    @method_decorator(condition(etag_func=ranking_etag))
     def get(self, request):
         """ランキング取得"""
         param = {}
-        if request.GET.get('sorted'):
-            param['sorted'] = request.GET.get('sorted')
+        for key in ('sorted', 'limit', 'offset', 'window'):
+            if request.GET.get(key):
+                param[key] = request.GET.get(key)
 
         data = RankingValidateSerializer(data=param)
         data.is_valid(raise_exception=True)
         data = data.validated_data
 
-        users = User.objects.filter(is_deleted=False).values('user_id', 'user_name')
-        if not users.exists():
+        if not User.objects.filter(is_deleted=False).exists():
             raise NotFound(detail="user is not found.")
 
-        answers = Answer.objects.filter(is_deleted=False).values(
-            'user_id', 'is_correct')
-        if not answers.exists():
+        if data.get('window'):
+            scores = windowed_scores(data['sorted'], window_start(data['window']))
+            if not scores.exists():
+                raise NotFound(detail="answer is not found.")
+        elif UserScore.objects.filter(total_count__gt=0).exists():
+            scores = ranked_scores(data['sorted'])
+        else:
             raise NotFound(detail="answer is not found.")
 
-        return self._make_response(users, answers, data['sorted'])
+        if data.get('limit'):
+            scores = scores[data['offset']:data['offset'] + data['limit']]
+        elif data['offset']:
+            scores = scores[data['offset']:]
 
-    def _make_response(self, users, answers, sort):
-
-        df = pandas.DataFrame(answers)
-        total_count = df.groupby('user_id')['is_correct'].count().to_dict()
-        correct_count = df.groupby('user_id')['is_correct'].sum().to_dict()
-        correct_rate = df.groupby('user_id')['is_correct'].mean().to_dict()
+        if is_stream(request):
+            return stream_json(scores, self._format_row)
+        return self._make_response(scores)
 
+    def _make_response(self, scores):
         res = list()
-        for user in users:
-            param = dict()
-            param["user_name"] = user.get('user_name')
-            param["total_count"] = total_count.get(user.get('user_id'), 0)
-            param["correct_answer_count"] = int(correct_count.get(user.get('user_id'), 0))
-            param["correct_answer_rate"] = correct_rate.get(user.get('user_id'), 0)
-            res.append(param)
-
-        res_sorted = sorted(res, key=lambda x: x['user_name'])
-        res_sorted = sorted(res_sorted, reverse=True, key=lambda x: x[sort])
-        for i, r in enumerate(res_sorted):
-            res_sorted[i]['correct_answer_rate'] = '%.1f' % (round(r['correct_answer_rate'], NUMBER_OF_DIGITS) * TO_PERCENTAGE)
-
-        return Response(res_sorted)
+        for score in scores:
+            res.append(self._format_row(score))
+
+        return Response(res)
+
+    def _format_row(self, score):
+        score['correct_answer_rate'] = format_rate(score['correct_answer_rate'])
+        return score
+
+
+class SelectUserRankView(APIView):
+    """/users/{id}/rank"""
+
+    def get(self, request, user_id):
+        """指定したユーザの順位と前後のユーザを取得"""
+        param = dict(user_id=user_id)
+        for key in ('sorted', 'neighbors'):
+            if request.GET.get(key):
+                param[key] = request.GET.get(key)
+
+        data = UserRankValidateSerializer(data=param)
+        data.is_valid(raise_exception=True)
+        data = data.validated_data
+        sort = data['sorted']
+
+        ranking = ranked_scores(sort)
+        try:
+            score = ranking.get(user_id=data['user_id'])
+        except UserScore.DoesNotExist:
+            raise NotFound(detail="The target record is not found.")
+
+        # 上位・下位のユーザは、指標が異なる範囲と同値でユーザ名が前後する範囲に分け、
+        # それぞれ(is_deleted, 指標, ユーザ名)のインデックスの1つの範囲として数える・読む
+        higher = ranking.filter(**{sort + '__gt': score[sort]})
+        tied_above = ranking.filter(**{sort: score[sort], 'user_name__lt': score['user_name']})
+        tied_below = ranking.filter(**{sort: score[sort], 'user_name__gt': score['user_name']})
+        lower = ranking.filter(**{sort + '__lt': score[sort]})
+        rank = higher.count() + tied_above.count() + 1
+        above = self._neighbors(tied_above.reverse(), higher.reverse(), data['neighbors'])
+        below = self._neighbors(tied_below, lower, data['neighbors'])
+
+        res = OrderedDict()
+        res['rank'] = rank
+        res.update(self._make_row(score))
+        res['above'] = [self._make_row(row, rank - i - 1) for i, row in reversed(list(enumerate(above)))]
+        res['below'] = [self._make_row(row, rank + i + 1) for i, row in enumerate(below)]
+        return Response(res)
+
+    def _neighbors(self, near, far, count):
+        """近い範囲から順にcount件まで読む"""
+        rows = list(near[:count])
+        if len(rows) < count:
+            rows += list(far[:count - len(rows)])
+        return rows
+
+    def _make_row(self, score, rank=None):
+        row = OrderedDict()
+        if rank is not None:
+            row['rank'] = rank
+        row['user_name'] = score['user_name']
+        row['total_count'] = score['total_count']
+        row['correct_answer_count'] = score['correct_answer_count']
+        row['correct_answer_rate'] = format_rate(score['correct_answer_rate'])
+        return row
+
+
+class ImportView(APIView):
+    """/import/{kind}"""
+    permission_classes = (IsAdminToken,)
+
+    def post(self, request, kind):
+        """CSV/JSONLの本文を1行ずつ読み込んで一括登録し、登録件数と行ごとのエラーを返却する"""
+        if kind not in IMPORTERS:
+            raise NotFound(detail="The target record is not found.")
+        # ?format=はDRFがレンダラーの選択に使うため、file_formatで指定する
+        fmt = request.GET.get('file_format') or ('csv' if request.content_type.startswith('text/csv') else 'jsonl')
+        if fmt not in FORMATS:
+            raise ValidationError(detail="file_format must be one of {}.".format(', '.join(FORMATS)))
+        # request.dataは本文を全て読み込むため、ストリームから直接読む
+        if request.stream is None:
+            raise ValidationError(detail="body is empty.")
+
+        importer = IMPORTERS[kind]().run(read_rows(codecs.iterdecode(request.stream, 'utf-8-sig'), fmt))
+        res = OrderedDict()
+        res['created'] = importer.created
+        res['error_count'] = importer.error_count
+        res['errors'] = importer.errors
+        return Response(res)
+
+
+class ExportAnswersView(APIView):
+    """/export/answers"""
+    permission_classes = (IsAdminToken,)
+    replica_max_lag = EXPORT_REPLICA_MAX_LAG
+
+    def get(self, request):
+        """回答履歴をCSV/JSONLで逐次書き出す(各行のcursorを指定するとその行の次から再開する)"""
+        data = ExportAnswersValidateSerializer(data=request.GET.dict())
+        data.is_valid(raise_exception=True)
+        data = data.validated_data
+
+        # レスポンスの書き出しはビューの処理後に行われるため、読み取り先のDBをここで確定させる
+        chunks = export_answers(user_id=data.get('user_id'), since=data.get('since'), until=data.get('until'),
+                                after=data.get('cursor'), using=router.db_for_read(Answer))
+        # 再開時は列名を出力しない(前回の出力に続けて追記できるようにする)
+        content = format_chunks(chunks, data['file_format'], header='cursor' not in data)
+        content_type = 'text/csv; charset=utf-8' if data['file_format'] == 'csv' else 'application/x-ndjson'
+        return StreamingHttpResponse((chunk.encode() for chunk in content), content_type=content_type)
+
+
+class MetricsView(View):
+    """/metrics"""
+
+    def get(self, request):
+        """全ワーカーの計測値をPrometheusのテキスト形式で取得"""
+        return HttpResponse(registry.expose(), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 
 class SpecifiedQuestionView(APIView):
@@ -1,139 +1,139 @@
 delete from quiz_question;
 insert into quiz_question
-(question_type,question,shape_path,correct,choice_1,choice_2,choice_3,choice_4,is_deleted,create_date,update_date,group_id,user_id,degree)
+(question_type,question,shape_path,correct,choice_1,choice_2,choice_3,choice_4,is_deleted,create_date,update_date,group_id,user_id,degree,rating)
 values
-("select","コンピュータのプログラムでゴチャゴチャとしていて流れの把握が難しいものをある食べ物に例えて何という？","null","4","ハンバーグ・プログラム","カレーライス・プログラム","ビーフステーキ・プログラム","スパゲッティ・プログラム","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","一般的なパソコンのキーボードで「１」のキーを押して「！」を表示させたい時に、「１」キーと同時に押すキーはどれ？","null","4","Escキー","Insキー","Enterキー","Shiftキー","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","ホームページアドレスによく使う「~」と書かれる記号を何という？","null","4","ダガー","ディトー","アットマーク","チルダー","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","パソコンで、ＯＳに新たな機能を追加したり、機能を拡張するための橋渡しとなるソフトを何という？","null","2","ニッパ","ドライバ","ペンチ","ハンマ","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のパソコンのキーのうち字を１文字削除したい時に一般的に用いるのはどれ？","null","3","Enterキー","Escキー","Delキー","Shiftキー","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","インターネットを利用した電話のことを「ＩＰ電話」といいますが、この「ＩＰ」とは何の略？","null","","インターネット・プロレス","インターネット・プロフェッサー","インターネット・フォン","インターネット・プロトコル","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","内閣広報室がメールマガジンを初めて発行したのは誰が首相を務めていた時？","null","","森喜朗","小渕恵三","小泉純一郎","安倍晋三","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","パソコンの用語でデータを「符号化」することを何という？","null","","ハイコード","エンコード","バーコード","デコード","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","2010年に、世界で初めてTwitterのフォロワーの数が500万人を超えた女性歌手は？","null","","スーザン・ボイル","レディー・ガガ","ブリトニー・スピアーズ","マドンナ","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","「10の100乗」を意味する言葉にちなんで命名されたというインターネットで用いられる検索サイトは？","null","","Yahoo!","Bing","Google","Baidu","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","「腹黒い」という意味があるウイルスやワームなどインターネットを介してパソコンに危害を加えるソフトウェアの総称は？","null","","フルウェア","アルウェア","フェルウェア","マルウェア","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","トレンドマイクロ社が開発したセキュリティソフト「ウイルスバスター2010」のイメージキャラクターを描いた漫画家は？","null","","加瀬あつし","西本英雄","久米田康治","野中英次","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","インターネットのブログでコメント欄に書き込みが殺到し機能を果たさなくなる状態を何という？","null","","炎上","爆発","沈没","消化","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","「社長ブログ」の先駆けとして有名な「渋谷ではたらく社長のアメブロ」を連日更新している実業家は？","null","","藤田晋","孫正義","三木谷浩史","堀江貴文","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","2010年２月に設立されたインターネット業界初の本格的な業界団体「ｅビジネス推進連合会」の初代会長に就任した実業家は？","null","","三木谷浩史","孫正義","堀江貴文","藤田晋","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","ＪＩＳ配列のキーボードで横に並んでいるアルファベットの組み合わせは？","null","","ＧＨＩ","ＪＫＬ","ＭＮＯ","ＤＥＦ","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","インターネットサービスを利用できるＴＶ「グーグルＴＶ」をグーグル社などと共同開発する家電メーカーは？","null","","ソニー","シャープ","パナソニック","東芝","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1983年にアップル社が発売したオフィス向けのパソコンは？","null","1","Lisa","Yuki","Aiko","Anna","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","100円ショップ「ザ・ダイソー」で知られる大創産業の本社がある都道府県は？","null","3","神奈川県","京都府","広島県","福岡県","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1866年、プロイセンとオーストリアの間に勃発した「普墺戦争」の別名は？","null","3","七年間戦争","七ヶ月戦争","七週間戦争","七日間戦争","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1928年に、香川県の安戸池で野網和三郎が日本で初めて養殖に成功した魚は？","null","4","タイ","ヒラメ","アジ","ハマチ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1950年から1967年まで東京新聞などに連載されたある戦国武将を主人公とする作家・山岡荘八の代表作は？","null","3","『豊臣秀吉』","『今川義元』","『徳川家康』","『織田信長』","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1975年に出版された当時の沖縄を撮影している東松照明の写真集は？","null","1","『太陽の鉛筆』","『月の鉛筆』","『星雲の鉛筆』","『地球の鉛筆』","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1986年の「新語・流行語大賞」の新語部門金賞を「究極」で受賞した、漫画『美味しんぼ』の原作者は？","null","3","武論尊","花咲アキラ","雁屋哲","小池一夫","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","1987年に、小説『優駿』で「JRA賞馬事文化賞」の最初の受賞者となった作家は？","null","3","椎名誠","寺山修司","宮本輝","山野浩一","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","日本の宝くじでミニロトの抽選が行われるのは毎週何曜日？","null","1","火曜日","木曜日","水曜日","金曜日","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","日本料理で「吉野」といえば何を使った料理？","null","4","たらのき","わさび","くり","くず","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","日本料理において「香の物」といえば一般的に何のこと？","null","1","漬物","薬味","旬の物","大根おろし","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","日本茶で、「八女茶」といえば何県の名産品？","null","4","山梨県","鳥取県","静岡県","福岡県","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","日本茶で、「八女茶」といえば福岡県の名産品ですが「南部茶」といえば何県の名産品？","null","4","福岡県","愛媛県","鳥取県","山梨県","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","昔話『一寸法師』で主人公が都へと旅立つ際に刀の代わりに腰に差したものは針ですが都へ出る川を下る時に櫂の代わりに使ったのは何？","null","2","楊枝","箸","鞭","針","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","昔話『金太郎』で金太郎が相撲を取って勝利した動物は何？","null","1","熊","豚","犬","虎","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","村上春樹のベストセラー小説『海辺のカフカ』の主人公・カフカの苗字は？","null","3","坂田","山本","田村","長井","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","東京の麻布十番にある浪花屋総本店は何の店？","null","1","たい焼き","焼きそば","たこ焼き","もんじゃ焼き","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","東京都台東区浅草にある神谷バーの名物として有名な「電気ブラン」のベースになっているお酒は？","null","3","ウイスキー","ウォッカ","ブランデー","ジン","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","栄養価が高く注目されているインドネシアのテンペは日本の何に似た食品？","null","2","豆腐","納豆","梅干","味噌","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","横浜にあった日本初のビール醸造所「スプリングバレー・ブルワリー」を起源とする大手ビールメーカーは？","null","2","アサヒビール","キリンビール","サッポロビール","サントリー","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","機械式腕時計の内部にある針を動かす仕組みのことを何という？","null","2","ストラクチャー","ムーブメント","シーナリー","インボリュート","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","次のうち30日までしかないのは？","null","3","3月","1月","9月","5月","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうちPDF形式のファイルを読むのに必要なソフトは？","null","2","Adobe Flash","Adobe Reader","Real Player","Windows Media Player","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち、「ピアノ」の数の数え方として正しいのは？","null","3","一両、二両","一盤、二盤","一台、二台","一基、二基","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち、「仏像」の数の数え方として正しいのは？","null","2","一影、二影","一体、二体","一柱、二柱","一本、二本","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち、「寄付」の数の数え方として正しいのは？","null","3","一株、二株","一払、二払","一口、二口","一本、二本","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち、「新聞」の数の数え方として正しいのは？","null","4","一通、二通","一冊、二冊","一枚、二枚","一部、二部","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち、「靴」の数の数え方として正しいのは？","null","1","一足、二足","一組、二組","一着、二着","一本、二本","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち、サクランボの品種として実際にあるものはどれ？","null","1","南陽","東陽","西陽","北陽","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","次のうち、人気のパズル「数独」と同じパズルを表すのは？","null","1","ナンプレ","イラロジ","ナンクロ","ヌリカベ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち、値段が安い形容に使われる言葉は？","null","1","二束三文","五束六文","三束四文","四束五文","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち、日本で「国民の祝日」がもっとも多い月は？","null","3","３月","９月","５月","11月","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち、熊本県で実際に醸造されている焼酎は？","null","3","大石勘三郎","大石大二郎","大石長一郎","大石喜十郎","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","次のうち、英語で「渋滞」を意味する言葉はどれ？","null","2","ピーナッツ","ジャム","バター","オレンジ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち「友情」という意味がある言葉はどれ？","null","3","スカラシップ","リーダーシップ","フレンドシップ","スキンシップ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち「友情」という意味がある言葉はフレンドシップですが「統率力という意味がある言葉はどれ？」","null","1","リーダーシップ","フレンドシップ","ボトルシップ","スカラシップ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち「相手をまどわす言動」という意味がある楽器は？","null","4","尺八","琵琶","琴","三味線","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","次のうちお歯黒をつけた歯を意味する言葉はどれ？","null","4","牛蒡歯","青菜歯","玉葱歯","茄子歯","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","次のうちタラバガニはどれ？","null","4","（脚は赤く体は黒い。前の1組の脚は右側が大きい。）","（体は黒く、上側の1組が一番、下側の1組が2番目に太い）","（体は赤く、十脚が大体同じ太さで横から出ている）","（体は黒く、見える脚は8脚、上側の1組は前向き）","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のうち梨の「三水」に含まれないのは？","null","2","豊水","風水","新水","幸水","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次のパソコンのキーのうち字を１文字削除したい時に一般的に用いるのはどれ？","null","3","Shiftキー","Escキー","Delキー","Enterキー","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次の将棋の駒のうち左右に動けるものは？","null","4","歩兵","銀将","角行","金将","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","次の言葉のうち給与を意味するものはどれ？","null","4","年金","年配","年報","年俸","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","江戸地代に初めて作られた東京・浅草の名物として有名なお米を原料とした和菓子は？","null","4","雹おこし","霰おこし","雪おこし","雷おこし","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","江戸時代に上方で「おくどさん」と呼ばれたものと言えば何？","null","1","竈","屋根","便所","箪笥","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","沖縄で「ゴーヤー」と呼ばれる植物はニガウリですが「ナーベラー」と呼ばれる植物は？","null","4","ヨモギ","ニガウリ","カボチャ","ヘチマ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","沖縄で「ゴーヤー」と呼ばれる植物は？","null","2","ヨモギ","ニガウリ","カボチャ","ヘチマ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","洋菓子でノルマンディー風といえば、使われる果物は何？","null","2","チェリー","リンゴ","オレンジ","ブドウ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","海外ミステリーに登場する名探偵で、アガサ・クリスティが生み出したエルキュール・ポワロの出身国は？","null","2","スイス","ベルギー","スウェーデン","アイルランド","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","深く眠り込む様子のことを「何のように眠る」という？","null","1","泥","沼","砂","石","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","渡辺淳一の直木賞受賞作『光と影』で、主人公のモデルとなっている元首相は？","null","2","鈴木貫太郎","寺内正殻","小磯国昭","近衛文麿","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","滋賀県の郷土料理・鮒寿司の材料になるフナといえば？","null","1","ニゴロブナ","イチゴロブナ","ユウゴロブナ","トウゴロブナ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","無線通信などで聞き間違いを防ぐための和文通話表に基づいて「ち」は「何のち」と伝達する？","null","4","地上","地下","チロル","チドリ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","焼き鳥のネタで「はつ」といえば鳥の心臓のことですが「せせり」といえば鳥のどこの部位のこと？","null","1","首","肝臓","心臓","尻尾","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","焼肉で「ハツ」といえば心臓ですが「マメ」といえばどの部分のこと？","null","2","横隔膜","賢蔵","舌","心臓","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","牛の挽き肉に卵とタマネギなどを混ぜ合わせた肉料理は「何ステーキ」？","null","2","チルチル","タルタル","トルトル","サルサル","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","牛肉や豚肉の「ばら肉」のことを肉と脂肪が交互に層になっていることから何という？","null","1","三枚肉","四枚肉","五枚肉","二枚肉","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","現在「片栗粉」として市販されているものの大半は、実際には何から採ったデンプン？","null","2","ヤマイモ","ジャガイモ","サトイモ","タロイモ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","甘栗の皮をあらかじめ取り除いたことで人気が出たクラシエフーズの商品は？","null","2","甘栗とっちゃいました","甘栗むいちゃいました","甘栗ぬがせちゃいました","甘栗はがしちゃいました","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","神社のお堂の前に綱と一緒に吊されている大きな鈴のことを何という？","null","3","へび口","いぬ口","わに口","たつ口","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","童話『クマのプーさん』に登場するキャラクターで、ティガーといえばトラですがイーヨーといえばどんな動物？","null","4","ブタ","ウマ","トラ","ロバ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","童話『マッチ売りの少女』で少女が1本目のマッチをすった時見たのはどんな幻？","null","4","（手袋）","（食べもの）","（クリスマスツリー）","（暖炉）","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","第119回芥川賞を受賞した花村萬月の小説は？","null","2","『カドミウムの夜』","『ゲルマニウムの夜』","『アルミニウムの夜』","『アメリシウムの夜』","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","第2回横溝正史ミステリ大賞を小説『殺人狂時代ユリエ』で受賞した作詞家は？","null","2","松本隆","阿久悠","橋本淳","川内康範","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","答えが複数ある問題をグループで一つずつ順番に答えていくゲームをあるJRの路線名から何という？","null","2","中央線ゲーム","山手線ゲーム","埼京線ゲーム","山陰本線ゲーム","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","縁起物の一種である招き猫で右手を上げているものは普通金運を招くといわれますが左手を上げているものは普通何を招くといわれる？","null","1","人","出世","良縁","金運","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","缶詰の記号で牛肉は？","null","3","WP","HF","BF","PK","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","自分の亭主のことを他人に対し卑下して紹介する時に使う言葉といえば？","null","4","宿二","宿四","宿三","宿六","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","自分の年齢をへりくだっていう言葉を、ある動物の名前を使って何という？","null","1","馬齢","牛齢","豚齢","鶏齢","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","花火大会のかけ声としておなじみなのは「玉屋」と何？","null","2","板屋","鍵屋","紙屋","酒屋","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","英語で「キングクラブ」というカニは？","null","1","タラバガニ","タカアシガニ","ズワイガニ","ワタリガニ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","英語で「ブラック・ペッパー」といえば黒胡椒ですが「レッド・ペッパー」といえば何のこと？","null","3","黒胡椒","山椒","唐辛子","山葵","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","英語の俗語で「かわいい女の子」という意味がある言葉は？","null","3","Cherry","Orrange","Peach","Grape","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","赤川次郎の『三毛猫ホームズ』シリーズ第1作の題名は何？","null","3","『三毛猫ホームズの運動会』","『三毛猫ホームズの駆落ち』","『三毛猫ホームズの推理』","『三毛猫ホームズの怪談』","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","遊芸に溺れ仕事をないがしろにする人を皮肉った言葉といえば「売り家と○○で書く三代目」？","null","4","篆書","達筆","欧流","唐様","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","選挙の際に使われる圧倒的な勝利を意味する言葉といえば「何的勝利」？","null","1","地滑り","大洪水","崖崩れ","山崩れ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","郷土料理のわんこそばは岩手県の名産ですがソーキそばは何県の名産？","null","3","岩手県","山形県","沖縄県","長野県","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","野球帽などのように前面だけにつばのある帽子のことを英語で何という？","null","1","キャップ","ドーム","カバー","クラウン","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","野菜・肉・魚と何でも切れるため初心者に最適な、日本人向きにアレンジされた万能洋包丁は○○包丁？","null","4","四徳","二徳","一徳","三徳","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","金魚などを飼う前に、水道水を1日以上汲み置きするとよいとされるのは、水道水に含まれる何を抜こうとするため？","null","4","マグネシウム","カリウム","アンモニア","塩素","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","開いたウナギ・アナゴや牛肉をゴボウに巻きつけ煮たり焼いたりした料理を、京都の地名をとって「何巻き」という？","null","3","宮津巻き","宇治巻き","八幡巻き","舞鶴巻き","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","陶磁器のウェッジウッドはイギリスのブランドですがマイセンはどこの国のブランド？","null","3","イタリア","フランス","ドイツ","イギリス","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","電子メールで、同じ内容のメールを複数の相手に配信したい時に用いる機能は？","null","2","DD","CC","BB","EE","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","食い合わせの代表的な例で「ウナギと」といえば？","null","1","梅干","ワラビ","そば","アサリ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","食品が腐りやすい様子を例えて「足が早い」といいますがすぐに暴力を振るうことや異性と関係を結んでしまう様子をたとえて「何が早い」という？","null","2","耳が早い","手が早い","口が早い","足が早い","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","食材としても使われる魚のエイを韓国語では何という？","null","4","シオリ","アカリ","ヒカリ","カオリ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","養老孟司『バカの壁』と筒井康隆『アホの壁』は共に何新書から出版された？","null","4","中公新書","幻冬舎新書","平凡社新書","新潮新書","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3")
-,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3")
+("select","コンピュータのプログラムでゴチャゴチャとしていて流れの把握が難しいものをある食べ物に例えて何という？","null","4","ハンバーグ・プログラム","カレーライス・プログラム","ビーフステーキ・プログラム","スパゲッティ・プログラム","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","一般的なパソコンのキーボードで「１」のキーを押して「！」を表示させたい時に、「１」キーと同時に押すキーはどれ？","null","4","Escキー","Insキー","Enterキー","Shiftキー","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","ホームページアドレスによく使う「~」と書かれる記号を何という？","null","4","ダガー","ディトー","アットマーク","チルダー","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","パソコンで、ＯＳに新たな機能を追加したり、機能を拡張するための橋渡しとなるソフトを何という？","null","2","ニッパ","ドライバ","ペンチ","ハンマ","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のパソコンのキーのうち字を１文字削除したい時に一般的に用いるのはどれ？","null","3","Enterキー","Escキー","Delキー","Shiftキー","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","インターネットを利用した電話のことを「ＩＰ電話」といいますが、この「ＩＰ」とは何の略？","null","","インターネット・プロレス","インターネット・プロフェッサー","インターネット・フォン","インターネット・プロトコル","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","内閣広報室がメールマガジンを初めて発行したのは誰が首相を務めていた時？","null","","森喜朗","小渕恵三","小泉純一郎","安倍晋三","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","パソコンの用語でデータを「符号化」することを何という？","null","","ハイコード","エンコード","バーコード","デコード","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","2010年に、世界で初めてTwitterのフォロワーの数が500万人を超えた女性歌手は？","null","","スーザン・ボイル","レディー・ガガ","ブリトニー・スピアーズ","マドンナ","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","「10の100乗」を意味する言葉にちなんで命名されたというインターネットで用いられる検索サイトは？","null","","Yahoo!","Bing","Google","Baidu","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","「腹黒い」という意味があるウイルスやワームなどインターネットを介してパソコンに危害を加えるソフトウェアの総称は？","null","","フルウェア","アルウェア","フェルウェア","マルウェア","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","トレンドマイクロ社が開発したセキュリティソフト「ウイルスバスター2010」のイメージキャラクターを描いた漫画家は？","null","","加瀬あつし","西本英雄","久米田康治","野中英次","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","インターネットのブログでコメント欄に書き込みが殺到し機能を果たさなくなる状態を何という？","null","","炎上","爆発","沈没","消化","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","「社長ブログ」の先駆けとして有名な「渋谷ではたらく社長のアメブロ」を連日更新している実業家は？","null","","藤田晋","孫正義","三木谷浩史","堀江貴文","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","2010年２月に設立されたインターネット業界初の本格的な業界団体「ｅビジネス推進連合会」の初代会長に就任した実業家は？","null","","三木谷浩史","孫正義","堀江貴文","藤田晋","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","ＪＩＳ配列のキーボードで横に並んでいるアルファベットの組み合わせは？","null","","ＧＨＩ","ＪＫＬ","ＭＮＯ","ＤＥＦ","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","インターネットサービスを利用できるＴＶ「グーグルＴＶ」をグーグル社などと共同開発する家電メーカーは？","null","","ソニー","シャープ","パナソニック","東芝","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1983年にアップル社が発売したオフィス向けのパソコンは？","null","1","Lisa","Yuki","Aiko","Anna","0","2019/12/18","2019/12/18","251facae17624a2cb5f1dda8149a7917","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","100円ショップ「ザ・ダイソー」で知られる大創産業の本社がある都道府県は？","null","3","神奈川県","京都府","広島県","福岡県","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1866年、プロイセンとオーストリアの間に勃発した「普墺戦争」の別名は？","null","3","七年間戦争","七ヶ月戦争","七週間戦争","七日間戦争","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1928年に、香川県の安戸池で野網和三郎が日本で初めて養殖に成功した魚は？","null","4","タイ","ヒラメ","アジ","ハマチ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1950年から1967年まで東京新聞などに連載されたある戦国武将を主人公とする作家・山岡荘八の代表作は？","null","3","『豊臣秀吉』","『今川義元』","『徳川家康』","『織田信長』","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1975年に出版された当時の沖縄を撮影している東松照明の写真集は？","null","1","『太陽の鉛筆』","『月の鉛筆』","『星雲の鉛筆』","『地球の鉛筆』","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1986年の「新語・流行語大賞」の新語部門金賞を「究極」で受賞した、漫画『美味しんぼ』の原作者は？","null","3","武論尊","花咲アキラ","雁屋哲","小池一夫","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","1987年に、小説『優駿』で「JRA賞馬事文化賞」の最初の受賞者となった作家は？","null","3","椎名誠","寺山修司","宮本輝","山野浩一","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","日本の宝くじでミニロトの抽選が行われるのは毎週何曜日？","null","1","火曜日","木曜日","水曜日","金曜日","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","日本料理で「吉野」といえば何を使った料理？","null","4","たらのき","わさび","くり","くず","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","日本料理において「香の物」といえば一般的に何のこと？","null","1","漬物","薬味","旬の物","大根おろし","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","日本茶で、「八女茶」といえば何県の名産品？","null","4","山梨県","鳥取県","静岡県","福岡県","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","日本茶で、「八女茶」といえば福岡県の名産品ですが「南部茶」といえば何県の名産品？","null","4","福岡県","愛媛県","鳥取県","山梨県","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","昔話『一寸法師』で主人公が都へと旅立つ際に刀の代わりに腰に差したものは針ですが都へ出る川を下る時に櫂の代わりに使ったのは何？","null","2","楊枝","箸","鞭","針","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","昔話『金太郎』で金太郎が相撲を取って勝利した動物は何？","null","1","熊","豚","犬","虎","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","村上春樹のベストセラー小説『海辺のカフカ』の主人公・カフカの苗字は？","null","3","坂田","山本","田村","長井","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","東京の麻布十番にある浪花屋総本店は何の店？","null","1","たい焼き","焼きそば","たこ焼き","もんじゃ焼き","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","東京都台東区浅草にある神谷バーの名物として有名な「電気ブラン」のベースになっているお酒は？","null","3","ウイスキー","ウォッカ","ブランデー","ジン","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","栄養価が高く注目されているインドネシアのテンペは日本の何に似た食品？","null","2","豆腐","納豆","梅干","味噌","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","横浜にあった日本初のビール醸造所「スプリングバレー・ブルワリー」を起源とする大手ビールメーカーは？","null","2","アサヒビール","キリンビール","サッポロビール","サントリー","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","機械式腕時計の内部にある針を動かす仕組みのことを何という？","null","2","ストラクチャー","ムーブメント","シーナリー","インボリュート","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","次のうち30日までしかないのは？","null","3","3月","1月","9月","5月","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうちPDF形式のファイルを読むのに必要なソフトは？","null","2","Adobe Flash","Adobe Reader","Real Player","Windows Media Player","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち、「ピアノ」の数の数え方として正しいのは？","null","3","一両、二両","一盤、二盤","一台、二台","一基、二基","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち、「仏像」の数の数え方として正しいのは？","null","2","一影、二影","一体、二体","一柱、二柱","一本、二本","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち、「寄付」の数の数え方として正しいのは？","null","3","一株、二株","一払、二払","一口、二口","一本、二本","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち、「新聞」の数の数え方として正しいのは？","null","4","一通、二通","一冊、二冊","一枚、二枚","一部、二部","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち、「靴」の数の数え方として正しいのは？","null","1","一足、二足","一組、二組","一着、二着","一本、二本","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち、サクランボの品種として実際にあるものはどれ？","null","1","南陽","東陽","西陽","北陽","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","次のうち、人気のパズル「数独」と同じパズルを表すのは？","null","1","ナンプレ","イラロジ","ナンクロ","ヌリカベ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち、値段が安い形容に使われる言葉は？","null","1","二束三文","五束六文","三束四文","四束五文","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち、日本で「国民の祝日」がもっとも多い月は？","null","3","３月","９月","５月","11月","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち、熊本県で実際に醸造されている焼酎は？","null","3","大石勘三郎","大石大二郎","大石長一郎","大石喜十郎","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","次のうち、英語で「渋滞」を意味する言葉はどれ？","null","2","ピーナッツ","ジャム","バター","オレンジ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち「友情」という意味がある言葉はどれ？","null","3","スカラシップ","リーダーシップ","フレンドシップ","スキンシップ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち「友情」という意味がある言葉はフレンドシップですが「統率力という意味がある言葉はどれ？」","null","1","リーダーシップ","フレンドシップ","ボトルシップ","スカラシップ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち「相手をまどわす言動」という意味がある楽器は？","null","4","尺八","琵琶","琴","三味線","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","次のうちお歯黒をつけた歯を意味する言葉はどれ？","null","4","牛蒡歯","青菜歯","玉葱歯","茄子歯","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","次のうちタラバガニはどれ？","null","4","（脚は赤く体は黒い。前の1組の脚は右側が大きい。）","（体は黒く、上側の1組が一番、下側の1組が2番目に太い）","（体は赤く、十脚が大体同じ太さで横から出ている）","（体は黒く、見える脚は8脚、上側の1組は前向き）","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のうち梨の「三水」に含まれないのは？","null","2","豊水","風水","新水","幸水","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次のパソコンのキーのうち字を１文字削除したい時に一般的に用いるのはどれ？","null","3","Shiftキー","Escキー","Delキー","Enterキー","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次の将棋の駒のうち左右に動けるものは？","null","4","歩兵","銀将","角行","金将","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","次の言葉のうち給与を意味するものはどれ？","null","4","年金","年配","年報","年俸","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","江戸地代に初めて作られた東京・浅草の名物として有名なお米を原料とした和菓子は？","null","4","雹おこし","霰おこし","雪おこし","雷おこし","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","江戸時代に上方で「おくどさん」と呼ばれたものと言えば何？","null","1","竈","屋根","便所","箪笥","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","沖縄で「ゴーヤー」と呼ばれる植物はニガウリですが「ナーベラー」と呼ばれる植物は？","null","4","ヨモギ","ニガウリ","カボチャ","ヘチマ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","沖縄で「ゴーヤー」と呼ばれる植物は？","null","2","ヨモギ","ニガウリ","カボチャ","ヘチマ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","洋菓子でノルマンディー風といえば、使われる果物は何？","null","2","チェリー","リンゴ","オレンジ","ブドウ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","海外ミステリーに登場する名探偵で、アガサ・クリスティが生み出したエルキュール・ポワロの出身国は？","null","2","スイス","ベルギー","スウェーデン","アイルランド","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","深く眠り込む様子のことを「何のように眠る」という？","null","1","泥","沼","砂","石","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","渡辺淳一の直木賞受賞作『光と影』で、主人公のモデルとなっている元首相は？","null","2","鈴木貫太郎","寺内正殻","小磯国昭","近衛文麿","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","滋賀県の郷土料理・鮒寿司の材料になるフナといえば？","null","1","ニゴロブナ","イチゴロブナ","ユウゴロブナ","トウゴロブナ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","無線通信などで聞き間違いを防ぐための和文通話表に基づいて「ち」は「何のち」と伝達する？","null","4","地上","地下","チロル","チドリ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","焼き鳥のネタで「はつ」といえば鳥の心臓のことですが「せせり」といえば鳥のどこの部位のこと？","null","1","首","肝臓","心臓","尻尾","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","焼肉で「ハツ」といえば心臓ですが「マメ」といえばどの部分のこと？","null","2","横隔膜","賢蔵","舌","心臓","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","牛の挽き肉に卵とタマネギなどを混ぜ合わせた肉料理は「何ステーキ」？","null","2","チルチル","タルタル","トルトル","サルサル","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","牛肉や豚肉の「ばら肉」のことを肉と脂肪が交互に層になっていることから何という？","null","1","三枚肉","四枚肉","五枚肉","二枚肉","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","現在「片栗粉」として市販されているものの大半は、実際には何から採ったデンプン？","null","2","ヤマイモ","ジャガイモ","サトイモ","タロイモ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","甘栗の皮をあらかじめ取り除いたことで人気が出たクラシエフーズの商品は？","null","2","甘栗とっちゃいました","甘栗むいちゃいました","甘栗ぬがせちゃいました","甘栗はがしちゃいました","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","神社のお堂の前に綱と一緒に吊されている大きな鈴のことを何という？","null","3","へび口","いぬ口","わに口","たつ口","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","童話『クマのプーさん』に登場するキャラクターで、ティガーといえばトラですがイーヨーといえばどんな動物？","null","4","ブタ","ウマ","トラ","ロバ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","童話『マッチ売りの少女』で少女が1本目のマッチをすった時見たのはどんな幻？","null","4","（手袋）","（食べもの）","（クリスマスツリー）","（暖炉）","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","第119回芥川賞を受賞した花村萬月の小説は？","null","2","『カドミウムの夜』","『ゲルマニウムの夜』","『アルミニウムの夜』","『アメリシウムの夜』","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","第2回横溝正史ミステリ大賞を小説『殺人狂時代ユリエ』で受賞した作詞家は？","null","2","松本隆","阿久悠","橋本淳","川内康範","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","答えが複数ある問題をグループで一つずつ順番に答えていくゲームをあるJRの路線名から何という？","null","2","中央線ゲーム","山手線ゲーム","埼京線ゲーム","山陰本線ゲーム","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","縁起物の一種である招き猫で右手を上げているものは普通金運を招くといわれますが左手を上げているものは普通何を招くといわれる？","null","1","人","出世","良縁","金運","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","缶詰の記号で牛肉は？","null","3","WP","HF","BF","PK","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","自分の亭主のことを他人に対し卑下して紹介する時に使う言葉といえば？","null","4","宿二","宿四","宿三","宿六","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","自分の年齢をへりくだっていう言葉を、ある動物の名前を使って何という？","null","1","馬齢","牛齢","豚齢","鶏齢","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","花火大会のかけ声としておなじみなのは「玉屋」と何？","null","2","板屋","鍵屋","紙屋","酒屋","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","英語で「キングクラブ」というカニは？","null","1","タラバガニ","タカアシガニ","ズワイガニ","ワタリガニ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","英語で「ブラック・ペッパー」といえば黒胡椒ですが「レッド・ペッパー」といえば何のこと？","null","3","黒胡椒","山椒","唐辛子","山葵","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","英語の俗語で「かわいい女の子」という意味がある言葉は？","null","3","Cherry","Orrange","Peach","Grape","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","赤川次郎の『三毛猫ホームズ』シリーズ第1作の題名は何？","null","3","『三毛猫ホームズの運動会』","『三毛猫ホームズの駆落ち』","『三毛猫ホームズの推理』","『三毛猫ホームズの怪談』","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","遊芸に溺れ仕事をないがしろにする人を皮肉った言葉といえば「売り家と○○で書く三代目」？","null","4","篆書","達筆","欧流","唐様","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","選挙の際に使われる圧倒的な勝利を意味する言葉といえば「何的勝利」？","null","1","地滑り","大洪水","崖崩れ","山崩れ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","郷土料理のわんこそばは岩手県の名産ですがソーキそばは何県の名産？","null","3","岩手県","山形県","沖縄県","長野県","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","野球帽などのように前面だけにつばのある帽子のことを英語で何という？","null","1","キャップ","ドーム","カバー","クラウン","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","野菜・肉・魚と何でも切れるため初心者に最適な、日本人向きにアレンジされた万能洋包丁は○○包丁？","null","4","四徳","二徳","一徳","三徳","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","金魚などを飼う前に、水道水を1日以上汲み置きするとよいとされるのは、水道水に含まれる何を抜こうとするため？","null","4","マグネシウム","カリウム","アンモニア","塩素","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","開いたウナギ・アナゴや牛肉をゴボウに巻きつけ煮たり焼いたりした料理を、京都の地名をとって「何巻き」という？","null","3","宮津巻き","宇治巻き","八幡巻き","舞鶴巻き","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","陶磁器のウェッジウッドはイギリスのブランドですがマイセンはどこの国のブランド？","null","3","イタリア","フランス","ドイツ","イギリス","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","電子メールで、同じ内容のメールを複数の相手に配信したい時に用いる機能は？","null","2","DD","CC","BB","EE","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","食い合わせの代表的な例で「ウナギと」といえば？","null","1","梅干","ワラビ","そば","アサリ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","食品が腐りやすい様子を例えて「足が早い」といいますがすぐに暴力を振るうことや異性と関係を結んでしまう様子をたとえて「何が早い」という？","null","2","耳が早い","手が早い","口が早い","足が早い","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","食材としても使われる魚のエイを韓国語では何という？","null","4","シオリ","アカリ","ヒカリ","カオリ","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","養老孟司『バカの壁』と筒井康隆『アホの壁』は共に何新書から出版された？","null","4","中公新書","幻冬舎新書","平凡社新書","新潮新書","0","2019/12/18","2019/12/18","dd6fec2d42c44e8bb0d4741e365d8698","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","1+1=?","null","2","1","2","3","4","0","2019/12/18","2019/12/18","f4c9b9194d1a4e6e98cb93be36b36372","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","1","1300")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","2","1500")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
+,("select","「いわし」と読む感じは次のうちどれでしょうか？","null","1","鰯","鮪","鱚","鰹","0","2019/12/18","2019/12/18","aaaaabbbbbaaaaabbbbbaaaaabbbbb22","5qe5p9he1tW7fPTD362biU7TdTI3","3","1700")
 ;